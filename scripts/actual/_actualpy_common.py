@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import gzip
 import json
 import os
 import sys
 from contextlib import contextmanager
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
 JSON_SENTINEL = "__LEDGERMIND_ACTUAL_JSON__:"
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -123,6 +125,16 @@ def open_actual_client():
     raise RuntimeError("Unable to initialize Actual client")
 
 
+@contextmanager
+def actual_session(actual: Any | None = None):
+    """Yield `actual` when the caller already holds a client, otherwise open a one-shot one."""
+    if actual is not None:
+        yield actual
+        return
+    with open_actual_client() as opened:
+        yield opened
+
+
 def _rewrite_actual_connection_error(exc: Exception, base_url: str) -> RuntimeError:
     message = str(exc)
     if "data-file-index.txt" in message and "404" in message:
@@ -168,6 +180,53 @@ def emit_json(payload: Any) -> None:
     sys.stdout.write(f"{JSON_SENTINEL}{json.dumps(payload, default=json_default)}\n")
 
 
+def add_export_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--ndjson", action="store_true", help="Stream one JSON record per line instead of one payload")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the NDJSON output")
+    parser.add_argument("--output", default=None, help="Write NDJSON to this file instead of stdout")
+
+
+@contextmanager
+def open_export(output: str | None = None, compress: bool = False) -> Iterator[TextIO]:
+    """Text stream for NDJSON export: `output` file or stdout, optionally gzipped."""
+    if output is None and not compress:
+        yield sys.stdout
+        return
+    if output is None:
+        with gzip.open(sys.stdout.buffer, "wt", encoding="utf-8") as stream:
+            yield stream
+        return
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    opened = gzip.open(path, "wt", encoding="utf-8") if compress else path.open("w", encoding="utf-8")
+    with opened as stream:
+        yield stream
+
+
+def write_ndjson(stream: TextIO, records: Iterable[Any]) -> int:
+    """Write records one per line as they arrive (no sentinel); returns the count."""
+    count = 0
+    encode = json.JSONEncoder(default=json_default, separators=(",", ":")).encode
+    for record in records:
+        stream.write(encode(record))
+        stream.write("\n")
+        count += 1
+    stream.flush()
+    return count
+
+
+def iter_date_windows(start_date: date, end_date: date, days: int | None) -> Iterator[tuple[date, date]]:
+    """Inclusive `days`-long windows covering start..end, newest first (matches transaction order)."""
+    if not days or days <= 0:
+        yield start_date, end_date
+        return
+    window_end = end_date
+    while window_end >= start_date:
+        window_start = max(start_date, window_end - timedelta(days=days - 1))
+        yield window_start, window_end
+        window_end = window_start - timedelta(days=1)
+
+
 def as_int(value: Any, default: int = 0) -> int:
     if value is None:
         return default
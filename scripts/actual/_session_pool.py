@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Iterator
+
+try:
+    from ._actualpy_common import log, open_actual_client
+except ImportError:
+    from _actualpy_common import log, open_actual_client
+
+
+@dataclass
+class _PooledSession:
+    client: Any
+    stack: ExitStack
+    created_at: float = field(default_factory=time.monotonic)
+    last_synced_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+class ActualSessionPool:
+    """
+    Keeps authenticated, downloaded `Actual` clients alive across bridge calls.
+
+    - `session()` checks out one client exclusively for the duration of a request
+    - clients are synced incrementally (`Actual.sync()`) once `sync_interval_seconds` has elapsed
+    - idle clients older than `max_idle_seconds` are recycled on the next checkout
+    - a client whose request raised is discarded instead of being returned to the pool
+    - rows changed by each sync are journaled so callers can pull only what changed
+      (see `changes_since`); opening a fresh client starts a new journal generation
+    - the journal is in memory only: a process restart or an idle recycle (fresh download)
+      makes every older cursor unanswerable, so callers reload everything once
+    - `sync_on_checkout = False` leaves syncing to a background worker calling `sync_all`
+    """
+
+    def __init__(
+        self,
+        max_sessions: int | None = None,
+        sync_interval_seconds: float | None = None,
+        max_idle_seconds: float | None = None,
+        checkout_timeout_seconds: float | None = None,
+        opener: Callable[[], ContextManager[Any]] = open_actual_client,
+        journal_size: int | None = None,
+        sync_on_checkout: bool = True,
+    ) -> None:
+        self._max_sessions = max(1, max_sessions or int(os.getenv("ACTUAL_SESSION_POOL_SIZE", "1")))
+        self._sync_interval = (
+            sync_interval_seconds
+            if sync_interval_seconds is not None
+            else float(os.getenv("ACTUAL_SESSION_SYNC_INTERVAL_SECONDS", "60"))
+        )
+        self._max_idle = (
+            max_idle_seconds if max_idle_seconds is not None else float(os.getenv("ACTUAL_SESSION_MAX_IDLE_SECONDS", "900"))
+        )
+        self._checkout_timeout = (
+            checkout_timeout_seconds
+            if checkout_timeout_seconds is not None
+            else float(os.getenv("ACTUAL_SESSION_CHECKOUT_TIMEOUT_SECONDS", "120"))
+        )
+        self._opener = opener
+        self.sync_on_checkout = sync_on_checkout
+        self._last_synced_at: float | None = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._max_sessions)
+        self._idle: list[_PooledSession] = []
+        self._closed = False
+        self._journal_id = uuid.uuid4().hex
+        self._generation = 0
+        self._change_seq = 0
+        self._changes: deque[tuple[int, str, str]] = deque(
+            maxlen=max(1, journal_size or int(os.getenv("ACTUAL_SESSION_CHANGE_JOURNAL_SIZE", "100000")))
+        )
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        if self._closed:
+            raise RuntimeError("Actual session pool is closed")
+        if not self._slots.acquire(timeout=self._checkout_timeout):
+            raise RuntimeError(f"Timed out after {self._checkout_timeout:.0f}s waiting for an Actual session")
+        pooled: _PooledSession | None = None
+        try:
+            pooled = self._checkout()
+            yield pooled.client
+        except GeneratorExit:
+            # A streaming caller stopped early; the client itself is still healthy.
+            raise
+        except BaseException:
+            if pooled is not None:
+                self._discard(pooled)
+                pooled = None
+            raise
+        finally:
+            if pooled is not None:
+                self._checkin(pooled)
+            self._slots.release()
+
+    def sync_all(self) -> int:
+        """
+        Sync every idle client now; returns how many clients were synced.
+
+        Each client is synced while holding a checkout slot, so a concurrent request waits for
+        a synced client instead of opening an extra one past `max_sessions`.
+        """
+        started = time.monotonic()
+        synced = 0
+        while not self._closed:
+            if not self._slots.acquire(timeout=self._checkout_timeout):
+                break
+            try:
+                with self._lock:
+                    pooled = next((item for item in self._idle if item.last_synced_at < started), None)
+                    if pooled is not None:
+                        self._idle.remove(pooled)
+                if pooled is None:
+                    break
+                try:
+                    self._sync(pooled)
+                except Exception as exc:
+                    log(f"[actual-py] pool sync failed; dropping session err={exc}")
+                    self._discard(pooled)
+                    continue
+                synced += 1
+                with self._lock:
+                    if not self._closed:
+                        # Not `_checkin`: a background sync must not keep an unused client from recycling.
+                        self._idle.append(pooled)
+                        pooled = None
+                if pooled is not None:
+                    self._discard(pooled)
+            finally:
+                self._slots.release()
+        return synced
+
+    def changes_since(self, cursor: str | None, table: str) -> tuple[str, list[str] | None]:
+        """
+        Return `(new_cursor, row_ids)` for rows of `table` changed after `cursor`.
+
+        `row_ids` is None when the journal cannot answer (unknown cursor, new generation or
+        truncated journal) and the caller must reload everything.
+        """
+        with self._lock:
+            current = f"{self._journal_id}:{self._generation}:{self._change_seq}"
+            journal_id, generation, seq = _parse_cursor(cursor)
+            if journal_id != self._journal_id or generation != self._generation:
+                return current, None
+            if seq < self._change_seq and (not self._changes or self._changes[0][0] > seq + 1):
+                return current, None
+            ids = {row_id for change_seq, name, row_id in self._changes if change_seq > seq and name == table}
+        return current, sorted(ids)
+
+    @property
+    def data_version(self) -> str:
+        """Journal cursor; changes whenever a sync or a fresh download may have changed data."""
+        with self._lock:
+            return f"{self._journal_id}:{self._generation}:{self._change_seq}"
+
+    @property
+    def last_synced_at(self) -> float | None:
+        """Wall-clock time of the latest sync or fresh download, None before the first."""
+        return self._last_synced_at
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._discard(pooled)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _checkout(self) -> _PooledSession:
+        now = time.monotonic()
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is not None and self._max_idle > 0 and now - pooled.last_used_at > self._max_idle:
+            log("[actual-py] pool recycling idle session")
+            self._discard(pooled)
+            pooled = None
+
+        if pooled is None:
+            return self._open()
+
+        if self.sync_on_checkout and self._sync_interval >= 0 and now - pooled.last_synced_at >= self._sync_interval:
+            try:
+                self._sync(pooled)
+            except Exception as exc:
+                log(f"[actual-py] pool sync failed; reopening session err={exc}")
+                self._discard(pooled)
+                return self._open()
+        return pooled
+
+    def _open(self) -> _PooledSession:
+        stack = ExitStack()
+        try:
+            client = stack.enter_context(self._opener())
+        except BaseException:
+            stack.close()
+            raise
+        log("[actual-py] pool opened session")
+        with self._lock:
+            # A fresh download may contain changes that were never journaled.
+            self._generation += 1
+            self._changes.clear()
+            self._last_synced_at = time.time()
+        return _PooledSession(client=client, stack=stack)
+
+    def _sync(self, pooled: _PooledSession) -> None:
+        sync = getattr(pooled.client, "sync", None)
+        changesets = sync() if callable(sync) else None
+        pooled.last_synced_at = time.monotonic()
+        self._last_synced_at = time.time()
+        if not changesets:
+            return
+        with self._lock:
+            for changeset in changesets:
+                table = getattr(getattr(changeset, "table", None), "__tablename__", None)
+                row_id = getattr(changeset, "id", None)
+                if table is None or row_id is None:
+                    continue
+                self._change_seq += 1
+                self._changes.append((self._change_seq, str(table), str(row_id)))
+
+    def _checkin(self, pooled: _PooledSession) -> None:
+        pooled.last_used_at = time.monotonic()
+        with self._lock:
+            if not self._closed:
+                self._idle.append(pooled)
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled: _PooledSession) -> None:
+        try:
+            pooled.stack.close()
+        except Exception as exc:
+            log(f"[actual-py] pool session close failed err={exc}")
+
+
+def _parse_cursor(cursor: str | None) -> tuple[str, int, int]:
+    try:
+        journal_id, generation, seq = str(cursor).split(":")
+        return journal_id, int(generation), int(seq)
+    except Exception:
+        return "", -1, -1
+
+
+_default_pool: ActualSessionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> ActualSessionPool:
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool.closed:
+            _default_pool = ActualSessionPool()
+        return _default_pool
+
+
+def shutdown_default_pool() -> None:
+    global _default_pool
+    with _default_pool_lock:
+        pool, _default_pool = _default_pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_default_pool)
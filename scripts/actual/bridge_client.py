@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Client for `bridge_server.py`.
+
+Methods mirror the in-process bridge helpers (same arguments, same row dicts) and accept
+an ignored `actual=` keyword, so callers can swap one for the other.
+"""
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import socket
+from contextlib import closing
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    from ._actualpy_common import JSON_SENTINEL, REPO_ROOT, json_default
+except ImportError:
+    from _actualpy_common import JSON_SENTINEL, REPO_ROOT, json_default
+
+_SENTINEL = JSON_SENTINEL.encode("utf-8")
+
+
+class ActualBridgeError(RuntimeError):
+    pass
+
+
+def default_socket_path() -> Path:
+    raw_path = os.getenv("ACTUAL_BRIDGE_SOCKET")
+    if raw_path:
+        path = Path(raw_path)
+    else:
+        path = Path(os.getenv("ACTUAL_DATA_DIR") or ".actual-cache") / "ledgermind_bridge.sock"
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+class ActualBridgeClient:
+    """One short-lived unix-socket connection per call; streams hold theirs until exhausted or closed."""
+
+    def __init__(self, socket_path: str | Path | None = None, timeout_seconds: float | None = None) -> None:
+        self.socket_path = Path(socket_path) if socket_path is not None else default_socket_path()
+        self._timeout = timeout_seconds or float(os.getenv("ACTUAL_BRIDGE_TIMEOUT_SECONDS", "120"))
+        self._ids = itertools.count(1)
+
+    # ---- bridge helper equivalents ----
+    def fetch_transactions(
+        self,
+        start_date: date,
+        end_date: date,
+        actual: Any | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        return self.call("transactions", start=start_date.isoformat(), end=end_date.isoformat(), filters=filters or {})
+
+    def iter_transactions(
+        self,
+        start_date: date,
+        end_date: date,
+        actual: Any | None = None,
+        filters: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[dict[str, Any]]]:
+        return self.stream(
+            "iter_transactions",
+            start=start_date.isoformat(),
+            end=end_date.isoformat(),
+            filters=filters or {},
+            batch_size=batch_size,
+        )
+
+    def fetch_all_transactions(self, actual: Any | None = None) -> list[dict[str, Any]]:
+        return self.call("all_transactions")
+
+    def fetch_transactions_by_ids(self, ids: list[str], actual: Any | None = None) -> list[dict[str, Any]]:
+        return self.call("transactions_by_ids", ids=list(ids))
+
+    def fetch_budget_month(self, month: str, actual: Any | None = None) -> dict[str, Any]:
+        return self.call("budget_month", month=month)
+
+    def fetch_budget_months(self, months: list[str], actual: Any | None = None) -> dict[str, dict[str, Any]]:
+        return self.call("budget_months", months=list(months))
+
+    def fetch_dimensions(self, actual: Any | None = None) -> dict[str, list[dict[str, Any]]]:
+        return self.call("dimensions")
+
+    def changes_since(self, cursor: str | None, table: str) -> tuple[str, list[str] | None]:
+        result = self.call("changes_since", cursor=cursor, table=table)
+        return result["cursor"], result["ids"]
+
+    def sync(self) -> dict[str, Any]:
+        return self.call("sync")
+
+    def ping(self) -> dict[str, Any]:
+        return self.call("ping")
+
+    # ---- protocol ----
+    def call(self, method: str, **params: Any) -> Any:
+        with closing(self._connect()) as sock, sock.makefile("rb") as reader:
+            request_id = self._send(sock, method, params)
+            frame = self._read_frame(reader, request_id)
+        if frame.get("type") != "result":
+            raise ActualBridgeError(f"Unexpected bridge frame for {method}: {frame.get('type')!r}")
+        return frame.get("result")
+
+    def stream(self, method: str, **params: Any) -> Iterator[list[dict[str, Any]]]:
+        sock = self._connect()
+        try:
+            with sock.makefile("rb") as reader:
+                request_id = self._send(sock, method, {**params, "stream": True})
+                while True:
+                    frame = self._read_frame(reader, request_id)
+                    kind = frame.get("type")
+                    if kind == "batch":
+                        yield frame.get("rows") or []
+                    elif kind == "end":
+                        return
+                    else:
+                        raise ActualBridgeError(f"Unexpected bridge frame for {method}: {kind!r}")
+        finally:
+            # Closing early tells the worker to stop streaming and release its client.
+            sock.close()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError as exc:
+            sock.close()
+            raise ActualBridgeError(f"Actual bridge worker is not reachable at {self.socket_path}: {exc}") from exc
+        return sock
+
+    def _send(self, sock: socket.socket, method: str, params: dict[str, Any]) -> int:
+        request_id = next(self._ids)
+        payload = json.dumps({"id": request_id, "method": method, "params": params}, default=json_default)
+        sock.sendall(_SENTINEL + payload.encode("utf-8") + b"\n")
+        return request_id
+
+    def _read_frame(self, reader: Any, request_id: int) -> dict[str, Any]:
+        for line in reader:
+            if not line.startswith(_SENTINEL):
+                continue
+            frame = json.loads(line[len(_SENTINEL):])
+            if frame.get("id") not in (request_id, None):
+                continue
+            if frame.get("type") == "error":
+                raise ActualBridgeError(str(frame.get("error")))
+            return frame
+        raise ActualBridgeError("Actual bridge worker closed the connection mid-reply")
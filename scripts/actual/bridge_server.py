@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Long-running Actual bridge worker serving fetches over a unix socket.
+
+One process keeps the warm, synced budget (session pool) and every API worker talks to it
+through `bridge_client.ActualBridgeClient`.
+
+Protocol: newline-delimited frames, each `JSON_SENTINEL + json`. A request is
+`{"id", "method", "params"}`; the reply is either one `{"id", "type": "result", "result"}`
+frame, a run of `{"id", "type": "batch", "rows"}` frames closed by
+`{"id", "type": "end", "count"}`, or `{"id", "type": "error", "error"}`. A connection
+carries any number of requests, one at a time.
+
+Run from the repo root:
+    python scripts/actual/bridge_server.py --socket .actual-cache/ledgermind_bridge.sock
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:
+    from ._actualpy_common import JSON_SENTINEL, json_default, load_repo_dotenv, log
+    from ._session_pool import ActualSessionPool
+    from .bridge_client import default_socket_path
+    from .get_budget_month import fetch_budget_month, fetch_budget_months
+    from .get_dimensions import fetch_dimensions
+    from .get_transactions import fetch_all_transactions, fetch_transactions, fetch_transactions_by_ids, iter_transactions
+except ImportError:
+    from _actualpy_common import JSON_SENTINEL, json_default, load_repo_dotenv, log
+    from _session_pool import ActualSessionPool
+    from bridge_client import default_socket_path
+    from get_budget_month import fetch_budget_month, fetch_budget_months
+    from get_dimensions import fetch_dimensions
+    from get_transactions import fetch_all_transactions, fetch_transactions, fetch_transactions_by_ids, iter_transactions
+
+_SENTINEL = JSON_SENTINEL.encode("utf-8")
+
+
+class ActualBridgeServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded unix-socket server; every connection checks clients out of one shared pool."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str | Path, pool: ActualSessionPool | None = None) -> None:
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            # A stale socket from a crashed worker would make bind() fail.
+            self.socket_path.unlink()
+        self.pool = pool or ActualSessionPool()
+        super().__init__(str(self.socket_path), _BridgeHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ---- methods ----
+    def call(self, method: str, params: dict[str, Any]) -> Any:
+        handler = _RESULT_METHODS.get(method)
+        if handler is None:
+            raise ValueError(f"Unknown bridge method: {method!r}")
+        return handler(self, params)
+
+    def stream(self, method: str, params: dict[str, Any]) -> Iterator[list[dict[str, Any]]]:
+        if method != "iter_transactions":
+            raise ValueError(f"Unknown streaming bridge method: {method!r}")
+        with self.pool.session() as actual:
+            batches = iter_transactions(
+                date.fromisoformat(params["start"]),
+                date.fromisoformat(params["end"]),
+                actual=actual,
+                filters=params.get("filters") or {},
+                batch_size=int(params.get("batch_size") or 1000),
+            )
+            try:
+                yield from batches
+            finally:
+                batches.close()
+
+    def _with_client(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self.pool.session() as actual:
+            return fn(*args, actual=actual, **kwargs)
+
+    def _sync(self) -> dict[str, Any]:
+        if self.pool.sync_all() == 0:
+            with self.pool.session():
+                pass
+        return {"data_version": self.pool.data_version, "last_synced_at": self.pool.last_synced_at}
+
+    def _changes_since(self, cursor: str | None, table: str) -> dict[str, Any]:
+        new_cursor, ids = self.pool.changes_since(cursor, table)
+        return {"cursor": new_cursor, "ids": ids}
+
+
+_RESULT_METHODS: dict[str, Callable[[ActualBridgeServer, dict[str, Any]], Any]] = {
+    "ping": lambda server, params: {"pid": os.getpid(), "data_version": server.pool.data_version},
+    "transactions": lambda server, params: server._with_client(
+        fetch_transactions,
+        date.fromisoformat(params["start"]),
+        date.fromisoformat(params["end"]),
+        filters=params.get("filters") or {},
+    ),
+    "all_transactions": lambda server, params: server._with_client(fetch_all_transactions),
+    "transactions_by_ids": lambda server, params: server._with_client(fetch_transactions_by_ids, list(params["ids"])),
+    "budget_month": lambda server, params: server._with_client(fetch_budget_month, params["month"]),
+    "budget_months": lambda server, params: server._with_client(fetch_budget_months, list(params["months"])),
+    "dimensions": lambda server, params: server._with_client(fetch_dimensions),
+    "changes_since": lambda server, params: server._changes_since(params.get("cursor"), params["table"]),
+    "sync": lambda server, params: server._sync(),
+}
+
+
+class _BridgeHandler(socketserver.StreamRequestHandler):
+    server: ActualBridgeServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.startswith(_SENTINEL):
+                continue
+            try:
+                request = json.loads(line[len(_SENTINEL):])
+                request_id = request.get("id")
+                method = str(request["method"])
+                params = request.get("params") or {}
+            except Exception as exc:
+                if not self._send({"id": None, "type": "error", "error": f"Malformed bridge request: {exc}"}):
+                    return
+                continue
+            if not self._serve(request_id, method, params):
+                return
+
+    def _serve(self, request_id: Any, method: str, params: dict[str, Any]) -> bool:
+        """Answer one request; False once the client has gone away."""
+        try:
+            if params.get("stream"):
+                count = 0
+                batches = self.server.stream(method, params)
+                try:
+                    for rows in batches:
+                        count += len(rows)
+                        if not self._send({"id": request_id, "type": "batch", "rows": rows}):
+                            # Client stopped reading; closing the generator releases the pooled client.
+                            return False
+                finally:
+                    batches.close()
+                return self._send({"id": request_id, "type": "end", "count": count})
+            return self._send({"id": request_id, "type": "result", "result": self.server.call(method, params)})
+        except Exception as exc:
+            log(f"[actual-py] bridge {method} failed err={exc}")
+            return self._send({"id": request_id, "type": "error", "error": str(exc) or exc.__class__.__name__})
+
+    def _send(self, frame: dict[str, Any]) -> bool:
+        try:
+            self.wfile.write(_SENTINEL + json.dumps(frame, default=json_default).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            return True
+        except OSError:
+            return False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve Actual bridge calls over a unix socket.")
+    parser.add_argument("--socket", default=None, help="Socket path (ACTUAL_BRIDGE_SOCKET)")
+    args = parser.parse_args()
+
+    load_repo_dotenv()
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    server = ActualBridgeServer(socket_path)
+    stop = threading.Event()
+
+    def _shutdown(*_: Any) -> None:
+        if not stop.is_set():
+            stop.set()
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    log(f"[actual-py] bridge worker listening socket={socket_path} pid={os.getpid()}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except Exception as exc:
+        print(f"[actual-py] error: {exc}", file=sys.stderr)
+        raise SystemExit(1)
@@ -1,25 +1,45 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import sys
+from typing import Any, TextIO
 
 try:
-    from ._actualpy_common import emit_json, log, normalize_query_result, open_actual_client
+    from ._actualpy_common import actual_session, add_export_args, emit_json, log, normalize_query_result, open_export, write_ndjson
 except ImportError:
-    from _actualpy_common import emit_json, log, normalize_query_result, open_actual_client
+    from _actualpy_common import actual_session, add_export_args, emit_json, log, normalize_query_result, open_export, write_ndjson
 
+_ACCOUNT_FIELDS = ("id", "name", "offbudget", "closed", "type", "official_name", "balance_current")
 
-def fetch_accounts() -> list[object]:
+
+def fetch_accounts(actual: Any | None = None) -> list[object]:
     from actual.queries import get_accounts  # type: ignore
 
-    with open_actual_client() as actual:
+    with actual_session(actual) as actual:
         log("[actual-py] get_accounts")
         return normalize_query_result(get_accounts(actual.session))
 
 
+def _account_row(account: Any) -> dict[str, Any]:
+    return {name: getattr(account, name, None) for name in _ACCOUNT_FIELDS}
+
+
+def export_accounts(stream: TextIO, actual: Any | None = None) -> int:
+    """Write one normalized account record per line to `stream`."""
+    return write_ndjson(stream, (_account_row(account) for account in fetch_accounts(actual)))
+
+
 def main() -> int:
+    parser = argparse.ArgumentParser(usage="python scripts/actual/get_accounts.py [--ndjson [--gzip] [--output PATH]]")
+    add_export_args(parser)
+    args = parser.parse_args()
     try:
-        emit_json(fetch_accounts())
+        if args.ndjson:
+            with open_export(args.output, args.gzip) as stream:
+                export_accounts(stream)
+        else:
+            emit_json(fetch_accounts())
         return 0
     except Exception as exc:
         print(f"[actual-py] error: {exc}", file=sys.stderr)
@@ -1,24 +1,62 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import sys
 from datetime import date
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterator, TextIO
 
 try:
-    from ._actualpy_common import as_int, emit_json, log, normalize_query_result, open_actual_client
+    from ._actualpy_common import (
+        actual_session,
+        add_export_args,
+        as_int,
+        emit_json,
+        log,
+        normalize_query_result,
+        open_export,
+        write_ndjson,
+    )
 except ImportError:
-    from _actualpy_common import as_int, emit_json, log, normalize_query_result, open_actual_client
-
-
-def parse_args() -> str:
-    if len(sys.argv) != 2:
-        raise ValueError("Usage: python scripts/actual/get_budget_month.py YYYY-MM")
-    month = sys.argv[1]
-    if len(month) != 7 or month[4] != "-":
-        raise ValueError("Usage: python scripts/actual/get_budget_month.py YYYY-MM")
-    return month
+    from _actualpy_common import (
+        actual_session,
+        add_export_args,
+        as_int,
+        emit_json,
+        log,
+        normalize_query_result,
+        open_export,
+        write_ndjson,
+    )
+
+USAGE = "python scripts/actual/get_budget_month.py YYYY-MM [YYYY-MM] [--ndjson [--gzip] [--output PATH]]"
+
+
+def _month_arg(value: str) -> str:
+    if len(value) != 7 or value[4] != "-":
+        raise argparse.ArgumentTypeError(f"Usage: {USAGE}")
+    month_to_date(value)
+    return value
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(usage=USAGE)
+    parser.add_argument("month", type=_month_arg)
+    parser.add_argument("end_month", type=_month_arg, nargs="?", default=None, help="Last month of an inclusive range")
+    add_export_args(parser)
+    return parser.parse_args(argv)
+
+
+def month_range(start_month: str, end_month: str) -> list[str]:
+    """Inclusive YYYY-MM list from `start_month` to `end_month`."""
+    current = month_to_date(start_month)
+    last = month_to_date(end_month)
+    months: list[str] = []
+    while current <= last:
+        months.append(current.strftime("%Y-%m"))
+        current = date(current.year + current.month // 12, current.month % 12 + 1, 1)
+    return months
 
 
 def month_to_date(month: str) -> date:
@@ -44,99 +82,133 @@ def _getattr_many(obj: Any, *names: str) -> Any:
     return None
 
 
-def fetch_budget_month(month: str) -> dict[str, Any]:
+def fetch_budget_month(month: str, actual: Any | None = None) -> dict[str, Any]:
+    with actual_session(actual) as actual:
+        return _budget_month_payload(actual, month)
+
+
+def fetch_budget_months(months: list[str], actual: Any | None = None) -> dict[str, dict[str, Any]]:
+    """Fetch several budget months with one client session, keyed by YYYY-MM."""
+    with actual_session(actual) as actual:
+        return {month: _budget_month_payload(actual, month) for month in dict.fromkeys(months)}
+
+
+def _budget_month_payload(actual: Any, month: str) -> dict[str, Any]:
     from actual.queries import get_budgets  # type: ignore
 
-    with open_actual_client() as actual:
-        groups_map: dict[str, dict[str, Any]] = {}
-        total_budgeted = 0
-        total_spent = 0
-        total_balance = 0
-        total_income = 0
-
-        target_month = month_to_date(month)
-        log(f"[actual-py] get_budgets month={target_month}")
-        budgets = normalize_query_result(get_budgets(actual.session, month=target_month))
-
-        for budget in budgets:
-            category_obj = _getattr_many(budget, "category")
-            if category_obj is None:
-                continue
-            group_obj = _getattr_many(category_obj, "group")
-
-            group_id = str(_getattr_many(group_obj, "id") or "ungrouped")
-            group_name = str(_getattr_many(group_obj, "name") or "Ungrouped")
-            is_income = bool(_getattr_many(category_obj, "is_income", "isIncome") or False)
-            hidden = bool(_getattr_many(category_obj, "hidden") or False)
-
-            budgeted_minor = as_int(_getattr_many(budget, "amount"))
-            spent_minor = _minor_from_decimalish(_getattr_many(budget, "balance"))
-            balance_minor = budgeted_minor + spent_minor
-            received_minor = -spent_minor if is_income else None
-
-            category = {
-                "id": str(_getattr_many(category_obj, "id") or _getattr_many(budget, "category_id") or ""),
-                "name": str(_getattr_many(category_obj, "name") or ""),
+    groups_map: dict[str, dict[str, Any]] = {}
+    total_budgeted = 0
+    total_spent = 0
+    total_balance = 0
+    total_income = 0
+
+    target_month = month_to_date(month)
+    log(f"[actual-py] get_budgets month={target_month}")
+    budgets = normalize_query_result(get_budgets(actual.session, month=target_month))
+
+    for budget in budgets:
+        category_obj = _getattr_many(budget, "category")
+        if category_obj is None:
+            continue
+        group_obj = _getattr_many(category_obj, "group")
+
+        group_id = str(_getattr_many(group_obj, "id") or "ungrouped")
+        group_name = str(_getattr_many(group_obj, "name") or "Ungrouped")
+        is_income = bool(_getattr_many(category_obj, "is_income", "isIncome") or False)
+        hidden = bool(_getattr_many(category_obj, "hidden") or False)
+
+        budgeted_minor = as_int(_getattr_many(budget, "amount"))
+        spent_minor = _minor_from_decimalish(_getattr_many(budget, "balance"))
+        balance_minor = budgeted_minor + spent_minor
+        received_minor = -spent_minor if is_income else None
+
+        category = {
+            "id": str(_getattr_many(category_obj, "id") or _getattr_many(budget, "category_id") or ""),
+            "name": str(_getattr_many(category_obj, "name") or ""),
+            "is_income": is_income,
+            "hidden": hidden,
+            "group_id": group_id,
+            "carryover": _getattr_many(budget, "carryover"),
+            "budgeted": budgeted_minor,
+            "spent": spent_minor,
+            "balance": balance_minor,
+            "received": received_minor,
+        }
+
+        group = groups_map.get(group_id)
+        if group is None:
+            group = {
+                "id": group_id,
+                "name": group_name,
                 "is_income": is_income,
                 "hidden": hidden,
-                "group_id": group_id,
-                "carryover": _getattr_many(budget, "carryover"),
-                "budgeted": budgeted_minor,
-                "spent": spent_minor,
-                "balance": balance_minor,
-                "received": received_minor,
+                "categories": [],
+                "budgeted": 0,
+                "spent": 0,
+                "balance": 0,
+                "received": 0,
             }
-
-            group = groups_map.get(group_id)
-            if group is None:
-                group = {
-                    "id": group_id,
-                    "name": group_name,
-                    "is_income": is_income,
-                    "hidden": hidden,
-                    "categories": [],
-                    "budgeted": 0,
-                    "spent": 0,
-                    "balance": 0,
-                    "received": 0,
-                }
-                groups_map[group_id] = group
-
-            group["categories"].append(category)
-            if category["budgeted"] is not None:
-                group["budgeted"] += category["budgeted"]
-                total_budgeted += category["budgeted"]
-            if category["spent"] is not None:
-                group["spent"] += category["spent"]
-                total_spent += category["spent"]
-            if category["balance"] is not None:
-                group["balance"] += category["balance"]
-                total_balance += category["balance"]
-            if category["received"] is not None:
-                group["received"] += category["received"]
-                total_income += category["received"]
-
-        # NOTE: actualpy's query helpers expose category/group history easily. These
-        # top-level monthly summary values are set to 0 unless you add a richer report query.
-        return {
-            "month": month,
-            "incomeAvailable": 0,
-            "lastMonthOverspent": 0,
-            "forNextMonth": 0,
-            "totalBudgeted": total_budgeted,
-            "toBudget": 0,
-            "fromLastMonth": 0,
-            "totalIncome": total_income,
-            "totalSpent": total_spent,
-            "totalBalance": total_balance,
-            "categoryGroups": list(groups_map.values()),
-        }
+            groups_map[group_id] = group
+
+        group["categories"].append(category)
+        if category["budgeted"] is not None:
+            group["budgeted"] += category["budgeted"]
+            total_budgeted += category["budgeted"]
+        if category["spent"] is not None:
+            group["spent"] += category["spent"]
+            total_spent += category["spent"]
+        if category["balance"] is not None:
+            group["balance"] += category["balance"]
+            total_balance += category["balance"]
+        if category["received"] is not None:
+            group["received"] += category["received"]
+            total_income += category["received"]
+
+    # NOTE: actualpy's query helpers expose category/group history easily. These
+    # top-level monthly summary values are set to 0 unless you add a richer report query.
+    return {
+        "month": month,
+        "incomeAvailable": 0,
+        "lastMonthOverspent": 0,
+        "forNextMonth": 0,
+        "totalBudgeted": total_budgeted,
+        "toBudget": 0,
+        "fromLastMonth": 0,
+        "totalIncome": total_income,
+        "totalSpent": total_spent,
+        "totalBalance": total_balance,
+        "categoryGroups": list(groups_map.values()),
+    }
+
+
+def budget_category_rows(payload: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Flatten one budget-month payload into a record per category."""
+    for group in payload["categoryGroups"]:
+        for category in group["categories"]:
+            yield {"month": payload["month"], "group_name": group["name"], **category}
+
+
+def export_budget_months(months: list[str], stream: TextIO, actual: Any | None = None) -> int:
+    """Write category records to `stream` as NDJSON, flushed month by month, from one session."""
+    count = 0
+    with actual_session(actual) as actual:
+        for month in dict.fromkeys(months):
+            count += write_ndjson(stream, budget_category_rows(_budget_month_payload(actual, month)))
+    log(f"[actual-py] exported budget categories months={len(months)} count={count}")
+    return count
 
 
 def main() -> int:
     try:
-        month = parse_args()
-        emit_json(fetch_budget_month(month))
+        args = parse_args()
+        months = month_range(args.month, args.end_month) if args.end_month else [args.month]
+        if args.ndjson:
+            with open_export(args.output, args.gzip) as stream:
+                export_budget_months(months, stream)
+        elif args.end_month:
+            emit_json(fetch_budget_months(months))
+        else:
+            emit_json(fetch_budget_month(args.month))
         return 0
     except Exception as exc:
         print(f"[actual-py] error: {exc}", file=sys.stderr)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+try:
+    from ._actualpy_common import actual_session, emit_json, log
+except ImportError:
+    from _actualpy_common import actual_session, emit_json, log
+
+
+def fetch_dimensions(actual: Any | None = None) -> dict[str, list[dict[str, Any]]]:
+    """
+    Id/name rows of the category, category group, account and payee tables.
+
+    Deleted rows are included so ids on older transactions still resolve.
+    """
+    from actual.database import Accounts, Categories, CategoryGroups, Payees  # type: ignore
+    from sqlalchemy import select  # type: ignore
+
+    with actual_session(actual) as actual:
+        log("[actual-py] get_dimensions")
+        session = actual.session
+        return {
+            "categories": [
+                {"id": row[0], "name": row[1], "group_id": row[2]}
+                for row in session.execute(select(Categories.id, Categories.name, Categories.cat_group)).all()
+            ],
+            "category_groups": [
+                {"id": row[0], "name": row[1], "is_income": bool(row[2])}
+                for row in session.execute(select(CategoryGroups.id, CategoryGroups.name, CategoryGroups.is_income)).all()
+            ],
+            "accounts": [
+                {"id": row[0], "name": row[1]}
+                for row in session.execute(select(Accounts.id, Accounts.name)).all()
+            ],
+            "payees": [
+                {"id": row[0], "name": row[1]}
+                for row in session.execute(select(Payees.id, Payees.name)).all()
+            ],
+        }
+
+
+def main() -> int:
+    try:
+        emit_json(fetch_dimensions())
+        return 0
+    except Exception as exc:
+        print(f"[actual-py] error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
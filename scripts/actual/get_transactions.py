@@ -1,20 +1,46 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import math
 import sys
 from datetime import date
-from typing import Any
+from typing import Any, Iterator, TextIO
 
 try:
-    from ._actualpy_common import emit_json, log, normalize_query_result, open_actual_client
+    from ._actualpy_common import (
+        actual_session,
+        add_export_args,
+        emit_json,
+        iter_date_windows,
+        log,
+        normalize_query_result,
+        open_export,
+        write_ndjson,
+    )
 except ImportError:
-    from _actualpy_common import emit_json, log, normalize_query_result, open_actual_client
+    from _actualpy_common import (
+        actual_session,
+        add_export_args,
+        emit_json,
+        iter_date_windows,
+        log,
+        normalize_query_result,
+        open_export,
+        write_ndjson,
+    )
 
 
-def parse_args() -> tuple[date, date]:
-    if len(sys.argv) != 3:
-        raise ValueError("Usage: python scripts/actual/get_transactions.py YYYY-MM-DD YYYY-MM-DD")
-    return date.fromisoformat(sys.argv[1]), date.fromisoformat(sys.argv[2])
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        usage="python scripts/actual/get_transactions.py YYYY-MM-DD YYYY-MM-DD [--ndjson [--gzip] [--output PATH] [--chunk-days N]]"
+    )
+    parser.add_argument("start", type=date.fromisoformat)
+    parser.add_argument("end", type=date.fromisoformat)
+    add_export_args(parser)
+    parser.add_argument("--chunk-days", type=int, default=None, help="Query the range in windows of N days (NDJSON only)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows fetched per cursor batch (NDJSON only)")
+    return parser.parse_args(argv)
 
 
 def _txn_row(txn: Any) -> dict[str, Any]:
@@ -67,21 +93,171 @@ def _txn_row(txn: Any) -> dict[str, Any]:
     return row
 
 
-def fetch_transactions(start_date: date, end_date: date) -> list[dict[str, Any]]:
-    from actual.queries import get_transactions  # type: ignore
+def _pushdown_query(start_date: date, end_date: date, filters: dict[str, Any]) -> Any:
+    """
+    Build the transaction select with `filters` evaluated in SQL.
+
+    Semantics mirror GetTransactions._transaction_matches on normalized rows, so the
+    caller can skip post-filtering whatever was pushed down here.
+
+    Two deliberate differences from actualpy's `get_transactions`:
+    - `end_date` is inclusive, like TransactionQuery.date_range (actualpy's is exclusive,
+      which dropped the last requested day)
+    - rows with a NULL `is_parent` count as regular transactions (actualpy's
+      `is_parent == 0` drops them), matching the sqlite reader and the mirror
+    """
+    from actual.database import Payees, Transactions  # type: ignore
+    from sqlalchemy import func, or_  # type: ignore
+    from sqlalchemy.orm import joinedload  # type: ignore
+    from sqlmodel import select  # type: ignore
+
+    query = (
+        select(Transactions)
+        .options(
+            joinedload(Transactions.account),
+            joinedload(Transactions.category),
+            joinedload(Transactions.payee),
+        )
+        .where(
+            Transactions.date.isnot(None),
+            Transactions.acct.isnot(None),
+            func.coalesce(Transactions.tombstone, 0) == 0,
+            func.coalesce(Transactions.is_parent, 0) == 0,
+            Transactions.date >= int(start_date.strftime("%Y%m%d")),
+            Transactions.date <= int(end_date.strftime("%Y%m%d")),
+        )
+        .order_by(Transactions.date.desc(), Transactions.id)
+    )
+
+    category_text = func.lower(func.coalesce(func.nullif(Transactions.category_id, ""), "uncategorized"))
+
+    accounts = [str(a) for a in filters.get("accounts") or []]
+    if accounts:
+        query = query.where(Transactions.acct.in_(accounts))
+
+    categories = sorted({str(c).lower() for c in filters.get("categories") or []})
+    if categories:
+        query = query.where(category_text.in_(categories))
+
+    # Positive amounts are credits; everything else normalizes to a debit.
+    txn_type = filters.get("txn_type")
+    positive = filters.get("positive")
+    if txn_type == "credit" or positive is False:
+        query = query.where(Transactions.amount > 0)
+    if txn_type == "debit" or positive is True:
+        query = query.where(func.coalesce(Transactions.amount, 0) <= 0)
+
+    abs_minor = func.abs(func.coalesce(Transactions.amount, 0))
+    if filters.get("min_amount") is not None:
+        query = query.where(abs_minor >= math.ceil(float(filters["min_amount"]) * 100 - 1e-6))
+    if filters.get("max_amount") is not None:
+        query = query.where(abs_minor <= math.floor(float(filters["max_amount"]) * 100 + 1e-6))
+
+    text = str(filters.get("query") or "").strip().lower()
+    if text:
+        # Tombstoned payees are skipped, as by the ORM `payee` relationship the Python path reads.
+        payee_name = (
+            select(Payees.name)
+            .where(Payees.id == Transactions.payee_id, Payees.tombstone == 0)
+            .scalar_subquery()
+        )
+        description = func.coalesce(func.nullif(payee_name, ""), func.nullif(Transactions.notes, ""), Transactions.id)
+        query = query.where(
+            or_(func.instr(func.lower(description), text) > 0, func.instr(category_text, text) > 0)
+        )
+    return query
+
+
+def fetch_transactions(
+    start_date: date,
+    end_date: date,
+    actual: Any | None = None,
+    filters: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    filters = filters or {}
+    with actual_session(actual) as actual:
+        log(f"[actual-py] get_transactions start={start_date} end={end_date} pushdown={sorted(filters)}")
+        txns = actual.session.exec(_pushdown_query(start_date, end_date, filters)).unique().all()
+        return [_txn_row(txn) for txn in txns]
+
 
-    with open_actual_client() as actual:
-        log(f"[actual-py] get_transactions start={start_date} end={end_date}")
-        txns = normalize_query_result(
-            get_transactions(actual.session, start_date=start_date, end_date=end_date)
+def iter_transactions(
+    start_date: date,
+    end_date: date,
+    actual: Any | None = None,
+    filters: dict[str, Any] | None = None,
+    batch_size: int = 1000,
+) -> Iterator[list[dict[str, Any]]]:
+    """Same rows as `fetch_transactions`, streamed from the cursor in batches of `batch_size`."""
+    filters = filters or {}
+    with actual_session(actual) as actual:
+        log(
+            f"[actual-py] iter_transactions start={start_date} end={end_date} "
+            f"pushdown={sorted(filters)} batch_size={batch_size}"
         )
+        query = _pushdown_query(start_date, end_date, filters).execution_options(yield_per=batch_size)
+        # Only many-to-one relations are joined, so rows need no unique() pass and can stream.
+        for txns in actual.session.exec(query).partitions():
+            yield [_txn_row(txn) for txn in txns]
+
+
+def fetch_all_transactions(actual: Any | None = None) -> list[dict[str, Any]]:
+    """Every transaction, including tombstoned ones, for building a local mirror."""
+    from actual.queries import get_transactions  # type: ignore
+
+    with actual_session(actual) as actual:
+        log("[actual-py] get_transactions all include_deleted=true")
+        txns = normalize_query_result(get_transactions(actual.session, include_deleted=True))
         return [_txn_row(txn) for txn in txns]
 
 
+def fetch_transactions_by_ids(ids: list[str], actual: Any | None = None) -> list[dict[str, Any]]:
+    """Current state (tombstoned or not) of specific transactions, for incremental mirror sync."""
+    from actual.database import Transactions  # type: ignore
+    from sqlmodel import select  # type: ignore
+
+    with actual_session(actual) as actual:
+        log(f"[actual-py] get_transactions by_ids count={len(ids)}")
+        rows: list[dict[str, Any]] = []
+        for offset in range(0, len(ids), 500):
+            chunk = ids[offset : offset + 500]
+            txns = actual.session.exec(select(Transactions).where(Transactions.id.in_(chunk))).all()
+            rows.extend(_txn_row(txn) for txn in txns)
+        return rows
+
+
+def export_transactions(
+    start_date: date,
+    end_date: date,
+    stream: TextIO,
+    actual: Any | None = None,
+    filters: dict[str, Any] | None = None,
+    chunk_days: int | None = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Write `fetch_transactions` rows to `stream` as NDJSON while the cursor is read.
+
+    - one client session for the whole export; with `chunk_days`, one query per window
+    - windows run newest first, so line order matches `fetch_transactions`
+    """
+    count = 0
+    with actual_session(actual) as actual:
+        for window_start, window_end in iter_date_windows(start_date, end_date, chunk_days):
+            for rows in iter_transactions(window_start, window_end, actual=actual, filters=filters, batch_size=batch_size):
+                count += write_ndjson(stream, rows)
+    log(f"[actual-py] exported transactions count={count}")
+    return count
+
+
 def main() -> int:
     try:
-        start_date, end_date = parse_args()
-        emit_json(fetch_transactions(start_date, end_date))
+        args = parse_args()
+        if args.ndjson:
+            with open_export(args.output, args.gzip) as stream:
+                export_transactions(args.start, args.end, stream, chunk_days=args.chunk_days, batch_size=args.batch_size)
+        else:
+            emit_json(fetch_transactions(args.start, args.end))
         return 0
     except Exception as exc:
         print(f"[actual-py] error: {exc}", file=sys.stderr)
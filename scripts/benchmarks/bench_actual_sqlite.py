@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Compare the ORM bridge path with the direct SQLite reader on a synthetic Actual budget db.
+
+Run from the repo root (needs actualpy):
+    PYTHONPATH=src python scripts/benchmarks/bench_actual_sqlite.py --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import closing, nullcontext
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from actual.database import Accounts, Payees  # type: ignore
+from sqlmodel import Session, SQLModel, create_engine  # type: ignore
+
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+from infrastructure.ledger_providers.actual_sqlite import ActualSQLiteReader
+
+ACCOUNTS = ["acc-checking", "acc-savings", "acc-card"]
+PAYEES = ["Whole Foods", "Netflix", "Shell", "Amazon", "Uber", "Landlord LLC", "Payroll", "Cafe Luna"]
+
+
+def build_db(path: Path, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for account in ACCOUNTS:
+            session.add(Accounts(id=account, name=account))
+        for idx, name in enumerate(PAYEES):
+            session.add(Payees(id=f"payee-{idx}", name=name))
+        session.commit()
+    engine.dispose()
+
+    first_day = date(2024, 1, 1)
+    days = [int((first_day + timedelta(days=offset)).strftime("%Y%m%d")) for offset in range(730)]
+    with closing(sqlite3.connect(path)) as conn:
+        conn.executemany(
+            "INSERT INTO transactions (id, acct, category, amount, description, date, isParent, isChild, tombstone, cleared)"
+            " VALUES (?, ?, ?, ?, ?, ?, 0, 0, 0, 1)",
+            (
+                (
+                    f"txn-{idx:08d}",
+                    rng.choice(ACCOUNTS),
+                    f"cat-{rng.randrange(40):02d}",
+                    rng.randrange(-50000, -1),
+                    f"payee-{rng.randrange(len(PAYEES))}",
+                    rng.choice(days),
+                )
+                for idx in range(count)
+            ),
+        )
+        conn.commit()
+
+
+def best_of(repeat: int, fn) -> tuple[float, int]:
+    elapsed = float("inf")
+    count = 0
+    for _ in range(max(1, repeat)):
+        t = time.perf_counter()
+        count = len(fn())
+        elapsed = min(elapsed, time.perf_counter() - t)
+    return elapsed, count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the direct SQLite reader against the ORM bridge.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic transactions in the budget db")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path; the best is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "db.sqlite"
+        build_db(db_path, args.rows, args.seed)
+        query = TransactionQuery(date_range={"start": "2024-01-01", "end": "2025-12-31"})
+        one_account = query.model_copy(update={"accounts": ["acc-card"]})
+
+        bridge = ActualLedgerProvider(use_session_pool=False)
+        engine = create_engine(f"sqlite:///{db_path}")
+        session = Session(engine)
+        patch.object(bridge, "_checkout_client", side_effect=lambda: nullcontext(SimpleNamespace(session=session))).start()
+
+        direct = ActualLedgerProvider(use_session_pool=False, mode="sqlite")
+        direct._sqlite_reader = ActualSQLiteReader(db_path, provider_name=direct.name)
+
+        for label, q in (("all accounts", query), ("one account", one_account)):
+            orm_s, orm_rows = best_of(args.repeat, lambda: bridge.fetch_transactions(q))
+            sql_s, sql_rows = best_of(args.repeat, lambda: direct.fetch_transactions(q))
+            print(
+                f"{label:<13} rows={sql_rows:>7} orm+normalize={orm_s * 1000:>7.0f}ms "
+                f"sqlite={sql_s * 1000:>7.0f}ms speedup={orm_s / sql_s:.1f}x (orm rows={orm_rows})"
+            )
+        patch.stopall()
+        session.close()
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
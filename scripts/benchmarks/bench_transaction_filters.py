@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Compare per-row filter evaluation against compiled TransactionQuery predicates.
+
+Run from the repo root:
+    PYTHONPATH=src python scripts/benchmarks/bench_transaction_filters.py --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+from domain.models import Money, Transaction, TransactionType
+from infrastructure.transaction_filters import compile_transaction_filters
+
+CATEGORIES = ["Groceries", "Dining", "Rent", "Utilities", "Travel", "Shopping", "Income", "Uncategorized"]
+MERCHANTS = ["Whole Foods", "Netflix", "Shell", "Amazon", "Uber", "Landlord LLC", "Payroll", "Cafe Luna"]
+ACCOUNTS = ["checking", "savings", "card"]
+
+SCENARIOS: dict[str, dict[str, Any]] = {
+    "date_only": {"date_range": {"start": "2025-03-01", "end": "2025-09-30"}},
+    "typical_tool": {
+        "date_range": {"start": "2025-01-01", "end": "2025-12-31"},
+        "positive": True,
+        "categories": ["Groceries", "Dining"],
+    },
+    "all_filters": {
+        "date_range": {"start": "2025-01-01", "end": "2025-12-31"},
+        "accounts": ["checking", "card"],
+        "categories": ["Groceries", "Dining", "Shopping"],
+        "currency": "USD",
+        "txn_type": "debit",
+        "min_amount": 5.0,
+        "max_amount": 250.0,
+        "query": "o",
+    },
+}
+
+
+def _legacy_parse_date(value: Any) -> date | None:
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def legacy_matches(txn: Transaction, args: dict[str, Any]) -> bool:
+    """The pre-compilation matcher: re-derives every set/date/bound for each row."""
+    date_range = args.get("date_range")
+    if isinstance(date_range, dict):
+        start = _legacy_parse_date(date_range.get("start"))
+        end = _legacy_parse_date(date_range.get("end"))
+        if start and txn.posted_on < start:
+            return False
+        if end and txn.posted_on > end:
+            return False
+    accounts = {str(a) for a in (args.get("accounts") or [])}
+    if accounts and (txn.account_id or "") not in accounts:
+        return False
+    categories = {str(c).lower() for c in (args.get("categories") or [])}
+    if categories and txn.category.lower() not in categories:
+        return False
+    currency = args.get("currency")
+    if currency and txn.value.currency != currency:
+        return False
+    txn_type = args.get("txn_type")
+    if txn_type and txn.txn_type.value != str(txn_type):
+        return False
+    positive = args.get("positive")
+    if positive is True and txn.txn_type != TransactionType.DEBIT:
+        return False
+    if positive is False and txn.txn_type != TransactionType.CREDIT:
+        return False
+    amount = float(txn.value.amount)
+    min_amount = args.get("min_amount")
+    if min_amount is not None and amount < float(min_amount):
+        return False
+    max_amount = args.get("max_amount")
+    if max_amount is not None and amount > float(max_amount):
+        return False
+    query = (args.get("query") or "").strip().lower()
+    if query and query not in txn.description.lower() and query not in txn.category.lower():
+        return False
+    return True
+
+
+def make_transactions(count: int, seed: int) -> list[Transaction]:
+    rng = random.Random(seed)
+    first_day = date(2024, 1, 1)
+    txns: list[Transaction] = []
+    for idx in range(count):
+        credit = rng.random() < 0.1
+        txns.append(
+            Transaction(
+                id=f"t{idx}",
+                posted_on=first_day + timedelta(days=rng.randrange(730)),
+                description=rng.choice(MERCHANTS),
+                category=rng.choice(CATEGORIES),
+                value=Money(amount=Decimal(rng.randrange(100, 50000)) / 100, currency="USD"),
+                txn_type=TransactionType.CREDIT if credit else TransactionType.DEBIT,
+                account_id=rng.choice(ACCOUNTS),
+            )
+        )
+    return txns
+
+
+def _best_of(repeat: int, fn: Callable[[], list[Transaction]]) -> tuple[float, list[Transaction]]:
+    best = float("inf")
+    result: list[Transaction] = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compiled transaction filter predicates.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic transactions to filter")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario; the best time is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    txns = make_transactions(args.rows, args.seed)
+    print(f"rows={len(txns)} repeat={args.repeat}")
+    print(f"{'scenario':<14} {'matched':>8} {'per-row ms':>11} {'compiled ms':>12} {'speedup':>8}")
+    for name, filters in SCENARIOS.items():
+        legacy_s, legacy_rows = _best_of(args.repeat, lambda: [t for t in txns if legacy_matches(t, filters)])
+        compiled_s, compiled_rows = _best_of(args.repeat, lambda: compile_transaction_filters(filters).filter(txns))
+        if [t.id for t in legacy_rows] != [t.id for t in compiled_rows]:
+            raise SystemExit(f"{name}: compiled predicate disagrees with the per-row matcher")
+        print(
+            f"{name:<14} {len(compiled_rows):>8} {legacy_s * 1000:>11.1f} {compiled_s * 1000:>12.1f} "
+            f"{legacy_s / compiled_s:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
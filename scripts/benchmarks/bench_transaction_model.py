@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Measure per-row memory and normalization throughput of Actual transaction rows.
+
+Run from the repo root:
+    PYTHONPATH=src python scripts/benchmarks/bench_transaction_model.py --rows 200000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Any
+
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+
+PAYEES = ["Whole Foods", "Netflix", "Shell", "Amazon", "Uber", "Landlord LLC", "Payroll", "Cafe Luna"]
+CATEGORIES = [f"cat-{idx:02d}" for idx in range(40)]
+ACCOUNTS = ["acc-checking", "acc-savings", "acc-card"]
+
+
+def make_bridge_rows(count: int, seed: int, synced_ratio: float) -> list[dict[str, Any]]:
+    """Rows shaped like scripts/actual/get_transactions.py output; a share carry bank-sync JSON."""
+    rng = random.Random(seed)
+    first_day = date(2024, 1, 1)
+    rows: list[dict[str, Any]] = []
+    for idx in range(count):
+        amount = rng.randrange(-50000, 250000 if rng.random() < 0.1 else -1)
+        raw_synced = None
+        if rng.random() < synced_ratio:
+            raw_synced = json.dumps(
+                {
+                    "transactionId": f"bank-{idx}",
+                    "bookingDate": "2025-01-01",
+                    "transactionAmount": {"amount": f"{amount / 100:.2f}", "currency": "USD"},
+                    "remittanceInformationUnstructured": rng.choice(PAYEES).upper(),
+                }
+            )
+        account = rng.choice(ACCOUNTS)
+        rows.append(
+            {
+                "id": f"txn-{idx:08d}",
+                "date": int((first_day + timedelta(days=rng.randrange(730))).strftime("%Y%m%d")),
+                "amount": amount,
+                "notes": None,
+                "cleared": True,
+                "reconciled": False,
+                "transfer_id": None,
+                "parent_id": None,
+                "starting_balance_flag": False,
+                "tombstone": False,
+                "imported_id": f"imp-{idx}",
+                "imported_payee": rng.choice(PAYEES),
+                "raw_synced_data": raw_synced,
+                "is_parent": False,
+                "is_child": False,
+                "account": account,
+                "accountId": account,
+                "category": rng.choice(CATEGORIES),
+                "payee": f"payee-{rng.randrange(8)}",
+                "subtransactions": [],
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Transaction normalization memory and throughput.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic bridge rows")
+    parser.add_argument("--synced-ratio", type=float, default=0.5, help="Share of rows carrying raw_synced_data")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed normalization passes; the best is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    provider = ActualLedgerProvider(use_session_pool=False)
+    rows = make_bridge_rows(args.rows, args.seed, args.synced_ratio)
+    gc.collect()
+
+    elapsed = float("inf")
+    for _ in range(max(1, args.repeat)):
+        t = time.perf_counter()
+        txns = [provider._normalize_transaction_row(row) for row in rows]
+        elapsed = min(elapsed, time.perf_counter() - t)
+        del txns
+        gc.collect()
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    txns = [provider._normalize_transaction_row(row) for row in rows]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_row = (retained - baseline) / max(len(txns), 1)
+    print(f"rows={len(txns)} synced_ratio={args.synced_ratio}")
+    print(f"normalize: {elapsed * 1000:.0f}ms best of {args.repeat}, {len(txns) / elapsed:,.0f} rows/s")
+    print(f"retained:  {(retained - baseline) / 1e6:.1f}MB, {per_row:.0f} bytes/row")
+
+    t = time.perf_counter()
+    touched = sum(len(txn.metadata) for txn in txns)
+    print(f"metadata first access: {(time.perf_counter() - t) * 1000:.0f}ms ({touched} keys)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
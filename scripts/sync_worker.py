@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Run the ledger sync worker as its own process.
+
+Keeps the on-disk state (mirror / local budget db) synced and writes the sync state
+file the API reads for `max_staleness_seconds`. Send SIGUSR1 to sync immediately.
+
+Run from the repo root:
+    PYTHONPATH=src python scripts/sync_worker.py --interval 60
+"""
+from __future__ import annotations
+
+import argparse
+import signal
+import threading
+
+from infrastructure.get_transactions import get_transactions
+from infrastructure.ledger_sync import LedgerSyncWorker
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Sync ledger providers in the background.")
+    parser.add_argument("--interval", type=float, default=None, help="Seconds between syncs (LEDGERMIND_SYNC_INTERVAL_SECONDS)")
+    parser.add_argument("--state-path", default=None, help="Sync state file (LEDGERMIND_SYNC_STATE_PATH)")
+    parser.add_argument("--once", action="store_true", help="Sync once and exit")
+    args = parser.parse_args()
+
+    worker = LedgerSyncWorker(get_transactions, interval_seconds=args.interval, state_path=args.state_path)
+    try:
+        if args.once:
+            return 0 if worker.sync_now().last_error is None else 1
+
+        stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+        signal.signal(signal.SIGINT, lambda *_: stopped.set())
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda *_: worker.notify())
+        worker.start()
+        while not stopped.wait(1.0):
+            pass
+        worker.stop()
+        return 0
+    finally:
+        get_transactions.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,16 +2,27 @@ from __future__ import annotations
 
 import time
 
-from domain.schemas import LedgerMindPlan, ToolContext, ToolRequest, ToolResponse, UserRequest
+from domain.schemas import LedgerMindPlan, ToolContext, ToolRequest, ToolResponse, TransactionQuery, UserRequest
+from infrastructure.get_transactions import GetTransactions, TransactionDataset, get_transactions
+from infrastructure.ledger_sync import LedgerSyncWorker, get_sync_worker
 from logs import get_logger
+from tools._transactions_support import use_transaction_dataset
 from tools.registry import ToolRegistry
 
 logger = get_logger("ToolExecutor")
 
 
 class ToolExecutor:
-    def __init__(self, registry: ToolRegistry):
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        transactions: GetTransactions | None = None,
+        sync_worker: LedgerSyncWorker | None = None,
+    ):
         self._registry = registry
+        self._transactions = transactions or get_transactions
+        self._sync_worker = sync_worker
+        self._inline_sync: LedgerSyncWorker | None = None
 
     def run_calls(self, plan: LedgerMindPlan, user_request: UserRequest) -> list[ToolResponse]:
         context = ToolContext(
@@ -20,28 +31,99 @@ class ToolExecutor:
             timezone=user_request.context.timezone,
             policy_profile=user_request.context.policy_profile,
         )
+        requests = [
+            (
+                call,
+                ToolRequest(
+                    request_id=f"{user_request.request_id}:{call.id}",
+                    tool=call.tool,
+                    args=call.args,
+                    context=context,
+                ),
+            )
+            for call in plan.calls
+        ]
+        if user_request.context.max_staleness_seconds is not None:
+            self._ensure_fresh(user_request.context.max_staleness_seconds)
+        dataset = self._prefetch([req for _, req in requests])
+
         responses: list[ToolResponse] = []
-        for call in plan.calls:
-            req = ToolRequest(
-                request_id=f"{user_request.request_id}:{call.id}",
-                tool=call.tool,
-                args=call.args,
-                context=context,
+        with use_transaction_dataset(dataset if dataset is not None else self._transactions):
+            for call, req in requests:
+                logger.info("ToolExecutor running call_id=%s tool=%s", call.id, call.tool)
+                t = time.perf_counter()
+                try:
+                    tool = self._registry.get_tool(req.tool)
+                    response = tool.run(req)
+                except Exception as exc:
+                    logger.exception("ToolExecutor failed call_id=%s tool=%s", call.id, call.tool)
+                    response = ToolResponse(
+                        request_id=req.request_id,
+                        tool=req.tool,
+                        ok=False,
+                        errors=[str(exc) or exc.__class__.__name__],
+                        context=context,
+                    )
+                responses.append(response)
+                logger.info("ToolExecutor finished call_id=%s tool=%s in %.2fs ok=%s", call.id, call.tool, time.perf_counter() - t, response.ok)
+        return responses
+
+    def _ensure_fresh(self, max_staleness_seconds: float) -> None:
+        """Wait for (or run) a ledger sync when the synced data is older than requested."""
+        worker = self._sync_worker or get_sync_worker()
+        if worker is None:
+            # No background worker in this process: sync inline, tracking freshness across requests.
+            if self._inline_sync is None:
+                self._inline_sync = LedgerSyncWorker(self._transactions, persist=False)
+            worker = self._inline_sync
+        t = time.perf_counter()
+        fresh = worker.ensure_fresh(max_staleness_seconds)
+        if not fresh:
+            logger.warning(
+                "ToolExecutor could not meet max_staleness=%.0fs; using last synced data status=%s",
+                max_staleness_seconds,
+                worker.status(),
             )
-            logger.info("ToolExecutor running call_id=%s tool=%s", call.id, call.tool)
-            t = time.perf_counter()
+        logger.info("ToolExecutor freshness check fresh=%s in %.2fs", fresh, time.perf_counter() - t)
+
+    def _prefetch(self, requests: list[ToolRequest]) -> TransactionDataset | None:
+        """
+        Fetch once for the transaction calls whose date ranges overlap another call's.
+
+        Every other call (a single-call plan included) keeps the normal streamed fetch, as do
+        calls with filters a provider can push down, since the shared fetch is dates only.
+        """
+        queries: list[TransactionQuery] = []
+        for req in requests:
             try:
-                tool = self._registry.get_tool(req.tool)
-                response = tool.run(req)
-            except Exception as exc:
-                logger.exception("ToolExecutor failed call_id=%s tool=%s", call.id, call.tool)
-                response = ToolResponse(
-                    request_id=req.request_id,
-                    tool=req.tool,
-                    ok=False,
-                    errors=[str(exc) or exc.__class__.__name__],
-                    context=context,
-                )
-            responses.append(response)
-            logger.info("ToolExecutor finished call_id=%s tool=%s in %.2fs ok=%s", call.id, call.tool, time.perf_counter() - t, response.ok)
-        return responses
+                call_filters = self._registry.get_tool(req.tool).transaction_filter_sets(req)
+                call_queries = [TransactionQuery.model_validate(filters) for filters in call_filters]
+            except Exception:
+                # Unknown tools and bad args surface as per-call errors when the call runs.
+                continue
+            queries.extend(query for query in call_queries if not self._transactions.pushdown_fields(query))
+        filter_sets = [
+            query
+            for index, query in enumerate(queries)
+            if any(index != other_index and _overlaps(query, other) for other_index, other in enumerate(queries))
+        ]
+        if not filter_sets:
+            return None
+
+        t = time.perf_counter()
+        try:
+            dataset = self._transactions.prefetch(filter_sets)
+        except Exception as exc:
+            logger.warning("ToolExecutor prefetch failed; tools will fetch individually err=%s", exc)
+            return None
+        logger.info(
+            "ToolExecutor prefetched transactions for calls=%d rows=%d in %.2fs",
+            len(filter_sets),
+            len(dataset),
+            time.perf_counter() - t,
+        )
+        return dataset
+
+
+def _overlaps(first: TransactionQuery, second: TransactionQuery) -> bool:
+    return first.date_range.start <= second.date_range.end and second.date_range.start <= first.date_range.end
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from datetime import date
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 
 class TransactionType(str, Enum):
@@ -12,22 +13,165 @@ class TransactionType(str, Enum):
     CREDIT = "credit"
 
 
-@dataclass
+_CENTS = Decimal(100)
+
+
 class Money:
-    amount: Decimal
-    currency: str = "USD"
+    """
+    Amount held as integer minor units (cents) plus an interned currency code.
+
+    `Money(amount=Decimal("12.50"))` still works; `amount` is derived as a 2-dp Decimal.
+    """
+
+    __slots__ = ("minor_units", "currency")
+
+    def __init__(self, amount: Decimal | int | float | str = 0, currency: str = "USD") -> None:
+        if not isinstance(amount, Decimal):
+            amount = Decimal(repr(amount) if isinstance(amount, float) else amount)
+        self.minor_units = int((amount * _CENTS).to_integral_value(ROUND_HALF_EVEN))
+        self.currency = sys.intern(currency)
+
+    @classmethod
+    def from_minor(cls, minor_units: int, currency: str = "USD") -> "Money":
+        money = cls.__new__(cls)
+        money.minor_units = minor_units
+        money.currency = sys.intern(currency)
+        return money
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.minor_units).scaleb(-2)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.minor_units == other.minor_units and self.currency == other.currency
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return f"Money(amount={self.amount!r}, currency={self.currency!r})"
+
+
+MetadataSource = dict[str, Any] | Callable[[], dict[str, Any]] | None
 
 
-@dataclass
 class Transaction:
-    id: str
-    posted_on: date
-    description: str
-    category: str
-    value: Money
-    txn_type: TransactionType = TransactionType.DEBIT
-    account_id: str | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    """
+    Normalized transaction with `__slots__` storage.
+
+    `metadata` may be given as a zero-argument callable; it is decoded on first access
+    and cached, so rows that are only filtered and aggregated never build it.
+
+    `category`/`account_id` hold provider ids; the optional `*_name` fields carry
+    display names when the provider can resolve them.
+    """
+
+    __slots__ = (
+        "id",
+        "posted_on",
+        "description",
+        "category",
+        "value",
+        "txn_type",
+        "account_id",
+        "_metadata",
+        "category_name",
+        "category_group",
+        "account_name",
+        "payee_name",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        posted_on: date,
+        description: str,
+        category: str,
+        value: Money,
+        txn_type: TransactionType = TransactionType.DEBIT,
+        account_id: str | None = None,
+        metadata: MetadataSource = None,
+        category_name: str | None = None,
+        category_group: str | None = None,
+        account_name: str | None = None,
+        payee_name: str | None = None,
+    ) -> None:
+        self.id = id
+        self.posted_on = posted_on
+        self.description = description
+        self.category = category
+        self.value = value
+        self.txn_type = txn_type
+        self.account_id = account_id
+        self._metadata = metadata
+        self.category_name = category_name
+        self.category_group = category_group
+        self.account_name = account_name
+        self.payee_name = payee_name
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        metadata = self._metadata
+        if metadata is None:
+            metadata = self._metadata = {}
+        elif not isinstance(metadata, dict):
+            metadata = self._metadata = metadata()
+        return metadata
+
+    @metadata.setter
+    def metadata(self, value: MetadataSource) -> None:
+        self._metadata = value
+
+    @property
+    def metadata_loaded(self) -> bool:
+        return self._metadata is None or isinstance(self._metadata, dict)
+
+    @property
+    def metadata_source(self) -> MetadataSource:
+        """`metadata` as given, without decoding a deferred callable."""
+        return self._metadata
+
+    def _fields(self) -> tuple[Any, ...]:
+        return (
+            self.id,
+            self.posted_on,
+            self.description,
+            self.category,
+            self.value,
+            self.txn_type,
+            self.account_id,
+            self.metadata,
+            self.category_name,
+            self.category_group,
+            self.account_name,
+            self.payee_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transaction):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        names = (
+            "id",
+            "posted_on",
+            "description",
+            "category",
+            "value",
+            "txn_type",
+            "account_id",
+            "metadata",
+            "category_name",
+            "category_group",
+            "account_name",
+            "payee_name",
+        )
+        body = ", ".join(f"{name}={value!r}" for name, value in zip(names, self._fields()))
+        return f"Transaction({body})"
 
 
 @dataclass
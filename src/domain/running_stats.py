@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# Log-bucket sketch with 1% relative accuracy (DDSketch-style); ~900 buckets span 1 cent to $1M.
+_SKETCH_ACCURACY = 0.01
+_GAMMA = (1 + _SKETCH_ACCURACY) / (1 - _SKETCH_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+# Decayed sketch buckets below this weight are dropped so the sketch stays small.
+_MIN_BUCKET_WEIGHT = 1e-3
+
+
+@dataclass
+class RunningStats:
+    """
+    Mergeable summary of a stream of non-negative cent amounts.
+
+    - `count`, `total`, `mean` and `m2` (sum of squared deviations) are updated with
+      Chan's parallel merge, so batches can be folded in without revisiting old rows
+    - `sketch` maps log-bucket index -> count for approximate quantiles
+    - `decay` down-weights everything seen so far, so counts are weights rather than integers
+    """
+
+    count: float = 0.0
+    total: float = 0.0
+    mean: float = 0.0
+    m2: float = 0.0
+    sketch: dict[int, float] = field(default_factory=dict)
+
+    def add_many(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        values = np.asarray(values, dtype=np.float64)
+        batch_count = len(values)
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        merged = self.count + batch_count
+        delta = batch_mean - self.mean
+        self.m2 += batch_m2 + delta * delta * self.count * batch_count / merged
+        self.mean += delta * batch_count / merged
+        self.count = merged
+        self.total += float(values.sum())
+
+        buckets = np.zeros(batch_count, dtype=np.int64)
+        positive = values >= 1.0
+        buckets[positive] = np.ceil(np.log(values[positive]) / _LOG_GAMMA).astype(np.int64)
+        keys, counts = np.unique(buckets, return_counts=True)
+        for key, bucket_count in zip(keys.tolist(), counts.tolist()):
+            self.sketch[key] = self.sketch.get(key, 0) + bucket_count
+
+    def decay(self, factor: float) -> None:
+        """Scale the weight of every value seen so far by `factor` (0..1); the mean is unchanged."""
+        self.count *= factor
+        self.total *= factor
+        self.m2 *= factor
+        self.sketch = {key: value * factor for key, value in self.sketch.items() if value * factor >= _MIN_BUCKET_WEIGHT}
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0 below two values)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def quantile(self, q: float) -> float:
+        if not self.sketch:
+            return 0.0
+        # Weighted rank, so equally decayed buckets keep the same quantiles.
+        rank = q * sum(self.sketch.values())
+        seen = 0.0
+        for key in sorted(self.sketch):
+            seen += self.sketch[key]
+            if seen >= rank:
+                return 0.0 if key <= 0 else 2 * _GAMMA**key / (_GAMMA + 1)
+        return 2 * _GAMMA ** max(self.sketch) / (_GAMMA + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "m2": self.m2,
+            "sketch": {str(key): value for key, value in self.sketch.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "RunningStats":
+        return cls(
+            count=float(payload.get("count") or 0.0),
+            total=float(payload.get("total") or 0.0),
+            mean=float(payload.get("mean") or 0.0),
+            m2=float(payload.get("m2") or 0.0),
+            sketch={int(key): float(value) for key, value in (payload.get("sketch") or {}).items()},
+        )
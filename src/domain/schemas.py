@@ -8,6 +8,11 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 class UserRequestContext(BaseModel):
     timezone: str = "UTC"
     policy_profile: str = "default_v1"
+    max_staleness_seconds: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Oldest acceptable ledger sync age; unset uses whatever data is already synced.",
+    )
 
 
 class UserRequest(BaseModel):
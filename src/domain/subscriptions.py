@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import statistics
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+# (cadence, nominal period days, accepted median interval band, minimum charges)
+CADENCES: tuple[tuple[str, int, float, float, int], ...] = (
+    ("weekly", 7, 5, 9, 4),
+    ("biweekly", 14, 12, 16, 3),
+    ("monthly", 30, 24, 38, 3),
+    ("quarterly", 91, 80, 102, 2),
+    ("annual", 365, 350, 380, 2),
+)
+# Charges and amounts kept per merchant; enough for a year of monthly intervals.
+_RECENT = 12
+
+
+def classify_cadence(median_interval: float, count: int) -> tuple[str, int, float, float, int] | None:
+    """CADENCES entry whose band holds `median_interval` and whose minimum `count` is met."""
+    if count < 2:
+        return None
+    return next((c for c in CADENCES if c[2] <= median_interval <= c[3] and count >= c[4]), None)
+
+
+def stable_amount(avg_cents: float, spread_cents: float) -> bool:
+    """Amounts vary by at most max($3, 25% of the average)."""
+    return avg_cents > 0 and spread_cents <= max(300.0, avg_cents * 0.25)
+
+
+@dataclass
+class SubscriptionEntry:
+    """
+    Running per-merchant charge history for the subscription index.
+
+    - `count`, `first_day` and `last_day` (date ordinals) cover every folded charge, so
+      the mean interval is exact
+    - `recent_days` / `recent_amounts` keep the last charges (cents) for the median
+      interval, amount band and change detection
+    """
+
+    merchant: str
+    count: int = 0
+    first_day: int = 0
+    last_day: int = 0
+    recent_days: list[int] = field(default_factory=list)
+    recent_amounts: list[int] = field(default_factory=list)
+    examples: list[str] = field(default_factory=list)
+
+    def add_charges(self, days: list[int], amounts: list[int], descriptions: list[str]) -> None:
+        """Fold in charges sorted by day, none earlier than `last_day`."""
+        if not days:
+            return
+        if not self.count:
+            self.first_day = days[0]
+        self.count += len(days)
+        self.last_day = days[-1]
+        self.recent_days = [*self.recent_days, *days][-(_RECENT + 1) :]
+        self.recent_amounts = [*self.recent_amounts, *amounts][-_RECENT:]
+        self.examples = [*self.examples, *descriptions][-2:]
+
+    @property
+    def next_expected_day(self) -> int:
+        """Last charge plus the mean interval over every folded charge."""
+        return self.last_day + round((self.last_day - self.first_day) / max(self.count - 1, 1))
+
+    def summary(self, today: date | None = None) -> dict[str, Any] | None:
+        """Record shaped like `detect.recurring_charges` output, or None if not recurring; `today` adds `alerts`."""
+        intervals = [b - a for a, b in zip(self.recent_days, self.recent_days[1:])]
+        if not intervals:
+            return None
+        cadence = classify_cadence(statistics.median(intervals), self.count)
+        amounts = self.recent_amounts
+        avg_cents = sum(amounts) / len(amounts)
+        spread = max(amounts) - min(amounts)
+        if cadence is None or not stable_amount(avg_cents, spread):
+            return None
+
+        record: dict[str, Any] = {
+            "merchant": self.merchant,
+            "cadence": cadence[0],
+            "count": self.count,
+            "avg_amount": round(avg_cents / 100, 2),
+            "avg_interval_days": round((self.last_day - self.first_day) / (self.count - 1), 1),
+            "amount_spread": round(spread / 100, 2),
+            "amount_band": {"min": round(min(amounts) / 100, 2), "max": round(max(amounts) / 100, 2)},
+            "last_seen": date.fromordinal(self.last_day).isoformat(),
+            "next_expected_on": date.fromordinal(self.next_expected_day).isoformat(),
+            "examples": list(self.examples),
+        }
+        if today is not None:
+            record["alerts"] = self.alerts(today, cadence[0])
+        return record
+
+    def alerts(self, today: date, cadence: str) -> list[dict[str, Any]]:
+        """
+        Missed or changed charges as of `today`.
+
+        - `missed`: nothing charged within the cadence band's upper tolerance past the
+          expected date
+        - `amount_changed`: the latest charge differs from the earlier recent average by
+          more than max($1, 5%)
+        """
+        alerts: list[dict[str, Any]] = []
+        _, period, _, upper, _ = next(c for c in CADENCES if c[0] == cadence)
+        overdue = today.toordinal() - self.next_expected_day
+        if overdue > upper - period:
+            alerts.append({"type": "missed", "days_overdue": overdue})
+        amounts = self.recent_amounts
+        if len(amounts) > 1:
+            previous = sum(amounts[:-1]) / (len(amounts) - 1)
+            if abs(amounts[-1] - previous) > max(100.0, previous * 0.05):
+                alerts.append(
+                    {
+                        "type": "amount_changed",
+                        "previous_amount": round(previous / 100, 2),
+                        "latest_amount": round(amounts[-1] / 100, 2),
+                    }
+                )
+        return alerts
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "merchant": self.merchant,
+            "count": self.count,
+            "first_day": self.first_day,
+            "last_day": self.last_day,
+            "recent_days": self.recent_days,
+            "recent_amounts": self.recent_amounts,
+            "examples": self.examples,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "SubscriptionEntry":
+        return cls(
+            merchant=str(payload["merchant"]),
+            count=int(payload.get("count", 0)),
+            first_day=int(payload.get("first_day", 0)),
+            last_day=int(payload.get("last_day", 0)),
+            recent_days=[int(v) for v in payload.get("recent_days", [])],
+            recent_amounts=[int(v) for v in payload.get("recent_amounts", [])],
+            examples=[str(v) for v in payload.get("examples", [])],
+        )
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _encode(index: dict[str, int], value: str) -> int:
+    code = index.get(value)
+    if code is None:
+        code = index[value] = len(index)
+    return code
+
+
+def _encode_labeled(index: dict[str, int], labels: list[str], key: str, label: Any) -> int:
+    code = index.get(key)
+    if code is None:
+        code = index[key] = len(index)
+        labels.append(str(label) if label else key)
+    return code
+
+
+class TransactionFrame:
+    """
+    Columnar, read-only view of serialized transaction rows for vectorized tools.
+
+    - `amount_cents` int64 magnitudes (rows carry direction in `is_credit`)
+    - `day` int32 proleptic ordinals (`date.toordinal()`)
+    - category/account/merchant/currency as int32 codes into their `*_names` lists,
+      numbered in first-appearance order
+    - categories and accounts are keyed by id (`*_keys`); their `*_names` entries are the
+      row's `category_name` / `account_name` when present, else the id
+    """
+
+    __slots__ = (
+        "ids",
+        "day",
+        "amount_cents",
+        "is_credit",
+        "category_codes",
+        "category_names",
+        "category_keys",
+        "account_codes",
+        "account_names",
+        "account_keys",
+        "merchant_codes",
+        "merchant_names",
+        "currency_codes",
+        "currency_names",
+    )
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        day: np.ndarray,
+        amount_cents: np.ndarray,
+        is_credit: np.ndarray,
+        category_codes: np.ndarray,
+        category_names: list[str],
+        account_codes: np.ndarray,
+        account_names: list[str],
+        merchant_codes: np.ndarray,
+        merchant_names: list[str],
+        currency_codes: np.ndarray,
+        currency_names: list[str],
+        category_keys: list[str] | None = None,
+        account_keys: list[str] | None = None,
+    ) -> None:
+        self.ids = ids
+        self.day = day
+        self.amount_cents = amount_cents
+        self.is_credit = is_credit
+        self.category_codes = category_codes
+        self.category_names = category_names
+        self.account_codes = account_codes
+        self.account_names = account_names
+        self.merchant_codes = merchant_codes
+        self.merchant_names = merchant_names
+        self.currency_codes = currency_codes
+        self.currency_names = currency_names
+        self.category_keys = category_keys if category_keys is not None else list(category_names)
+        self.account_keys = account_keys if account_keys is not None else list(account_names)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "TransactionFrame":
+        """Build in one pass over `rows` (e.g. a stream); no intermediate row list is kept."""
+        ids: list[str] = []
+        days: list[int] = []
+        cents: list[int] = []
+        credit: list[bool] = []
+        categories: list[int] = []
+        accounts: list[int] = []
+        merchants: list[int] = []
+        currencies: list[int] = []
+        category_index: dict[str, int] = {}
+        account_index: dict[str, int] = {}
+        merchant_index: dict[str, int] = {}
+        currency_index: dict[str, int] = {}
+        category_labels: list[str] = []
+        account_labels: list[str] = []
+        ordinals: dict[Any, int] = {}
+
+        for row in rows:
+            posted_on = row.get("posted_on")
+            ordinal = ordinals.get(posted_on)
+            if ordinal is None:
+                parsed = posted_on if isinstance(posted_on, date) else date.fromisoformat(str(posted_on))
+                ordinal = ordinals[posted_on] = parsed.toordinal()
+            ids.append(str(row.get("id") or ""))
+            days.append(ordinal)
+            cents.append(round(float(row.get("amount") or 0) * 100))
+            credit.append(row.get("txn_type") == "credit")
+            categories.append(
+                _encode_labeled(
+                    category_index, category_labels, str(row.get("category") or "uncategorized"), row.get("category_name")
+                )
+            )
+            accounts.append(
+                _encode_labeled(account_index, account_labels, str(row.get("account_id") or ""), row.get("account_name"))
+            )
+            merchants.append(_encode(merchant_index, str(row.get("description") or "")))
+            currencies.append(_encode(currency_index, str(row.get("currency") or "USD")))
+
+        return cls(
+            ids=np.array(ids, dtype=object),
+            day=np.array(days, dtype=np.int32),
+            amount_cents=np.array(cents, dtype=np.int64),
+            is_credit=np.array(credit, dtype=bool),
+            category_codes=np.array(categories, dtype=np.int32),
+            category_names=category_labels,
+            account_codes=np.array(accounts, dtype=np.int32),
+            account_names=account_labels,
+            merchant_codes=np.array(merchants, dtype=np.int32),
+            merchant_names=list(merchant_index),
+            currency_codes=np.array(currencies, dtype=np.int32),
+            currency_names=list(currency_index),
+            category_keys=list(category_index),
+            account_keys=list(account_index),
+        )
+
+    def __len__(self) -> int:
+        return int(self.amount_cents.shape[0])
+
+    @property
+    def signed_cents(self) -> np.ndarray:
+        """Credits positive, debits negative."""
+        return np.where(self.is_credit, self.amount_cents, -self.amount_cents)
+
+    def posted_on(self, index: int) -> date:
+        return date.fromordinal(int(self.day[index]))
+
+    def select(self, mask: np.ndarray) -> "TransactionFrame":
+        """Rows where `mask` is true; dictionaries are shared, codes keep their meaning."""
+        return TransactionFrame(
+            ids=self.ids[mask],
+            day=self.day[mask],
+            amount_cents=self.amount_cents[mask],
+            is_credit=self.is_credit[mask],
+            category_codes=self.category_codes[mask],
+            category_names=self.category_names,
+            account_codes=self.account_codes[mask],
+            account_names=self.account_names,
+            merchant_codes=self.merchant_codes[mask],
+            merchant_names=self.merchant_names,
+            currency_codes=self.currency_codes[mask],
+            currency_names=self.currency_names,
+            category_keys=self.category_keys,
+            account_keys=self.account_keys,
+        )
+
+
+def group_sum(codes: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Per-code int64 sum of integer `values` (float64 accumulation is exact below 2**53 cents)."""
+    return np.bincount(codes, weights=values, minlength=size).round().astype(np.int64)
+
+
+def group_count(codes: np.ndarray, size: int) -> np.ndarray:
+    return np.bincount(codes, minlength=size)
+
+
+def group_median(codes: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Per-code float64 median of `values` (0 for empty codes), from one lexsort."""
+    counts = group_count(codes, size)
+    ordered = values[np.lexsort((values, codes))].astype(np.float64)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+    lo = np.where(present, starts + (counts - 1) // 2, 0)
+    hi = np.where(present, starts + counts // 2, 0)
+    if not len(ordered):
+        return np.zeros(size, dtype=np.float64)
+    return np.where(present, (ordered[lo] + ordered[hi]) / 2.0, 0.0)
+
+
+def month_codes(day: np.ndarray) -> np.ndarray:
+    """Months since 1970-01 for date ordinals; `month_start` maps a code back to its first day."""
+    if not len(day):
+        return np.zeros(0, dtype=np.int64)
+    # Convert each distinct day in the span once, then gather: rows far outnumber days.
+    first = int(day.min())
+    span = np.arange(first, int(day.max()) + 1, dtype=np.int64) - _EPOCH_ORDINAL
+    table = span.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    return table[day - first]
+
+
+def month_start(code: int) -> date:
+    return date(1970 + code // 12, code % 12 + 1, 1)
+
+
+def cents_to_float(cents: Any) -> float:
+    return round(int(cents) / 100, 2)
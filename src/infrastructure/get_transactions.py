@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Any, Iterable
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 from pydantic import ValidationError
 
@@ -9,6 +14,55 @@ from domain.models import Transaction
 from domain.schemas import TransactionQuery
 from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
 from infrastructure.ledger_providers.provider import Provider
+from infrastructure.ledger_providers.range_cache import CachedProvider
+from infrastructure.transaction_filters import TransactionPredicate, compile_transaction_filters
+from logs import get_logger
+
+logger = get_logger("GetTransactions")
+
+_T = TypeVar("_T")
+
+
+def _default_providers() -> list[Provider]:
+    provider: Provider = ActualLedgerProvider()
+    if os.getenv("LEDGERMIND_RANGE_CACHE", "true").strip().lower() not in {"0", "false", "no", "off"}:
+        provider = CachedProvider(provider)
+    return [provider]
+
+
+@dataclass
+class ProviderFetchError:
+    """Why one provider contributed no rows to an otherwise successful fetch."""
+
+    provider: str
+    error: str
+    error_type: str
+    timed_out: bool = False
+    elapsed_seconds: float = 0.0
+    exception: BaseException | None = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "error": self.error,
+            "error_type": self.error_type,
+            "timed_out": self.timed_out,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+@dataclass
+class TransactionFetchResult:
+    """Merged rows from every provider that answered, plus per-provider failures."""
+
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    providers: list[str] = field(default_factory=list)
+    errors: list[ProviderFetchError] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.errors)
+
 
 class GetTransactions:
     """
@@ -18,11 +72,29 @@ class GetTransactions:
     - Providers can be added/removed at runtime via add_provider/remove_provider
     - If no provider filter is passed, fetches from all registered providers
     - Supports provider-level filtering and transaction-level filtering
+    - Providers are fetched concurrently on a bounded thread pool, each with its own
+      timeout; a slow or failing provider is reported in `fetch().errors` instead of
+      failing the call, unless every selected provider fails
     """
 
-    def __init__(self, providers: Iterable[Provider] | None = None) -> None:
+    def __init__(
+        self,
+        providers: Iterable[Provider] | None = None,
+        max_workers: int | None = None,
+        provider_timeout_seconds: float | None = None,
+    ) -> None:
         self._providers: dict[str, Provider] = {}
-        for provider in providers or [ActualLedgerProvider()]:
+        self._max_workers = max(
+            1, max_workers if max_workers is not None else int(os.getenv("LEDGERMIND_PROVIDER_MAX_WORKERS", "4"))
+        )
+        self._provider_timeout = (
+            provider_timeout_seconds
+            if provider_timeout_seconds is not None
+            else float(os.getenv("LEDGERMIND_PROVIDER_TIMEOUT_SECONDS", "180"))
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        for provider in providers or _default_providers():
             self.add_provider(provider)
 
     # ---- dynamic provider management ----
@@ -35,6 +107,41 @@ class GetTransactions:
     def list_provider_names(self) -> list[str]:
         return sorted(self._providers.keys())
 
+    def sync(self) -> dict[str, str | None]:
+        """Sync every provider (see `Provider.sync`); returns data versions by provider name."""
+        versions: dict[str, str | None] = {}
+        failures: list[str] = []
+        for name, provider in list(self._providers.items()):
+            try:
+                versions[name] = provider.sync()
+            except Exception as exc:
+                logger.warning("GetTransactions sync failed provider=%s err=%s", name, exc)
+                failures.append(f"{name}: {exc}")
+        if failures:
+            raise RuntimeError(f"Provider sync failed: {'; '.join(failures)}")
+        return versions
+
+    def set_background_sync(self, enabled: bool) -> None:
+        for provider in self._providers.values():
+            provider.set_background_sync(enabled)
+
+    def reads_shared_data(self) -> bool:
+        """True when every provider reads data another process's sync keeps current."""
+        providers = list(self._providers.values())
+        return bool(providers) and all(provider.reads_shared_data() for provider in providers)
+
+    def invalidate(self) -> None:
+        for provider in self._providers.values():
+            provider.invalidate()
+
+    def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for provider in self._providers.values():
+            provider.close()
+
     def get_transactions(
         self,
         filters: TransactionQuery | dict[str, Any],
@@ -42,6 +149,9 @@ class GetTransactions:
         """
         Fetch transactions from all providers (default) or a filtered subset.
 
+        Returns the merged rows of every provider that answered; see `fetch` for the
+        per-provider error metadata of partial results.
+
         `filters` supports provider/source filters and transaction-level filters, e.g.:
           - source / providers / provider_names
           - date_range
@@ -53,17 +163,179 @@ class GetTransactions:
           - min_amount / max_amount
           - query
         """
+        return self.fetch(filters).rows
+
+    def fetch(self, filters: TransactionQuery | dict[str, Any]) -> TransactionFetchResult:
+        """
+        Like `get_transactions`, but returns a `TransactionFetchResult`.
+
+        Raises the underlying error only when every selected provider failed.
+        """
         query = self._normalize_filters(filters)
         args = query.model_dump()
         selected = self._select_providers(args)
 
+        def fetch_one(provider: Provider) -> list[dict[str, Any]]:
+            # Only post-filter what the provider did not evaluate natively.
+            handled = provider.pushdown_filters(query)
+            residual = {key: (None if key in handled else value) for key, value in args.items()}
+            predicate = self._compile_filters(residual)
+            txns = predicate.filter(provider.fetch_transactions(query))
+            return [self._serialize_transaction(txn, provider.name) for txn in txns]
+
+        results, errors = self._fan_out([(provider, lambda p=provider: fetch_one(p)) for provider in selected])
+        self._raise_if_all_failed(selected, errors)
         rows: list[dict[str, Any]] = []
         for provider in selected:
-            txns = provider.fetch_transactions(query)
-            for txn in txns:
-                if self._transaction_matches(txn, args):
-                    rows.append(self._serialize_transaction(txn, provider.name))
-        return rows
+            rows.extend(results.get(provider.name, []))
+        answered = [provider.name for provider in selected if provider.name in results]
+        return TransactionFetchResult(rows=rows, providers=answered, errors=errors)
+
+    def iter_transactions(
+        self,
+        filters: TransactionQuery | dict[str, Any],
+        include_metadata: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream the rows `get_transactions` would return without materializing them.
+
+        Providers are read one after another through `iter_transaction_batches`, and each
+        batch is filtered and serialized before the next is pulled. Unlike `fetch`, a
+        provider error propagates: rows already yielded cannot be taken back.
+        `include_metadata=False` leaves lazily decoded provider metadata untouched.
+        """
+        query = self._normalize_filters(filters)
+        args = query.model_dump()
+        for provider in self._select_providers(args):
+            handled = provider.pushdown_filters(query)
+            residual = {key: (None if key in handled else value) for key, value in args.items()}
+            predicate = self._compile_filters(residual)
+            for batch in provider.iter_transaction_batches(query):
+                for txn in predicate.filter(batch):
+                    yield self._serialize_transaction(txn, provider.name, include_metadata)
+
+    def pushdown_fields(self, filters: TransactionQuery | dict[str, Any]) -> frozenset[str]:
+        """Non-date filters set on `filters` that at least one selected provider evaluates natively."""
+        query = self._normalize_filters(filters)
+        args = query.model_dump()
+        requested = {key for key, value in args.items() if key != "date_range" and value not in (None, [], "")}
+        handled: set[str] = set()
+        for provider in self._select_providers(args):
+            handled |= provider.pushdown_filters(query)
+        return frozenset(requested & handled)
+
+    def prefetch(self, filter_sets: Iterable[TransactionQuery | dict[str, Any]]) -> "TransactionDataset":
+        """
+        Fetch once for several upcoming queries (e.g. every call in a plan).
+
+        Each selected provider is asked for the union of the requested date ranges
+        (overlapping/adjacent ranges merged); all other filters are left for the
+        returned dataset to apply locally per query.
+        """
+        queries = [self._normalize_filters(filters) for filters in filter_sets]
+        intervals = _merge_intervals([(q.date_range.start, q.date_range.end) for q in queries])
+
+        providers: dict[str, Provider] = {}
+        for query in queries:
+            for provider in self._select_providers(query.model_dump()):
+                providers[provider.name] = provider
+
+        def fetch_spans(provider: Provider) -> list[Transaction]:
+            txns: list[Transaction] = []
+            for start, end in intervals:
+                span = TransactionQuery.model_validate({"date_range": {"start": start, "end": end}})
+                txns.extend(provider.fetch_transactions(span))
+            return txns
+
+        selected = list(providers.values())
+        results, errors = self._fan_out([(provider, lambda p=provider: fetch_spans(p)) for provider in selected])
+        self._raise_if_all_failed(selected, errors)
+        # Failed providers are left out so queries that need them fall back to a live fetch.
+        entries = [(provider.name, txn) for provider in selected for txn in results.get(provider.name, [])]
+        logger.info(
+            "prefetched queries=%d providers=%d intervals=%d transactions=%d failed=%d",
+            len(queries),
+            len(results),
+            len(intervals),
+            len(entries),
+            len(errors),
+        )
+        return TransactionDataset(self, intervals, list(results), entries, errors=errors)
+
+    # ---- concurrent provider fan-out ----
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="ledgermind-provider")
+            return self._executor
+
+    def _fan_out(
+        self, calls: list[tuple[Provider, Callable[[], _T]]]
+    ) -> tuple[dict[str, _T], list[ProviderFetchError]]:
+        """
+        Run one call per provider concurrently and collect results as they complete.
+
+        - each provider's timeout counts from submission (`fetch_timeout_seconds` or the default)
+        - a timed-out call is abandoned, not interrupted; its worker frees up when it returns
+        """
+        if not calls:
+            return {}, []
+        executor = self._get_executor()
+        submitted_at = time.monotonic()
+        pending: dict[Future[_T], tuple[Provider, float]] = {}
+        for provider, call in calls:
+            timeout = provider.fetch_timeout_seconds or self._provider_timeout
+            pending[executor.submit(call)] = (provider, submitted_at + timeout)
+
+        results: dict[str, _T] = {}
+        errors: list[ProviderFetchError] = []
+        while pending:
+            wait_for = max(0.0, min(deadline for _, deadline in pending.values()) - time.monotonic())
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                provider, _ = pending.pop(future)
+                exc = future.exception()
+                if exc is None:
+                    results[provider.name] = future.result()
+                    continue
+                logger.warning("provider fetch failed provider=%s err=%s", provider.name, exc)
+                errors.append(
+                    ProviderFetchError(
+                        provider=provider.name,
+                        error=str(exc) or exc.__class__.__name__,
+                        error_type=exc.__class__.__name__,
+                        elapsed_seconds=now - submitted_at,
+                        exception=exc,
+                    )
+                )
+            for future, (provider, deadline) in list(pending.items()):
+                if now < deadline:
+                    continue
+                pending.pop(future)
+                future.cancel()
+                logger.warning("provider fetch timed out provider=%s after=%.2fs", provider.name, now - submitted_at)
+                errors.append(
+                    ProviderFetchError(
+                        provider=provider.name,
+                        error=f"timed out after {now - submitted_at:.1f}s",
+                        error_type="TimeoutError",
+                        timed_out=True,
+                        elapsed_seconds=now - submitted_at,
+                    )
+                )
+        return results, errors
+
+    def _raise_if_all_failed(self, selected: list[Provider], errors: list[ProviderFetchError]) -> None:
+        if not selected or len(errors) < len(selected):
+            return
+        first = errors[0]
+        if first.exception is not None and len(errors) == 1:
+            raise first.exception
+        summary = "; ".join(f"{err.provider}: {err.error}" for err in errors)
+        if all(err.timed_out for err in errors):
+            raise TimeoutError(f"All transaction providers timed out ({summary})")
+        raise RuntimeError(f"All transaction providers failed ({summary})")
 
     def _normalize_filters(self, filters: TransactionQuery | dict[str, Any]) -> TransactionQuery:
         if isinstance(filters, TransactionQuery):
@@ -85,82 +357,103 @@ class GetTransactions:
         return [p for name, p in self._providers.items() if name in requested_set]
 
     # ---- transaction filtering ----
+    def _compile_filters(self, args: dict[str, Any]) -> TransactionPredicate:
+        return compile_transaction_filters(args)
+
     def _transaction_matches(self, txn: Transaction, args: dict[str, Any]) -> bool:
-        if not self._match_date_range(txn, args.get("date_range")):
-            return False
+        # Single-row convenience; bulk paths compile once via _compile_filters.
+        return self._compile_filters(args)(txn)
 
-        accounts = {str(a) for a in (args.get("accounts") or [])}
-        if accounts and (txn.account_id or "") not in accounts:
-            return False
+    def _serialize_transaction(self, txn: Transaction, provider_name: str, include_metadata: bool = True) -> dict[str, Any]:
+        row = {
+            "id": txn.id,
+            "provider": provider_name,
+            "posted_on": txn.posted_on.isoformat(),
+            "description": txn.description,
+            "category": txn.category,
+            "amount": txn.value.minor_units / 100,
+            "currency": txn.value.currency,
+            "txn_type": txn.txn_type.value,
+            "account_id": txn.account_id,
+            "category_name": txn.category_name,
+            "category_group": txn.category_group,
+            "account_name": txn.account_name,
+            "payee_name": txn.payee_name,
+        }
+        if include_metadata:
+            row["metadata"] = txn.metadata
+        return row
 
-        categories = {str(c).lower() for c in (args.get("categories") or [])}
-        if categories and txn.category.lower() not in categories:
-            return False
 
-        currency = args.get("currency")
-        if currency and txn.value.currency != currency:
-            return False
+class TransactionDataset:
+    """
+    Request-scoped, already fetched transactions that answer `get_transactions` locally.
 
-        txn_type = args.get("txn_type")
-        if txn_type and txn.txn_type.value != str(txn_type):
-            return False
+    Queries outside the prefetched date ranges or providers fall back to the owning
+    `GetTransactions` so callers never receive a silently truncated result. So do
+    queries with filters a provider can push down, which read less from the source.
+    """
 
-        positive = args.get("positive")
-        if positive is True and txn.txn_type != txn.txn_type.DEBIT:
-            return False
-        if positive is False and txn.txn_type != txn.txn_type.CREDIT:
-            return False
+    def __init__(
+        self,
+        owner: GetTransactions,
+        intervals: list[tuple[date, date]],
+        provider_names: list[str],
+        entries: list[tuple[str, Transaction]],
+        errors: list[ProviderFetchError] | None = None,
+    ) -> None:
+        self._owner = owner
+        self._intervals = intervals
+        self._provider_names = set(provider_names)
+        self._entries = entries
+        self.errors = list(errors or [])
 
-        amount = float(txn.value.amount)
-        min_amount = args.get("min_amount")
-        if min_amount is not None and amount < float(min_amount):
-            return False
-        max_amount = args.get("max_amount")
-        if max_amount is not None and amount > float(max_amount):
-            return False
+    def __len__(self) -> int:
+        return len(self._entries)
 
-        query = (args.get("query") or "").strip().lower()
-        if query and query not in txn.description.lower() and query not in txn.category.lower():
+    def covers(self, query: TransactionQuery) -> bool:
+        start, end = query.date_range.start, query.date_range.end
+        if not any(lo <= start and end <= hi for lo, hi in self._intervals):
             return False
+        selected = {p.name for p in self._owner._select_providers(query.model_dump())}
+        return selected <= self._provider_names and not self._owner.pushdown_fields(query)
 
-        return True
+    def get_transactions(self, filters: TransactionQuery | dict[str, Any]) -> list[dict[str, Any]]:
+        query = self._owner._normalize_filters(filters)
+        if not self.covers(query):
+            logger.info("prefetched dataset does not cover query; fetching from providers")
+            return self._owner.get_transactions(query)
+        return list(self._iter_local(query))
 
-    def _match_date_range(self, txn: Transaction, date_range: Any) -> bool:
-        if not isinstance(date_range, dict):
-            return True
-        start = self._parse_date(date_range.get("start"))
-        end = self._parse_date(date_range.get("end"))
-        if start and txn.posted_on < start:
-            return False
-        if end and txn.posted_on > end:
-            return False
-        return True
-
-    def _parse_date(self, value: Any) -> date | None:
-        if value is None:
-            return None
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            try:
-                return date.fromisoformat(value)
-            except ValueError:
-                return None
-        return None
+    def iter_transactions(
+        self,
+        filters: TransactionQuery | dict[str, Any],
+        include_metadata: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        query = self._owner._normalize_filters(filters)
+        if not self.covers(query):
+            logger.info("prefetched dataset does not cover query; streaming from providers")
+            return self._owner.iter_transactions(query, include_metadata=include_metadata)
+        return self._iter_local(query, include_metadata)
 
-    def _serialize_transaction(self, txn: Transaction, provider_name: str) -> dict[str, Any]:
-        return {
-            "id": txn.id,
-            "provider": provider_name,
-            "posted_on": txn.posted_on.isoformat(),
-            "description": txn.description,
-            "category": txn.category,
-            "amount": float(txn.value.amount),
-            "currency": txn.value.currency,
-            "txn_type": txn.txn_type.value,
-            "account_id": txn.account_id,
-            "metadata": txn.metadata,
-        }
+    def _iter_local(self, query: TransactionQuery, include_metadata: bool = True) -> Iterator[dict[str, Any]]:
+        args = query.model_dump()
+        selected = {p.name for p in self._owner._select_providers(args)}
+        predicate = self._owner._compile_filters(args)
+        serialize = self._owner._serialize_transaction
+        for provider_name, txn in self._entries:
+            if provider_name in selected and predicate(txn):
+                yield serialize(txn, provider_name, include_metadata)
+
+
+def _merge_intervals(intervals: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
 
 
 # Singleton instance used across the codebase.
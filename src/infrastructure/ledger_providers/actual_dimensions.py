@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable
+
+from domain.models import Transaction
+
+_NO_CATEGORY = (None, None)
+
+
+def _name(value: Any) -> str | None:
+    return sys.intern(str(value)) if value else None
+
+
+class ActualDimensions:
+    """
+    Immutable id -> name snapshot of Actual's category, group, account and payee tables.
+
+    - names are interned, so every transaction that resolves to a name shares one string
+    - `version` identifies the sync state the snapshot was loaded at
+    """
+
+    __slots__ = ("version", "_categories", "_accounts", "_payees")
+
+    def __init__(
+        self,
+        version: str,
+        categories: dict[str, tuple[str | None, str | None]],
+        accounts: dict[str, str | None],
+        payees: dict[str, str | None],
+    ) -> None:
+        self.version = version
+        self._categories = categories
+        self._accounts = accounts
+        self._payees = payees
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any], version: str = "") -> "ActualDimensions":
+        """Build from `scripts/actual/get_dimensions.py` output."""
+        groups = {str(row["id"]): _name(row.get("name")) for row in payload.get("category_groups") or []}
+        categories = {
+            str(row["id"]): (_name(row.get("name")), groups.get(str(row.get("group_id"))))
+            for row in payload.get("categories") or []
+        }
+        accounts = {str(row["id"]): _name(row.get("name")) for row in payload.get("accounts") or []}
+        payees = {str(row["id"]): _name(row.get("name")) for row in payload.get("payees") or []}
+        return cls(version, categories, accounts, payees)
+
+    def __len__(self) -> int:
+        return len(self._categories) + len(self._accounts) + len(self._payees)
+
+    def category(self, category_id: str | None) -> tuple[str | None, str | None]:
+        """`(category name, group name)`; `(None, None)` when unknown."""
+        return self._categories.get(category_id, _NO_CATEGORY) if category_id else _NO_CATEGORY
+
+    def account(self, account_id: str | None) -> str | None:
+        return self._accounts.get(account_id) if account_id else None
+
+    def payee(self, payee_id: str | None) -> str | None:
+        return self._payees.get(payee_id) if payee_id else None
+
+    def annotate(self, transactions: Iterable[Transaction], payee_ids: Iterable[str | None] | None = None) -> None:
+        """
+        Fill name fields on already normalized transactions in one pass.
+
+        `payee_ids` runs parallel to `transactions`; without it payee names are left as-is.
+        """
+        categories = self._categories
+        accounts = self._accounts
+        payees = self._payees
+        txns = list(transactions)
+        for txn in txns:
+            txn.category_name, txn.category_group = categories.get(txn.category, _NO_CATEGORY)
+            txn.account_name = accounts.get(txn.account_id) if txn.account_id else None
+        if payee_ids is not None:
+            for txn, payee_id in zip(txns, payee_ids):
+                txn.payee_name = payees.get(payee_id) if payee_id else None
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import json
+import operator
 import os
 import sys
+import threading
+import time
+from contextlib import nullcontext
 from datetime import date
-from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from domain.actual_schemas import ActualBudgetMonth
 from domain.models import Money, Transaction, TransactionType
 from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_dimensions import ActualDimensions
 from infrastructure.ledger_providers.provider import Provider
+from infrastructure.persistence.budget_month_cache import BudgetMonthCache
+from infrastructure.persistence.transaction_mirror import TransactionMirror
 from logs import get_logger
 
 logger = get_logger("ActualProvider")
@@ -22,17 +28,79 @@ class ActualProviderError(RuntimeError):
 
 
 class ActualLedgerProvider(Provider):
-    """Adapter for pulling data from Actual via Python bridge helpers."""
+    """
+    Adapter for pulling data from Actual via Python bridge helpers.
+
+    Modes (`mode` argument or ACTUAL_PROVIDER_MODE):
+    - live: every fetch queries the Actual budget through the bridge
+    - mirror: fetches read a local SQLite mirror that is synced incrementally from
+      the session pool's change journal (full reload when the journal cannot answer,
+      i.e. after a process restart or an idle recycle past ACTUAL_SESSION_MAX_IDLE_SECONDS)
+    - sqlite: fetches read the budget's local `db.sqlite` directly (ACTUAL_SQLITE_PATH,
+      default ACTUAL_DATA_DIR/db.sqlite) with date and account predicates in SQL; the
+      session pool, when enabled, keeps that file downloaded and synced
+    - bridge: same reads as live, but served by a long-running bridge worker
+      (`scripts/actual/bridge_server.py`) over ACTUAL_BRIDGE_SOCKET, so the warm pool is
+      shared by every API process instead of one per process
+
+    Category, group, account and payee names are resolved from an ActualDimensions
+    snapshot that is reloaded only when those tables change (pool change journal, or the
+    sqlite file's version); without a pool it is refreshed every
+    ACTUAL_DIMENSIONS_REFRESH_SECONDS. ACTUAL_RESOLVE_NAMES=false turns this off.
+
+    `fetch_budget_months` keeps closed months in a persistent BudgetMonthCache
+    (ACTUAL_BUDGET_CACHE_PATH, default ACTUAL_DATA_DIR/ledgermind_budget_months.sqlite).
+    """
 
     name = "actual"
+    # Currency lives in raw_synced_data JSON, so it is always post-filtered.
+    supported_filters = frozenset(
+        {"date_range", "accounts", "categories", "txn_type", "positive", "min_amount", "max_amount", "query"}
+    )
 
     def __init__(
         self,
         timeout_seconds: float | None = None,
+        session_pool: Any | None = None,
+        use_session_pool: bool | None = None,
+        mode: str | None = None,
+        mirror: TransactionMirror | None = None,
+        budget_cache: BudgetMonthCache | None = None,
+        resolve_names: bool | None = None,
+        bridge_client: Any | None = None,
     ) -> None:
         repo_root = Path(__file__).resolve().parents[3]
         self._repo_root = repo_root
         self._timeout_seconds = timeout_seconds or float(os.getenv("ACTUAL_SCRIPT_TIMEOUT_SECONDS", "120"))
+        if use_session_pool is None:
+            use_session_pool = os.getenv("ACTUAL_SESSION_POOL", "true").strip().lower() not in {"0", "false", "no", "off"}
+        self._use_session_pool = use_session_pool
+        # Resolved lazily so constructing the provider never imports actualpy helpers.
+        self._session_pool = session_pool
+        self._mode = (mode or os.getenv("ACTUAL_PROVIDER_MODE", "live")).strip().lower()
+        if self._mode not in {"live", "mirror", "sqlite", "bridge"}:
+            raise ActualProviderError(f"Unsupported Actual provider mode: {self._mode!r}")
+        self._mirror = mirror
+        self._mirror_refresh_seconds = float(os.getenv("ACTUAL_MIRROR_REFRESH_SECONDS", "30"))
+        self._mirror_checked_at: float | None = None
+        self._mirror_lock = threading.Lock()
+        self._sqlite_reader: Any | None = None
+        self._bridge_client = bridge_client
+        self._background_sync = False
+        self._budget_cache = budget_cache
+        self._use_budget_cache = budget_cache is not None or (
+            os.getenv("ACTUAL_BUDGET_MONTH_CACHE", "true").strip().lower() not in {"0", "false", "no", "off"}
+        )
+        if resolve_names is None:
+            resolve_names = os.getenv("ACTUAL_RESOLVE_NAMES", "true").strip().lower() not in {"0", "false", "no", "off"}
+        self._resolve_names = resolve_names
+        self._dimensions: ActualDimensions | None = None
+        self._dimensions_cursor: str | None = None
+        self._dimensions_checked_at: float | None = None
+        self._dimensions_refresh_seconds = float(os.getenv("ACTUAL_DIMENSIONS_REFRESH_SECONDS", "300"))
+        self._dimensions_lock = threading.Lock()
+        self._stream_batch_size = max(1, int(os.getenv("ACTUAL_STREAM_BATCH_SIZE", "1000")))
+        self._date_cache: dict[Any, date] = {}
 
     def fetch_budget_month(self, month: str) -> ActualBudgetMonth:
         logger.info(
@@ -52,17 +120,64 @@ class ActualLedgerProvider(Provider):
         logger.info("Actual provider received budget month payload type=%s", type(budget_month).__name__)
         return budget_month
 
+    def fetch_budget_months(self, months: list[str]) -> dict[str, ActualBudgetMonth]:
+        """
+        Fetch several budget months with one client session, keyed by YYYY-MM.
+
+        - months before the previous month are closed: served from the budget cache once stored
+        - the current and previous month (and any future month) are always refetched
+        """
+        requested = list(dict.fromkeys(months))
+        if not requested:
+            return {}
+        oldest_open = _previous_month(date.today())
+        closed = [month for month in requested if month < oldest_open]
+        cache = self._get_budget_cache()
+        budget_file = self._budget_file_key()
+        payloads = cache.get_many(budget_file, closed) if cache is not None and closed else {}
+        missing = [month for month in requested if month not in payloads]
+        logger.info(
+            "Actual provider budget months requested=%d cached=%d fetching=%s",
+            len(requested),
+            len(payloads),
+            missing,
+        )
+        if missing:
+            try:
+                fetched = self._fetch_budget_months_via_python(missing)
+            except Exception as exc:
+                raise ActualProviderError(f"Actual python bridge failed for budget months {missing}: {exc}") from exc
+            payloads.update(fetched)
+            if cache is not None:
+                cache.put_many(budget_file, {month: fetched[month] for month in closed if month in fetched})
+
+        budget_months: dict[str, ActualBudgetMonth] = {}
+        for month in requested:
+            try:
+                budget_months[month] = ActualBudgetMonth.model_validate(payloads[month])
+            except Exception as exc:
+                raise ActualProviderError(
+                    f"Actual bridge payload for {month} did not match ActualBudgetMonth schema: {exc}"
+                ) from exc
+        return budget_months
+
     def fetch_transactions(self, _filter: TransactionQuery) -> list[Transaction]:
         date_range = _filter.date_range
         start_str = date_range.start.isoformat()
         end_str = date_range.end.isoformat()
+        if self._mode == "mirror":
+            return self._fetch_transactions_from_mirror(date_range.start, date_range.end)
+        if self._mode == "sqlite":
+            return [txn for batch in self._iter_sqlite_batches(_filter) for txn in batch]
+        pushdown = self._pushdown_args(_filter)
         logger.info(
-            "Actual provider calling transactions bridge (python) start=%s end=%s",
+            "Actual provider calling transactions bridge (python) start=%s end=%s pushdown=%s",
             start_str,
             end_str,
+            sorted(pushdown),
         )
         try:
-            rows = self._fetch_transactions_via_python(date_range.start, date_range.end)
+            rows = self._fetch_transactions_via_python(date_range.start, date_range.end, pushdown)
         except Exception as exc:
             raise ActualProviderError(
                 f"Actual python bridge failed for transactions {start_str}..{end_str}: {exc}"
@@ -71,11 +186,360 @@ class ActualLedgerProvider(Provider):
         if not isinstance(rows, list):
             raise ActualProviderError(f"Expected transaction rows list from bridge, got {type(rows).__name__}")
 
-        transactions = [self._normalize_transaction_row(row) for row in rows if isinstance(row, dict)]
+        dimensions = self.dimensions()
+        transactions = [self._normalize_transaction_row(row, dimensions) for row in rows if isinstance(row, dict)]
         logger.info("Actual provider normalized transactions count=%d", len(transactions))
         return transactions
 
+    def iter_transaction_batches(self, _filter: TransactionQuery) -> Iterator[list[Transaction]]:
+        """Stream normalized rows batch by batch from the bridge cursor (or the mirror)."""
+        date_range = _filter.date_range
+        if self._mode == "mirror":
+            self.sync_mirror()
+            dimensions = self.dimensions()
+            for batch in self._get_mirror().iter_query(date_range.start, date_range.end, self._stream_batch_size):
+                if dimensions is not None:
+                    dimensions.annotate(batch)
+                yield batch
+            return
+        if self._mode == "sqlite":
+            yield from self._iter_sqlite_batches(_filter)
+            return
+        pushdown = self._pushdown_args(_filter)
+        logger.info(
+            "Actual provider streaming transactions bridge (python) start=%s end=%s pushdown=%s",
+            date_range.start.isoformat(),
+            date_range.end.isoformat(),
+            sorted(pushdown),
+        )
+        iter_transactions = self._import_stream_bridge()
+        # Resolved before the checkout below: loading names may need a pooled client itself.
+        dimensions = self.dimensions()
+        count = 0
+        with self._checkout_client() as actual:
+            batches = iter_transactions(
+                date_range.start,
+                date_range.end,
+                actual=actual,
+                filters=pushdown,
+                batch_size=self._stream_batch_size,
+            )
+            try:
+                while True:
+                    try:
+                        rows = next(batches, None)
+                    except Exception as exc:
+                        raise ActualProviderError(
+                            f"Actual python bridge failed streaming transactions "
+                            f"{date_range.start.isoformat()}..{date_range.end.isoformat()}: {exc}"
+                        ) from exc
+                    if rows is None:
+                        break
+                    batch = [self._normalize_transaction_row(row, dimensions) for row in rows if isinstance(row, dict)]
+                    count += len(batch)
+                    yield batch
+            finally:
+                # Release the bridge cursor before the client goes back to the pool.
+                batches.close()
+        logger.info("Actual provider streamed transactions count=%d", count)
+
+    def pushdown_filters(self, query: TransactionQuery) -> frozenset[str]:
+        if self._mode == "mirror":
+            return frozenset({"date_range"})
+        if self._mode == "sqlite":
+            return frozenset({"date_range", "accounts"})
+        handled = self.supported_filters
+        # SQLite lower() only folds ASCII; keep non-ASCII text search in Python for exact parity.
+        if query.query and not query.query.isascii():
+            handled = handled - {"query"}
+        return handled
+
+    def _pushdown_args(self, query: TransactionQuery) -> dict[str, Any]:
+        handled = self.pushdown_filters(query) - {"date_range"}
+        args = query.model_dump()
+        return {name: args[name] for name in sorted(handled) if args.get(name) not in (None, [], "")}
+
+    def sync_mirror(self, force: bool = False) -> None:
+        """Bring the local mirror up to date; skipped while the last check is fresher than the refresh interval."""
+        mirror = self._get_mirror()
+        with self._mirror_lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._mirror_checked_at is not None
+                and now - self._mirror_checked_at < self._mirror_refresh_seconds
+            ):
+                return
+            fetch_all_transactions, fetch_transactions_by_ids = self._import_mirror_bridge()
+            pool = self._get_session_pool()
+            try:
+                with self._checkout_client() as actual:
+                    cursor: str | None = None
+                    changed_ids: list[str] | None = None
+                    if pool is not None:
+                        cursor, changed_ids = pool.changes_since(mirror.get_state("cursor"), "transactions")
+                    if changed_ids is None:
+                        rows = fetch_all_transactions(actual=actual)
+                    elif changed_ids:
+                        rows = fetch_transactions_by_ids(changed_ids, actual=actual)
+                    else:
+                        rows = []
+            except Exception as exc:
+                raise ActualProviderError(f"Actual python bridge failed while syncing mirror: {exc}") from exc
+
+            upserts, tombstones = self._split_mirror_rows(rows)
+            if changed_ids:
+                # Ids that vanished from the budget entirely are retired as tombstones too.
+                seen = {txn.id for txn in upserts} | set(tombstones)
+                tombstones.extend(txn_id for txn_id in changed_ids if txn_id not in seen)
+            mirror.apply(
+                upserts,
+                tombstones,
+                replace=changed_ids is None,
+                state={"cursor": cursor} if cursor else None,
+            )
+            self._mirror_checked_at = now
+            logger.info(
+                "Actual provider mirror synced full=%s upserts=%d tombstones=%d",
+                changed_ids is None,
+                len(upserts),
+                len(tombstones),
+            )
+
+    def _fetch_transactions_from_mirror(self, start_date: date, end_date: date) -> list[Transaction]:
+        self.sync_mirror()
+        transactions = self._get_mirror().query(start_date, end_date)
+        dimensions = self.dimensions()
+        if dimensions is not None:
+            # The mirror keeps payee ids only inside the lazy metadata, so payee names are not filled here.
+            dimensions.annotate(transactions)
+        logger.info(
+            "Actual provider read mirror start=%s end=%s count=%d",
+            start_date.isoformat(),
+            end_date.isoformat(),
+            len(transactions),
+        )
+        return transactions
+
+    def _get_mirror(self) -> TransactionMirror:
+        if self._mirror is None:
+            raw_path = os.getenv("ACTUAL_MIRROR_PATH")
+            if raw_path:
+                path = Path(raw_path)
+            else:
+                path = Path(os.getenv("ACTUAL_DATA_DIR") or ".actual-cache") / "ledgermind_mirror.sqlite"
+            if not path.is_absolute():
+                path = self._repo_root / path
+            self._mirror = TransactionMirror(path, metadata_loader=_ActualRowMetadata.from_record)
+        return self._mirror
+
+    def _iter_sqlite_batches(self, _filter: TransactionQuery) -> Iterator[list[Transaction]]:
+        date_range = _filter.date_range
+        start_str = date_range.start.isoformat()
+        end_str = date_range.end.isoformat()
+        reader = self._get_sqlite_reader()
+        if self._use_session_pool:
+            # Checking a client out downloads the budget on first use and syncs it when stale.
+            with self._checkout_client():
+                pass
+        logger.info(
+            "Actual provider reading local sqlite path=%s start=%s end=%s accounts=%d",
+            reader.db_path,
+            start_str,
+            end_str,
+            len(_filter.accounts or []),
+        )
+        batches = reader.iter_batches(
+            date_range.start,
+            date_range.end,
+            _filter.accounts,
+            self._stream_batch_size,
+            dimensions=self.dimensions(),
+        )
+        count = 0
+        try:
+            while True:
+                try:
+                    batch = next(batches, None)
+                except Exception as exc:
+                    raise ActualProviderError(
+                        f"Actual sqlite read failed for transactions {start_str}..{end_str}: {exc}"
+                    ) from exc
+                if batch is None:
+                    break
+                count += len(batch)
+                yield batch
+        finally:
+            batches.close()
+        logger.info("Actual provider read sqlite transactions count=%d", count)
+
+    def dimensions(self) -> ActualDimensions | None:
+        """
+        Current name snapshot, reloaded when the dimension tables changed.
+
+        Returns the previous snapshot (or None) when loading fails; names are an
+        enrichment and never fail a transaction fetch.
+        """
+        if not self._resolve_names:
+            return None
+        with self._dimensions_lock:
+            now = time.monotonic()
+            try:
+                stale, version = self._dimensions_state(now)
+            except Exception as exc:
+                logger.warning("Actual provider could not check dimension version err=%s", exc)
+                return self._dimensions
+            if not stale:
+                return self._dimensions
+            if (
+                self._dimensions_checked_at is not None
+                and self._dimensions is None
+                and now - self._dimensions_checked_at < self._dimensions_refresh_seconds
+            ):
+                # Last load failed; do not retry on every fetch.
+                return None
+            self._dimensions_checked_at = now
+            try:
+                payload = self._load_dimensions_payload()
+            except Exception as exc:
+                logger.warning("Actual provider could not load dimension tables err=%s", exc)
+                return self._dimensions
+            journal = self._change_journal() if self._mode != "sqlite" else None
+            if journal is not None:
+                # The load's own checkout may have opened a client (new journal generation).
+                version, _ = journal.changes_since(None, _DIMENSION_TABLES[0])
+            self._dimensions = ActualDimensions.from_payload(payload, version)
+            self._dimensions_cursor = version
+            logger.info("Actual provider loaded dimensions entries=%d version=%s", len(self._dimensions), version)
+            return self._dimensions
+
+    def _dimensions_state(self, now: float) -> tuple[bool, str]:
+        """`(stale, version)` for the loaded snapshot."""
+        if self._mode == "sqlite":
+            version = self._get_sqlite_reader().version()
+            return self._dimensions is None or self._dimensions.version != version, version
+        journal = self._change_journal()
+        if journal is not None:
+            stale = self._dimensions is None
+            cursor = self._dimensions_cursor
+            version = cursor or ""
+            for table in _DIMENSION_TABLES:
+                version, changed = journal.changes_since(cursor, table)
+                stale = stale or changed is None or bool(changed)
+            if not stale:
+                # Nothing relevant changed; move the cursor so the journal window stays short.
+                self._dimensions_cursor = version
+            return stale, version
+        stale = (
+            self._dimensions is None
+            or self._dimensions_checked_at is None
+            or now - self._dimensions_checked_at >= self._dimensions_refresh_seconds
+        )
+        return stale, f"t{now:.0f}"
+
+    def _load_dimensions_payload(self) -> dict[str, Any]:
+        if self._mode == "sqlite":
+            return self._get_sqlite_reader().fetch_dimensions()
+        if self._mode == "bridge":
+            return self._get_bridge_client().fetch_dimensions()
+        if str(self._repo_root) not in sys.path:
+            sys.path.insert(0, str(self._repo_root))
+        try:
+            from scripts.actual.get_dimensions import fetch_dimensions
+        except Exception as exc:
+            raise ActualProviderError(f"Unable to import Python Actual bridge modules: {exc}") from exc
+        error: Exception | None = None
+        with self._checkout_client() as actual:
+            try:
+                payload = fetch_dimensions(actual=actual)
+            except Exception as exc:
+                # Caught inside the checkout so the pooled client is kept, not discarded.
+                error = exc
+        if error is not None:
+            raise error
+        if not isinstance(payload, dict):
+            raise ActualProviderError(f"Expected dict dimensions payload from python bridge, got {type(payload).__name__}")
+        return payload
+
+    def _get_sqlite_reader(self) -> Any:
+        if self._sqlite_reader is None:
+            # Imported here: the reader module reuses this module's row metadata helpers.
+            from infrastructure.ledger_providers.actual_sqlite import ActualSQLiteReader
+
+            raw_path = os.getenv("ACTUAL_SQLITE_PATH")
+            if raw_path:
+                path = Path(raw_path)
+            else:
+                path = Path(os.getenv("ACTUAL_DATA_DIR") or ".actual-cache") / "db.sqlite"
+            if not path.is_absolute():
+                path = self._repo_root / path
+            ensure_index = os.getenv("ACTUAL_SQLITE_ENSURE_INDEX", "false").strip().lower() not in {"", "0", "false", "no", "off"}
+            self._sqlite_reader = ActualSQLiteReader(path, provider_name=self.name, ensure_index=ensure_index)
+        return self._sqlite_reader
+
+    def _get_bridge_client(self) -> Any:
+        if self._bridge_client is None:
+            if str(self._repo_root) not in sys.path:
+                sys.path.insert(0, str(self._repo_root))
+            try:
+                from scripts.actual.bridge_client import ActualBridgeClient
+            except Exception as exc:
+                raise ActualProviderError(f"Unable to import Actual bridge client: {exc}") from exc
+            self._bridge_client = ActualBridgeClient()
+        return self._bridge_client
+
+    def _change_journal(self) -> Any | None:
+        """Whatever answers `changes_since`: the local pool, or the bridge worker's pool."""
+        if self._mode == "bridge":
+            return self._get_bridge_client()
+        return self._get_session_pool()
+
+    def _get_budget_cache(self) -> BudgetMonthCache | None:
+        if not self._use_budget_cache:
+            return None
+        if self._budget_cache is None:
+            raw_path = os.getenv("ACTUAL_BUDGET_CACHE_PATH")
+            if raw_path:
+                path = Path(raw_path)
+            else:
+                path = Path(os.getenv("ACTUAL_DATA_DIR") or ".actual-cache") / "ledgermind_budget_months.sqlite"
+            if not path.is_absolute():
+                path = self._repo_root / path
+            self._budget_cache = BudgetMonthCache(path)
+        return self._budget_cache
+
+    def _budget_file_key(self) -> str:
+        # Same lookup order as the bridge's open_actual_client.
+        return os.getenv("ACTUAL_FILE") or os.getenv("ACTUAL_SYNC_ID") or "default"
+
+    def _split_mirror_rows(self, rows: Any) -> tuple[list[Transaction], list[str]]:
+        if not isinstance(rows, list):
+            raise ActualProviderError(f"Expected transaction rows list from bridge, got {type(rows).__name__}")
+        upserts: list[Transaction] = []
+        tombstones: list[str] = []
+        for row in rows:
+            if not isinstance(row, dict) or row.get("id") is None:
+                continue
+            # Parents of split transactions are hidden from reads, same as the live path.
+            if row.get("tombstone") or row.get("is_parent") or not row.get("date"):
+                tombstones.append(str(row["id"]))
+                continue
+            upserts.append(self._normalize_transaction_row(row))
+        return upserts, tombstones
+
+    def _import_mirror_bridge(self) -> tuple[Any, Any]:
+        if str(self._repo_root) not in sys.path:
+            sys.path.insert(0, str(self._repo_root))
+        try:
+            from scripts.actual.get_transactions import fetch_all_transactions, fetch_transactions_by_ids
+        except Exception as exc:
+            raise ActualProviderError(f"Unable to import Python Actual bridge modules: {exc}") from exc
+        return fetch_all_transactions, fetch_transactions_by_ids
+
     def _import_actualpy_bridge(self) -> tuple[Any, Any]:
+        if self._mode == "bridge":
+            client = self._get_bridge_client()
+            return client.fetch_budget_month, client.fetch_transactions
         if str(self._repo_root) not in sys.path:
             sys.path.insert(0, str(self._repo_root))
         try:
@@ -85,80 +549,169 @@ class ActualLedgerProvider(Provider):
             raise ActualProviderError(f"Unable to import Python Actual bridge modules: {exc}") from exc
         return fetch_budget_month, fetch_transactions
 
+    def _import_stream_bridge(self) -> Any:
+        if self._mode == "bridge":
+            return self._get_bridge_client().iter_transactions
+        if str(self._repo_root) not in sys.path:
+            sys.path.insert(0, str(self._repo_root))
+        try:
+            from scripts.actual.get_transactions import iter_transactions
+        except Exception as exc:
+            raise ActualProviderError(f"Unable to import Python Actual bridge modules: {exc}") from exc
+        return iter_transactions
+
+    def sync(self) -> str | None:
+        """
+        Sync the pooled budget now and return the pool's data version.
+
+        Opens (downloads) a client when none is idle; in mirror mode the mirror is
+        brought up to date too. Without a session pool nothing is kept locally (None).
+        In bridge mode the worker's pool is synced instead.
+        """
+        if self._mode == "bridge":
+            try:
+                return self._get_bridge_client().sync().get("data_version")
+            except Exception as exc:
+                raise ActualProviderError(f"Actual bridge worker sync failed: {exc}") from exc
+        pool = self._get_session_pool()
+        if pool is None:
+            return None
+        if pool.sync_all() == 0:
+            with pool.session():
+                pass
+        if self._mode == "mirror":
+            self.sync_mirror(force=True)
+        return pool.data_version
+
+    def set_background_sync(self, enabled: bool) -> None:
+        self._background_sync = enabled
+        if self._session_pool is not None:
+            self._session_pool.sync_on_checkout = not enabled
+
+    def reads_shared_data(self) -> bool:
+        # sqlite and mirror modes read files a standalone sync worker keeps current; live and
+        # bridge reads go through a session this process (or its bridge) must sync itself.
+        return self._mode in {"sqlite", "mirror"}
+
+    def close(self) -> None:
+        if self._session_pool is not None:
+            self._session_pool.close()
+            self._session_pool = None
+
+    def _get_session_pool(self) -> Any | None:
+        # In bridge mode the worker owns the pool; nothing is opened in this process.
+        if not self._use_session_pool or self._mode == "bridge":
+            return None
+        if self._session_pool is None:
+            if str(self._repo_root) not in sys.path:
+                sys.path.insert(0, str(self._repo_root))
+            try:
+                from scripts.actual._session_pool import get_default_pool
+            except Exception as exc:
+                raise ActualProviderError(f"Unable to import Actual session pool: {exc}") from exc
+            self._session_pool = get_default_pool()
+            if self._background_sync:
+                self._session_pool.sync_on_checkout = False
+        return self._session_pool
+
+    def _checkout_client(self) -> Any:
+        pool = self._get_session_pool()
+        if pool is None:
+            # Bridge helpers open a one-shot client when handed None.
+            return nullcontext(None)
+        return pool.session()
+
     def _fetch_budget_month_via_python(self, month: str) -> dict[str, Any]:
         fetch_budget_month, _ = self._import_actualpy_bridge()
-        payload = fetch_budget_month(month)
+        with self._checkout_client() as actual:
+            payload = fetch_budget_month(month, actual=actual)
         if not isinstance(payload, dict):
             raise ActualProviderError(f"Expected dict budget payload from python bridge, got {type(payload).__name__}")
         return payload
 
-    def _fetch_transactions_via_python(self, start_date: date, end_date: date) -> list[dict[str, Any]]:
+    def _fetch_budget_months_via_python(self, months: list[str]) -> dict[str, dict[str, Any]]:
+        if self._mode == "bridge":
+            fetch_budget_months = self._get_bridge_client().fetch_budget_months
+        else:
+            if str(self._repo_root) not in sys.path:
+                sys.path.insert(0, str(self._repo_root))
+            try:
+                from scripts.actual.get_budget_month import fetch_budget_months
+            except Exception as exc:
+                raise ActualProviderError(f"Unable to import Python Actual bridge modules: {exc}") from exc
+        with self._checkout_client() as actual:
+            payloads = fetch_budget_months(months, actual=actual)
+        if not isinstance(payloads, dict):
+            raise ActualProviderError(f"Expected dict budget payloads from python bridge, got {type(payloads).__name__}")
+        return payloads
+
+    def _fetch_transactions_via_python(
+        self,
+        start_date: date,
+        end_date: date,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
         _, fetch_transactions = self._import_actualpy_bridge()
-        rows = fetch_transactions(start_date, end_date)
+        with self._checkout_client() as actual:
+            rows = fetch_transactions(start_date, end_date, actual=actual, filters=filters or {})
         if not isinstance(rows, list):
             raise ActualProviderError(f"Expected list transaction payload from python bridge, got {type(rows).__name__}")
         return rows
 
-    def _normalize_transaction_row(self, row: dict[str, Any]) -> Transaction:
+    def _normalize_transaction_row(self, row: dict[str, Any], dimensions: ActualDimensions | None = None) -> Transaction:
         amount_minor = int(row.get("amount", 0))
         txn_type = TransactionType.CREDIT if amount_minor > 0 else TransactionType.DEBIT
-        amount_major = (Decimal(abs(amount_minor)) / Decimal("100")).quantize(Decimal("0.01"))
 
-        raw_synced = self._parse_raw_synced_data(row.get("raw_synced_data"))
-        tx_amount = raw_synced.get("transactionAmount") if isinstance(raw_synced, dict) else None
-        currency = tx_amount.get("currency", "USD") if isinstance(tx_amount, dict) else "USD"
+        raw_synced = row.get("raw_synced_data")
+        currency = self._raw_synced_currency(raw_synced)
 
         description = row.get("imported_payee") or row.get("notes") or row.get("id") or "Unknown"
         posted_on = self._parse_actual_date(row.get("date"))
         account_id = str(row.get("account") or row.get("accountId") or "")
         category_id = row.get("category")
-
-        metadata: dict[str, Any] = {
-            "source_provider": self.name,
-            "source_transaction_id": row.get("id"),
-            "actual_account_id": account_id,
-            "actual_category_id": category_id,
-            "actual_payee_id": row.get("payee"),
-            "imported_id": row.get("imported_id"),
-            "imported_payee": row.get("imported_payee"),
-            "notes": row.get("notes"),
-            "cleared": row.get("cleared"),
-            "reconciled": row.get("reconciled"),
-            "transfer_id": row.get("transfer_id"),
-            "is_parent": row.get("is_parent"),
-            "is_child": row.get("is_child"),
-            "parent_id": row.get("parent_id"),
-            "starting_balance_flag": row.get("starting_balance_flag"),
-            "tombstone": row.get("tombstone"),
-            "payee_id": row.get("payee"),
-            "subtransactions": row.get("subtransactions") or [],
-        }
-        if raw_synced:
-            metadata["raw_synced_data"] = raw_synced
+        category_name = category_group = account_name = payee_name = None
+        if dimensions is not None:
+            category_name, category_group = dimensions.category(category_id)
+            account_name = dimensions.account(account_id)
+            payee_name = dimensions.payee(row.get("payee"))
 
         return Transaction(
             id=str(row.get("id")),
             posted_on=posted_on,
-            description=str(description),
-            category=str(category_id or "uncategorized"),
-            value=Money(amount=amount_major, currency=str(currency)),
+            description=sys.intern(str(description)),
+            category=sys.intern(str(category_id or "uncategorized")),
+            value=Money.from_minor(abs(amount_minor), str(currency)),
             txn_type=txn_type,
-            account_id=account_id or None,
-            metadata=metadata,
+            account_id=sys.intern(account_id) if account_id else None,
+            metadata=_ActualRowMetadata(self.name, account_id, _row_metadata_values(row), raw_synced),
+            category_name=category_name,
+            category_group=category_group,
+            account_name=account_name,
+            payee_name=payee_name,
         )
 
+    def _raw_synced_currency(self, raw: Any) -> str:
+        # Only rows whose sync payload mentions a currency pay for a JSON parse here.
+        if isinstance(raw, str) and '"currency"' not in raw:
+            return "USD"
+        raw_synced = self._parse_raw_synced_data(raw)
+        tx_amount = raw_synced.get("transactionAmount")
+        return tx_amount.get("currency", "USD") if isinstance(tx_amount, dict) else "USD"
+
     def _parse_raw_synced_data(self, raw: Any) -> dict[str, Any]:
-        if isinstance(raw, dict):
-            return raw
-        if isinstance(raw, str) and raw:
-            try:
-                parsed = json.loads(raw)
-                return parsed if isinstance(parsed, dict) else {}
-            except json.JSONDecodeError:
-                return {}
-        return {}
+        return _parse_raw_synced_data(raw)
 
     def _parse_actual_date(self, raw_date: Any) -> date:
+        # Ledgers repeat the same few thousand days; memoize per raw value.
+        cached = self._date_cache.get(raw_date)
+        if cached is not None:
+            return cached
+        parsed = self._parse_actual_date_uncached(raw_date)
+        if len(self._date_cache) < 100_000:
+            self._date_cache[raw_date] = parsed
+        return parsed
+
+    def _parse_actual_date_uncached(self, raw_date: Any) -> date:
         value = str(raw_date or "").strip()
         if not value:
             raise ActualProviderError("Transaction row missing date")
@@ -169,3 +722,122 @@ class ActualLedgerProvider(Provider):
         if len(value) == 8 and value.isdigit():
             return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
         raise ActualProviderError(f"Unsupported Actual transaction date format: {value!r}")
+
+
+_DIMENSION_TABLES = ("categories", "category_groups", "accounts", "payees")
+
+
+def _previous_month(today: date) -> str:
+    year, month = (today.year, today.month - 1) if today.month > 1 else (today.year - 1, 12)
+    return f"{year:04d}-{month:02d}"
+
+
+def _parse_raw_synced_data(raw: Any) -> dict[str, Any]:
+    if isinstance(raw, dict):
+        return raw
+    if isinstance(raw, str) and raw:
+        try:
+            parsed = json.loads(raw)
+            return parsed if isinstance(parsed, dict) else {}
+        except json.JSONDecodeError:
+            return {}
+    return {}
+
+
+_METADATA_FIELDS = (
+    "id",
+    "category",
+    "payee",
+    "imported_id",
+    "imported_payee",
+    "notes",
+    "cleared",
+    "reconciled",
+    "transfer_id",
+    "is_parent",
+    "is_child",
+    "parent_id",
+    "starting_balance_flag",
+    "tombstone",
+    "subtransactions",
+)
+
+_metadata_values = operator.itemgetter(*_METADATA_FIELDS)
+
+
+def _row_metadata_values(row: dict[str, Any]) -> tuple[Any, ...]:
+    try:
+        return _metadata_values(row)
+    except KeyError:
+        # Sparse rows (not from the bridge's _txn_row) fall back to per-key lookups.
+        return tuple(row.get(name) for name in _METADATA_FIELDS)
+
+
+class _ActualRowMetadata:
+    """
+    Deferred `Transaction.metadata` for an Actual row.
+
+    Keeps only the source values in a tuple (and raw_synced_data as the bridge's string);
+    the metadata dict and the JSON decode happen on first access.
+    """
+
+    __slots__ = ("_provider", "_account_id", "_values", "_raw_synced")
+
+    def __init__(self, provider: str, account_id: str, values: tuple[Any, ...], raw_synced: Any) -> None:
+        # `values` follows _METADATA_FIELDS order.
+        self._provider = provider
+        self._account_id = account_id
+        self._values = values
+        self._raw_synced = raw_synced or None
+
+    def to_record(self) -> list[Any]:
+        """The undecoded inputs, JSON-serializable; `from_record` rebuilds an equal instance."""
+        return [self._provider, self._account_id, list(self._values), self._raw_synced]
+
+    @classmethod
+    def from_record(cls, record: list[Any]) -> "_ActualRowMetadata":
+        provider, account_id, values, raw_synced = record
+        return cls(provider, account_id, tuple(values), raw_synced)
+
+    def __call__(self) -> dict[str, Any]:
+        (
+            txn_id,
+            category_id,
+            payee_id,
+            imported_id,
+            imported_payee,
+            notes,
+            cleared,
+            reconciled,
+            transfer_id,
+            is_parent,
+            is_child,
+            parent_id,
+            starting_balance_flag,
+            tombstone,
+            subtransactions,
+        ) = self._values
+        metadata: dict[str, Any] = {
+            "source_provider": self._provider,
+            "source_transaction_id": txn_id,
+            "actual_account_id": self._account_id,
+            "actual_category_id": category_id,
+            "actual_payee_id": payee_id,
+            "imported_id": imported_id,
+            "imported_payee": imported_payee,
+            "notes": notes,
+            "cleared": cleared,
+            "reconciled": reconciled,
+            "transfer_id": transfer_id,
+            "is_parent": is_parent,
+            "is_child": is_child,
+            "parent_id": parent_id,
+            "starting_balance_flag": starting_balance_flag,
+            "tombstone": tombstone,
+            "payee_id": payee_id,
+            "subtransactions": subtransactions or [],
+        }
+        raw_synced = _parse_raw_synced_data(self._raw_synced)
+        if raw_synced:
+            metadata["raw_synced_data"] = raw_synced
+        return metadata
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+from contextlib import closing
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator
+
+from domain.models import Money, Transaction, TransactionType
+from infrastructure.ledger_providers.actual_dimensions import ActualDimensions
+from infrastructure.ledger_providers.actual_provider import _ActualRowMetadata, _parse_raw_synced_data
+from logs import get_logger
+
+logger = get_logger("ActualSQLiteReader")
+
+# Columns 0..14 line up with actual_provider._METADATA_FIELDS so a record slice is the lazy metadata tuple.
+# imported_id / transfer_id / subtransactions are NULL to match what the ORM bridge emits.
+# Tombstoned payees are not joined, like the ORM `payee` relationship (Payees.tombstone == 0).
+_SELECT = """
+SELECT
+    t.id,
+    t.category,
+    t.description,
+    NULL,
+    p.name,
+    t.notes,
+    t.cleared,
+    t.reconciled,
+    NULL,
+    t.isParent,
+    t.isChild,
+    t.parent_id,
+    t.starting_balance_flag,
+    t.tombstone,
+    NULL,
+    t.date,
+    t.amount,
+    t.acct,
+    t.raw_synced_data
+FROM transactions AS t
+LEFT JOIN payees AS p ON p.id = t.description AND p.tombstone = 0
+WHERE t.date BETWEEN ? AND ?
+  AND t.date IS NOT NULL
+  AND t.acct IS NOT NULL
+  AND COALESCE(t.tombstone, 0) = 0
+  AND COALESCE(t.isParent, 0) = 0
+"""
+
+_DATE_INDEX = "ledgermind_transactions_date"
+
+
+def _as_yyyymmdd(value: date) -> int:
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+class ActualSQLiteReader:
+    """
+    Reads transactions straight from the `db.sqlite` actualpy downloads into ACTUAL_DATA_DIR.
+
+    - connections are opened read-only (`mode=ro`) and the budget file is never written,
+      unless `ensure_index` opts in to a one-off date index (off by default: it changes the
+      file's mtime and size, and so `version()`, and adds a schema object Actual does not know)
+    - date range and account predicates run in SQL; only the needed columns are selected
+    - each record becomes a normalized `Transaction` in a single pass, with the same
+      fields and lazy metadata as ActualLedgerProvider's bridge path
+    """
+
+    def __init__(self, db_path: str | Path, provider_name: str = "actual", ensure_index: bool = False) -> None:
+        self._db_path = Path(db_path)
+        self._provider_name = provider_name
+        self._ensure_index = ensure_index
+        self._index_checked = False
+        self._dates: dict[int, date] = {}
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def iter_batches(
+        self,
+        start: date,
+        end: date,
+        accounts: list[str] | None = None,
+        batch_size: int = 1000,
+        dimensions: ActualDimensions | None = None,
+    ) -> Iterator[list[Transaction]]:
+        sql, params = self._query(start, end, accounts)
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(sql, params)
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    return
+                yield [self._to_transaction(record, dimensions) for record in records]
+
+    def fetch(
+        self,
+        start: date,
+        end: date,
+        accounts: list[str] | None = None,
+        dimensions: ActualDimensions | None = None,
+    ) -> list[Transaction]:
+        return [txn for batch in self.iter_batches(start, end, accounts, dimensions=dimensions) for txn in batch]
+
+    def version(self) -> str:
+        """Changes whenever the budget file is rewritten (download or sync)."""
+        stat = self._db_path.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def fetch_dimensions(self) -> dict[str, list[dict[str, Any]]]:
+        """Same shape as `scripts/actual/get_dimensions.py` output."""
+        with closing(self._connect()) as conn:
+            return {
+                "categories": [
+                    {"id": row[0], "name": row[1], "group_id": row[2]}
+                    for row in conn.execute("SELECT id, name, cat_group FROM categories")
+                ],
+                "category_groups": [
+                    {"id": row[0], "name": row[1], "is_income": bool(row[2])}
+                    for row in conn.execute("SELECT id, name, is_income FROM category_groups")
+                ],
+                "accounts": [{"id": row[0], "name": row[1]} for row in conn.execute("SELECT id, name FROM accounts")],
+                "payees": [{"id": row[0], "name": row[1]} for row in conn.execute("SELECT id, name FROM payees")],
+            }
+
+    def _query(self, start: date, end: date, accounts: list[str] | None) -> tuple[str, list[Any]]:
+        sql = _SELECT
+        params: list[Any] = [_as_yyyymmdd(start), _as_yyyymmdd(end)]
+        account_ids = [str(account) for account in accounts or []]
+        if account_ids:
+            sql += f"  AND t.acct IN ({', '.join('?' for _ in account_ids)})\n"
+            params.extend(account_ids)
+        # Same ordering as the ORM bridge.
+        sql += "ORDER BY t.date DESC, t.id"
+        return sql, params
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._db_path.exists():
+            raise FileNotFoundError(f"Actual budget database not found at {self._db_path}")
+        if self._ensure_index and not self._index_checked:
+            self._create_date_index()
+        return sqlite3.connect(f"{self._db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+    def _create_date_index(self) -> None:
+        self._index_checked = True
+        try:
+            with closing(sqlite3.connect(self._db_path, timeout=30)) as conn:
+                for _, index_name, *_ in conn.execute("PRAGMA index_list(transactions)").fetchall():
+                    columns = [row[2] for row in conn.execute(f"PRAGMA index_info({index_name!r})").fetchall()]
+                    if columns[:1] == ["date"]:
+                        return
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {_DATE_INDEX} ON transactions(date, acct)")
+                conn.commit()
+                logger.info("created date index on %s", self._db_path)
+        except sqlite3.Error as exc:
+            # A read-only file or a locked budget just means no index; the query still works.
+            logger.warning("could not ensure date index on %s err=%s", self._db_path, exc)
+
+    def _to_transaction(self, record: tuple[Any, ...], dimensions: ActualDimensions | None = None) -> Transaction:
+        raw_date = record[15]
+        posted_on = self._dates.get(raw_date)
+        if posted_on is None:
+            posted_on = self._dates[raw_date] = date(raw_date // 10000, raw_date // 100 % 100, raw_date % 100)
+        amount_minor = record[16] or 0
+        account_id = record[17]
+        raw_synced = record[18]
+        currency = "USD"
+        if raw_synced and '"currency"' in raw_synced:
+            currency = _raw_synced_currency(raw_synced)
+        description = record[4] or record[5] or record[0]
+        category_name = category_group = account_name = payee_name = None
+        if dimensions is not None:
+            category_name, category_group = dimensions.category(record[1])
+            account_name = dimensions.account(account_id)
+            payee_name = dimensions.payee(record[2])
+        return Transaction(
+            id=record[0],
+            posted_on=posted_on,
+            description=sys.intern(description),
+            category=sys.intern(record[1] or "uncategorized"),
+            value=Money.from_minor(abs(amount_minor), currency),
+            txn_type=TransactionType.CREDIT if amount_minor > 0 else TransactionType.DEBIT,
+            account_id=sys.intern(account_id) if account_id else None,
+            metadata=_ActualRowMetadata(self._provider_name, account_id, record[:15], raw_synced),
+            category_name=category_name,
+            category_group=category_group,
+            account_name=account_name,
+            payee_name=payee_name,
+        )
+
+
+def _raw_synced_currency(raw: str) -> str:
+    tx_amount = _parse_raw_synced_data(raw).get("transactionAmount")
+    return str(tx_amount.get("currency", "USD")) if isinstance(tx_amount, dict) else "USD"
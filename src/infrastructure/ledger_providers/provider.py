@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import timedelta
+from typing import Any, Iterator
 
 from domain.actual_schemas import ActualBudgetMonth
 from domain.models import Transaction
@@ -9,14 +10,86 @@ from domain.schemas import TransactionQuery
 
 
 class Provider(ABC):
-    """Base provider contract for normalized transaction sources."""
+    """
+    Base provider contract for normalized transaction sources.
+
+    `supported_filters` lists TransactionQuery fields the provider evaluates natively,
+    with exactly the semantics of GetTransactions' Python filtering. Those fields are
+    not re-checked after the fetch; everything else is post-filtered by the caller.
+
+    `fetch_timeout_seconds` overrides the aggregator's default per-provider timeout.
+    `stream_window_days` sizes the date windows of the default `iter_transaction_batches`.
+    """
 
     name: str = "provider"
+    supported_filters: frozenset[str] = frozenset()
+    fetch_timeout_seconds: float | None = None
+    stream_window_days: int = 92
 
     @abstractmethod
     def fetch_budget_month(self, month: str) -> ActualBudgetMonth:
         raise NotImplementedError()
 
+    def fetch_budget_months(self, months: list[str]) -> dict[str, ActualBudgetMonth]:
+        """Budget months keyed by YYYY-MM. Default: one `fetch_budget_month` per month."""
+        return {month: self.fetch_budget_month(month) for month in dict.fromkeys(months)}
+
     @abstractmethod
     def fetch_transactions(self, _filter: TransactionQuery) -> list[Transaction]:
         raise NotImplementedError
+
+    def iter_transaction_batches(self, _filter: TransactionQuery) -> Iterator[list[Transaction]]:
+        """
+        Stream `fetch_transactions(_filter)` as batches.
+
+        Default: one fetch per `stream_window_days` window, so only a window is held at a
+        time. Providers with a native cursor should override this.
+        """
+        start, end = _filter.date_range.start, _filter.date_range.end
+        step = timedelta(days=max(1, self.stream_window_days))
+        while start <= end:
+            window_end = min(end, start + step - timedelta(days=1))
+            date_range = _filter.date_range.model_copy(update={"start": start, "end": window_end})
+            yield self.fetch_transactions(_filter.model_copy(update={"date_range": date_range}))
+            start = window_end + timedelta(days=1)
+
+    def pushdown_filters(self, query: TransactionQuery) -> frozenset[str]:
+        """Fields of `query` this provider will evaluate natively for this particular fetch."""
+        return self.supported_filters
+
+    def sync(self) -> str | None:
+        """
+        Bring local state up to date with the source and return its data version.
+
+        Default: nothing is held locally, so there is nothing to sync (None).
+        """
+        return None
+
+    def set_background_sync(self, enabled: bool) -> None:
+        """When enabled, a background worker calls `sync()`; fetches should skip inline syncing."""
+        return None
+
+    def reads_shared_data(self) -> bool:
+        """
+        True when fetches read on-disk data that a sync in another process keeps current.
+
+        Default: False, so only this process's own `sync()` counts towards freshness.
+        """
+        return False
+
+    def invalidate(self) -> None:
+        """Drop in-process caches after another process synced the data. Default: nothing cached."""
+        return None
+
+    def close(self) -> None:
+        """Release long-lived resources (sessions, connections). Default: nothing to release."""
+        return None
+
+
+def active_filter_names(query: TransactionQuery) -> frozenset[str]:
+    """TransactionQuery fields that actually constrain rows (set and non-empty)."""
+    return frozenset(
+        name
+        for name in ("date_range", "accounts", "categories", "currency", "txn_type", "positive", "min_amount", "max_amount", "query")
+        if getattr(query, name) not in (None, [], "")
+    )
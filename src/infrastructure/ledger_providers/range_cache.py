@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Iterator
+
+from domain.actual_schemas import ActualBudgetMonth
+from domain.models import Transaction
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.provider import Provider, active_filter_names
+from logs import get_logger
+
+logger = get_logger("RangeCache")
+
+
+@dataclass
+class _Segment:
+    """A contiguous, fully fetched date interval [start, end] and its rows sorted by posted_on."""
+
+    start: date
+    end: date
+    fetched_at: float
+    transactions: list[Transaction] = field(default_factory=list)
+    ordinals: list[int] = field(default_factory=list)
+
+    def slice(self, start: date, end: date) -> list[Transaction]:
+        lo = bisect_left(self.ordinals, start.toordinal())
+        hi = bisect_right(self.ordinals, end.toordinal())
+        return self.transactions[lo:hi]
+
+
+def _sorted_segment(start: date, end: date, fetched_at: float, transactions: list[Transaction]) -> _Segment:
+    ordered = sorted(transactions, key=lambda txn: txn.posted_on)
+    return _Segment(
+        start=start,
+        end=end,
+        fetched_at=fetched_at,
+        transactions=ordered,
+        ordinals=[txn.posted_on.toordinal() for txn in ordered],
+    )
+
+
+class CachedProvider(Provider):
+    """
+    Wraps a provider with an interval-merging date-range cache.
+
+    - covered ranges are kept as disjoint segments; adjacent/overlapping ones are merged
+    - a request is answered by slicing covered segments and fetching only the missing gaps
+    - segments expire after `ttl_seconds`; the trailing `volatile_days` (today, yesterday, ...)
+      use the shorter `volatile_ttl_seconds` because they are still changing
+    - `invalidate(start, end)` drops coverage explicitly, e.g. after a sync
+
+    Cached fetches ask the inner provider for a plain date range and leave other filters
+    to the caller. Queries carrying filters the inner provider can push down bypass the
+    cache, so the narrow query runs natively instead of dragging a full window across.
+    """
+
+    def __init__(
+        self,
+        inner: Provider,
+        ttl_seconds: float | None = None,
+        volatile_days: int | None = None,
+        volatile_ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.name = inner.name
+        self.supported_filters = inner.supported_filters
+        self.fetch_timeout_seconds = inner.fetch_timeout_seconds
+        self._inner = inner
+        self._ttl = ttl_seconds if ttl_seconds is not None else float(os.getenv("LEDGERMIND_RANGE_CACHE_TTL_SECONDS", "300"))
+        self._volatile_days = (
+            volatile_days if volatile_days is not None else int(os.getenv("LEDGERMIND_RANGE_CACHE_VOLATILE_DAYS", "2"))
+        )
+        self._volatile_ttl = (
+            volatile_ttl_seconds
+            if volatile_ttl_seconds is not None
+            else float(os.getenv("LEDGERMIND_RANGE_CACHE_VOLATILE_TTL_SECONDS", "60"))
+        )
+        self._clock = clock
+        self._today = today
+        self._segments: list[_Segment] = []
+        self._lock = threading.Lock()
+        self._synced_version: str | None = None
+
+    @property
+    def inner(self) -> Provider:
+        return self._inner
+
+    def fetch_budget_month(self, month: str) -> ActualBudgetMonth:
+        return self._inner.fetch_budget_month(month)
+
+    def fetch_budget_months(self, months: list[str]) -> dict[str, ActualBudgetMonth]:
+        return self._inner.fetch_budget_months(months)
+
+    def sync(self) -> str | None:
+        version = self._inner.sync()
+        if version is not None and version != self._synced_version:
+            # New upstream data: cached ranges may be stale regardless of their TTL.
+            self.invalidate()
+            self._synced_version = version
+        return version
+
+    def set_background_sync(self, enabled: bool) -> None:
+        self._inner.set_background_sync(enabled)
+
+    def reads_shared_data(self) -> bool:
+        return self._inner.reads_shared_data()
+
+    def pushdown_filters(self, query: TransactionQuery) -> frozenset[str]:
+        inner_handled = self._inner.pushdown_filters(query)
+        if self._bypasses_cache(query, inner_handled):
+            return inner_handled
+        # Cached slices are exact on dates.
+        return frozenset({"date_range"})
+
+    def fetch_transactions(self, _filter: TransactionQuery) -> list[Transaction]:
+        if self._bypasses_cache(_filter, self._inner.pushdown_filters(_filter)):
+            return self._inner.fetch_transactions(_filter)
+        start = _filter.date_range.start
+        end = _filter.date_range.end
+        with self._lock:
+            self._expire()
+            gaps = self._gaps(start, end)
+
+        for gap_start, gap_end in gaps:
+            logger.info("range cache miss provider=%s start=%s end=%s", self.name, gap_start, gap_end)
+            fetched_at = self._clock()
+            txns = self._inner.fetch_transactions(
+                TransactionQuery.model_validate({"date_range": {"start": gap_start, "end": gap_end}})
+            )
+            with self._lock:
+                self._insert(_sorted_segment(gap_start, gap_end, fetched_at, list(txns)))
+
+        with self._lock:
+            rows = self._slice(start, end)
+        if not gaps:
+            logger.info("range cache hit provider=%s start=%s end=%s count=%d", self.name, start, end, len(rows))
+        return rows
+
+    def iter_transaction_batches(self, _filter: TransactionQuery) -> Iterator[list[Transaction]]:
+        """
+        Serve fully covered ranges from the cache; otherwise stream from the inner provider.
+
+        Streamed rows are not inserted, so long streaming scans never grow the cache.
+        """
+        if self._bypasses_cache(_filter, self._inner.pushdown_filters(_filter)):
+            yield from self._inner.iter_transaction_batches(_filter)
+            return
+        start = _filter.date_range.start
+        end = _filter.date_range.end
+        with self._lock:
+            self._expire()
+            covered = not self._gaps(start, end)
+            rows = self._slice(start, end) if covered else None
+        if rows is None:
+            span = TransactionQuery.model_validate({"date_range": {"start": start, "end": end}})
+            yield from self._inner.iter_transaction_batches(span)
+            return
+        logger.info("range cache hit provider=%s start=%s end=%s count=%d", self.name, start, end, len(rows))
+        yield rows
+
+    def invalidate(self, start: date | None = None, end: date | None = None) -> None:
+        """Drop cached coverage for [start, end] (open-ended when omitted)."""
+        with self._lock:
+            self._drop(start or date.min, end or date.max)
+
+    def covered_ranges(self) -> list[tuple[date, date]]:
+        with self._lock:
+            return [(seg.start, seg.end) for seg in self._segments]
+
+    def close(self) -> None:
+        with self._lock:
+            self._segments.clear()
+        self._inner.close()
+
+    def _bypasses_cache(self, query: TransactionQuery, inner_handled: frozenset[str]) -> bool:
+        return bool((active_filter_names(query) & inner_handled) - {"date_range"})
+
+    # ---- internals (callers hold self._lock) ----
+    def _expire(self) -> None:
+        now = self._clock()
+        self._segments = [seg for seg in self._segments if now - seg.fetched_at <= self._ttl]
+        if self._volatile_days <= 0:
+            return
+        volatile_start = self._today() - timedelta(days=self._volatile_days - 1)
+        stale = any(
+            seg.end >= volatile_start and now - seg.fetched_at > self._volatile_ttl for seg in self._segments
+        )
+        if stale:
+            self._drop(volatile_start, date.max)
+
+    def _gaps(self, start: date, end: date) -> list[tuple[date, date]]:
+        gaps: list[tuple[date, date]] = []
+        cursor = start
+        for seg in self._segments:
+            if seg.end < cursor:
+                continue
+            if seg.start > end:
+                break
+            if seg.start > cursor:
+                gaps.append((cursor, seg.start - timedelta(days=1)))
+            if seg.end >= end:
+                return gaps
+            cursor = seg.end + timedelta(days=1)
+        gaps.append((cursor, end))
+        return gaps
+
+    def _slice(self, start: date, end: date) -> list[Transaction]:
+        rows: list[Transaction] = []
+        for seg in self._segments:
+            if seg.end < start or seg.start > end:
+                continue
+            rows.extend(seg.slice(start, end))
+        return rows
+
+    def _insert(self, new: _Segment) -> None:
+        # Another thread may have filled part of this gap meanwhile; keep its rows and
+        # let the fresh fetch win only where the intervals overlap.
+        self._drop(new.start, new.end)
+        segments = sorted(self._segments + [new], key=lambda seg: seg.start)
+        merged: list[_Segment] = []
+        for seg in segments:
+            if merged and seg.start <= merged[-1].end + timedelta(days=1):
+                prev = merged[-1]
+                merged[-1] = _Segment(
+                    start=prev.start,
+                    end=max(prev.end, seg.end),
+                    fetched_at=min(prev.fetched_at, seg.fetched_at),
+                    transactions=prev.transactions + seg.transactions,
+                    ordinals=prev.ordinals + seg.ordinals,
+                )
+            else:
+                merged.append(seg)
+        self._segments = merged
+
+    def _drop(self, start: date, end: date) -> None:
+        kept: list[_Segment] = []
+        for seg in self._segments:
+            if seg.end < start or seg.start > end:
+                kept.append(seg)
+                continue
+            if seg.start < start:
+                left_end = start - timedelta(days=1)
+                kept.append(_sorted_segment(seg.start, left_end, seg.fetched_at, seg.slice(seg.start, left_end)))
+            if seg.end > end:
+                right_start = end + timedelta(days=1)
+                kept.append(_sorted_segment(right_start, seg.end, seg.fetched_at, seg.slice(right_start, seg.end)))
+        self._segments = sorted(kept, key=lambda seg: seg.start)
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from logs import get_logger
+
+logger = get_logger("LedgerSync")
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class SyncState:
+    """Outcome of the latest background sync; times are epoch seconds."""
+
+    data_version: str | None = None
+    versions: dict[str, str | None] = field(default_factory=dict)
+    last_synced_at: float | None = None
+    last_attempt_at: float | None = None
+    last_error: str | None = None
+    sync_count: int = 0
+
+    def staleness_seconds(self, now: float | None = None) -> float | None:
+        if self.last_synced_at is None:
+            return None
+        return max(0.0, (time.time() if now is None else now) - self.last_synced_at)
+
+    def is_fresh(self, max_staleness_seconds: float, now: float | None = None) -> bool:
+        staleness = self.staleness_seconds(now)
+        return staleness is not None and staleness <= max_staleness_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "SyncState":
+        known = {name: payload[name] for name in cls.__dataclass_fields__ if name in payload}
+        return cls(**known)
+
+
+def default_state_path() -> Path:
+    raw_path = os.getenv("LEDGERMIND_SYNC_STATE_PATH")
+    if raw_path:
+        path = Path(raw_path)
+    else:
+        path = Path(os.getenv("ACTUAL_DATA_DIR") or ".actual-cache") / "ledgermind_sync_state.json"
+    return path if path.is_absolute() else _REPO_ROOT / path
+
+
+def read_sync_state(path: str | Path | None = None) -> SyncState | None:
+    """State last written by any worker process, or None when there is none."""
+    try:
+        payload = json.loads(Path(path or default_state_path()).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return SyncState.from_dict(payload) if isinstance(payload, dict) else None
+
+
+class LedgerSyncWorker:
+    """
+    Syncs ledger providers off the request path.
+
+    - calls `target.sync()` (e.g. GetTransactions) every `interval_seconds`
+      (LEDGERMIND_SYNC_INTERVAL_SECONDS, default 60) and whenever `notify()` is called
+    - records a data version and last-sync time, persisted to `state_path` so other
+      processes (API next to a standalone worker) can read them
+    - while running, providers skip inline syncing (`target.set_background_sync(True)`)
+    - `ensure_fresh` lets a request demand data no older than a maximum staleness
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        interval_seconds: float | None = None,
+        state_path: str | Path | None = None,
+        persist: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._target = target
+        self._interval = max(
+            0.01,
+            interval_seconds if interval_seconds is not None else float(os.getenv("LEDGERMIND_SYNC_INTERVAL_SECONDS", "60")),
+        )
+        self._state_path = Path(state_path) if state_path is not None else default_state_path()
+        self._persist = persist
+        self._clock = clock
+        self._state = SyncState()
+        self._adopted_version: str | None = None
+        self._sync_lock = threading.Lock()
+        self._synced = threading.Condition()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def state(self) -> SyncState:
+        with self._synced:
+            return SyncState.from_dict(self._state.to_dict())
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        set_background_sync = getattr(self._target, "set_background_sync", None)
+        if callable(set_background_sync):
+            set_background_sync(True)
+        self._thread = threading.Thread(target=self._run, name="ledgermind-sync", daemon=True)
+        self._thread.start()
+        logger.info("sync worker started interval=%.0fs state_path=%s", self._interval, self._state_path)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        set_background_sync = getattr(self._target, "set_background_sync", None)
+        if callable(set_background_sync):
+            set_background_sync(False)
+        logger.info("sync worker stopped")
+
+    def notify(self) -> None:
+        """Ask the running worker to sync now instead of at the next interval."""
+        self._wake.set()
+
+    def sync_now(self) -> SyncState:
+        """Run one sync on the calling thread (serialized with the worker's own syncs)."""
+        with self._sync_lock:
+            started = self._clock()
+            error: str | None = None
+            versions: dict[str, str | None] = {}
+            try:
+                result = self._target.sync()
+                versions = dict(result) if isinstance(result, dict) else {"default": result}
+            except Exception as exc:
+                error = str(exc) or exc.__class__.__name__
+                logger.warning("sync worker sync failed err=%s", error)
+            finished = self._clock()
+            with self._synced:
+                state = self._state
+                state.last_attempt_at = finished
+                state.last_error = error
+                if error is None:
+                    state.versions = versions
+                    state.data_version = "|".join(f"{name}={version}" for name, version in sorted(versions.items()))
+                    # Data is as fresh as the moment the sync began.
+                    state.last_synced_at = started
+                    state.sync_count += 1
+                self._synced.notify_all()
+            if self._persist:
+                self._write_state()
+            if error is None:
+                logger.info("sync worker synced version=%s in %.2fs", state.data_version, finished - started)
+            return self.state
+
+    def ensure_fresh(self, max_staleness_seconds: float, timeout_seconds: float | None = None) -> bool:
+        """
+        Make sure synced data is at most `max_staleness_seconds` old, measured at call time.
+
+        A running worker is notified and awaited (up to `timeout_seconds`, default
+        LEDGERMIND_SYNC_WAIT_SECONDS=30); otherwise the sync runs inline. State written by
+        another worker process counts only when the target reads shared on-disk data
+        (`target.reads_shared_data()`, e.g. Actual sqlite or mirror mode); in-process caches
+        are then invalidated whenever that state's data version moves.
+        """
+        now = self._clock()
+        if self._known_state().is_fresh(max_staleness_seconds, now):
+            return True
+        if not self.running:
+            return self.sync_now().is_fresh(max_staleness_seconds, now)
+
+        timeout = timeout_seconds if timeout_seconds is not None else float(os.getenv("LEDGERMIND_SYNC_WAIT_SECONDS", "30"))
+        deadline = time.monotonic() + max(0.0, timeout)
+        self.notify()
+        with self._synced:
+            while (self._state.last_attempt_at or 0.0) < now:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._synced.wait(remaining)
+            return self._state.is_fresh(max_staleness_seconds, now)
+
+    def status(self) -> dict[str, Any]:
+        state = self.state
+        return {**state.to_dict(), "running": self.running, "staleness_seconds": state.staleness_seconds(self._clock())}
+
+    def _known_state(self) -> SyncState:
+        state = self.state
+        if self.running or not self._reads_shared_data():
+            return state
+        shared = read_sync_state(self._state_path)
+        if shared is None or (shared.last_synced_at or 0.0) <= (state.last_synced_at or 0.0):
+            return state
+        if shared.data_version != self._adopted_version:
+            # Another process synced the shared files; caches built from older reads are stale.
+            invalidate = getattr(self._target, "invalidate", None)
+            if callable(invalidate):
+                invalidate()
+            self._adopted_version = shared.data_version
+        return shared
+
+    def _reads_shared_data(self) -> bool:
+        reads_shared_data = getattr(self._target, "reads_shared_data", None)
+        return bool(reads_shared_data()) if callable(reads_shared_data) else False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            self.sync_now()
+            self._wake.wait(self._interval)
+
+    def _write_state(self) -> None:
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._state_path.with_name(f"{self._state_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self.state.to_dict()), encoding="utf-8")
+            os.replace(tmp_path, self._state_path)
+        except OSError as exc:
+            logger.warning("sync worker could not write state path=%s err=%s", self._state_path, exc)
+
+
+_active_worker: LedgerSyncWorker | None = None
+_active_worker_lock = threading.Lock()
+
+
+def get_sync_worker() -> LedgerSyncWorker | None:
+    return _active_worker
+
+
+def start_sync_worker(target: Any, **kwargs: Any) -> LedgerSyncWorker:
+    """Start (or return) the process-wide worker, e.g. from the API lifespan."""
+    global _active_worker
+    with _active_worker_lock:
+        if _active_worker is None:
+            _active_worker = LedgerSyncWorker(target, **kwargs)
+        _active_worker.start()
+        return _active_worker
+
+
+def stop_sync_worker() -> None:
+    global _active_worker
+    with _active_worker_lock:
+        worker, _active_worker = _active_worker, None
+    if worker is not None:
+        worker.stop()
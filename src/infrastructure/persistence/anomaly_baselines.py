@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from domain.running_stats import RunningStats
+from infrastructure.persistence.incremental_state import Watermark, claim_watermark, default_state_file
+from logs import get_logger
+
+logger = get_logger("AnomalyBaselineStore")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    scope TEXT PRIMARY KEY,
+    through TEXT NOT NULL,
+    boundary_ids TEXT NOT NULL,
+    data_version TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS baselines (
+    scope TEXT NOT NULL,
+    category TEXT NOT NULL,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (scope, category)
+);
+CREATE TABLE IF NOT EXISTS flagged (
+    scope TEXT NOT NULL,
+    transaction_id TEXT NOT NULL,
+    posted_on TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (scope, transaction_id)
+);
+CREATE INDEX IF NOT EXISTS flagged_scope_posted_on ON flagged (scope, posted_on);
+"""
+
+
+class AnomalyBaselineStore:
+    """
+    Persistent per-scope category baselines (RunningStats), watermark and flagged anomalies.
+
+    A scope is whatever the caller keys a baseline on (ledger, filters, scoring method);
+    `save` replaces a scope's watermark and touched categories in one transaction.
+    """
+
+    def __init__(self, file_path: str | Path | None = None) -> None:
+        raw_path = os.getenv("LEDGERMIND_ANOMALY_BASELINES_PATH")
+        self._file_path = Path(file_path or raw_path or default_state_file("anomaly_baselines.sqlite"))
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def load(self, scope: str) -> tuple[Watermark | None, dict[str, RunningStats]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT through, boundary_ids, data_version, updated_at FROM watermarks WHERE scope = ?", (scope,)
+            ).fetchone()
+            if row is None:
+                return None, {}
+            stats = {
+                category: RunningStats.from_dict(json.loads(payload))
+                for category, payload in conn.execute("SELECT category, stats FROM baselines WHERE scope = ?", (scope,))
+            }
+        return Watermark(row[0], json.loads(row[1]), row[2], row[3]), stats
+
+    def save(
+        self,
+        scope: str,
+        watermark: Watermark,
+        stats: dict[str, RunningStats],
+        flagged: list[dict[str, Any]] | None = None,
+        *,
+        previous: Watermark | None,
+    ) -> None:
+        """Write the scope; raises WatermarkConflict when its watermark is no longer `previous` (the one loaded)."""
+        watermark.updated_at = time.time()
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                claim_watermark(conn, scope, previous)
+                conn.execute(
+                    """
+                    INSERT INTO watermarks (scope, through, boundary_ids, data_version, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(scope) DO UPDATE SET
+                        through = excluded.through,
+                        boundary_ids = excluded.boundary_ids,
+                        data_version = excluded.data_version,
+                        updated_at = excluded.updated_at
+                    """,
+                    (scope, watermark.through, json.dumps(watermark.boundary_ids), watermark.data_version, watermark.updated_at),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO baselines (scope, category, stats) VALUES (?, ?, ?)",
+                    [(scope, category, json.dumps(entry.to_dict())) for category, entry in stats.items()],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO flagged (scope, transaction_id, posted_on, amount_cents, payload) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (scope, item["transaction_id"], item["posted_on"], round(item["amount"] * 100), json.dumps(item))
+                        for item in flagged or []
+                    ],
+                )
+        logger.info(
+            "anomaly baselines saved scope=%s through=%s categories=%d flagged=%d",
+            scope,
+            watermark.through,
+            len(stats),
+            len(flagged or []),
+        )
+
+    def flagged(self, scope: str, start: str, end: str, limit: int) -> tuple[list[dict[str, Any]], int]:
+        """Stored anomalies posted in start..end (ISO dates), largest first, and their total count."""
+        with closing(self._connect()) as conn:
+            total = conn.execute(
+                "SELECT COUNT(*) FROM flagged WHERE scope = ? AND posted_on BETWEEN ? AND ?", (scope, start, end)
+            ).fetchone()[0]
+            rows = conn.execute(
+                """
+                SELECT payload FROM flagged WHERE scope = ? AND posted_on BETWEEN ? AND ?
+                ORDER BY amount_cents DESC, posted_on, transaction_id LIMIT ?
+                """,
+                (scope, start, end, limit),
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows], int(total)
+
+    def reset(self, scope: str | None = None) -> None:
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                for table in ("watermarks", "baselines", "flagged"):
+                    if scope is None:
+                        conn.execute(f"DELETE FROM {table}")
+                    else:
+                        conn.execute(f"DELETE FROM {table} WHERE scope = ?", (scope,))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._file_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
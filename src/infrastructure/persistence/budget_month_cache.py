@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterable
+
+from logs import get_logger
+
+logger = get_logger("BudgetMonthCache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS budget_months (
+    budget_file TEXT NOT NULL,
+    month TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (budget_file, month)
+);
+"""
+
+
+class BudgetMonthCache:
+    """
+    Persistent store of raw budget-month payloads keyed by (budget file, YYYY-MM).
+
+    Only closed months belong here; callers decide which months are still open and
+    always refetch those.
+    """
+
+    def __init__(self, file_path: str | Path) -> None:
+        self._file_path = Path(file_path)
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def get_many(self, budget_file: str, months: Iterable[str]) -> dict[str, dict[str, Any]]:
+        wanted = list(dict.fromkeys(months))
+        if not wanted:
+            return {}
+        placeholders = ", ".join("?" for _ in wanted)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT month, payload FROM budget_months WHERE budget_file = ? AND month IN ({placeholders})",
+                [budget_file, *wanted],
+            ).fetchall()
+        return {month: json.loads(payload) for month, payload in rows}
+
+    def put_many(self, budget_file: str, payloads: dict[str, dict[str, Any]]) -> int:
+        if not payloads:
+            return 0
+        now = time.time()
+        records = [(budget_file, month, json.dumps(payload, default=str), now) for month, payload in payloads.items()]
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO budget_months (budget_file, month, payload, fetched_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(budget_file, month) DO UPDATE SET
+                        payload = excluded.payload,
+                        fetched_at = excluded.fetched_at
+                    """,
+                    records,
+                )
+        logger.info("budget month cache stored months=%d budget_file=%s", len(records), budget_file)
+        return len(records)
+
+    def invalidate(self, budget_file: str, months: Iterable[str] | None = None) -> None:
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                if months is None:
+                    conn.execute("DELETE FROM budget_months WHERE budget_file = ?", (budget_file,))
+                else:
+                    conn.executemany(
+                        "DELETE FROM budget_months WHERE budget_file = ? AND month = ?",
+                        [(budget_file, month) for month in months],
+                    )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._file_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def default_state_file(file_name: str) -> Path:
+    """`file_name` under LEDGERMIND_STATE_DIR (default `.ledgermind-state`), relative to the repo root."""
+    path = Path(os.getenv("LEDGERMIND_STATE_DIR") or ".ledgermind-state") / file_name
+    return path if path.is_absolute() else _REPO_ROOT / path
+
+
+@dataclass
+class Watermark:
+    """Newest posted date folded into an incremental store, plus the ids already seen on that date."""
+
+    through: str
+    boundary_ids: list[str] = field(default_factory=list)
+    data_version: str | None = None
+    updated_at: float = 0.0
+
+
+class WatermarkConflict(RuntimeError):
+    """Another writer saved the scope after the caller loaded it; reload and fold again."""
+
+
+def claim_watermark(conn: sqlite3.Connection, scope: str, previous: Watermark | None) -> None:
+    """
+    Open a write transaction on `conn` and check `scope`'s watermark is still `previous`.
+
+    `BEGIN IMMEDIATE` takes SQLite's write lock before the check, so a writer in another
+    process cannot slip in between the check and the caller's writes.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    row = conn.execute("SELECT updated_at FROM watermarks WHERE scope = ?", (scope,)).fetchone()
+    current = row[0] if row is not None else None
+    expected = previous.updated_at if previous is not None else None
+    if current != expected:
+        raise WatermarkConflict(f"watermark for scope {scope!r} changed since it was loaded")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from infrastructure.persistence.incremental_state import WatermarkConflict, default_state_file
+from logs import get_logger
+
+logger = get_logger("LedgerRollup")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS coverage (
+    scope TEXT PRIMARY KEY,
+    first_month TEXT NOT NULL,
+    through TEXT NOT NULL,
+    data_version TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollup (
+    scope TEXT NOT NULL,
+    month TEXT NOT NULL,
+    category TEXT NOT NULL,
+    category_name TEXT NOT NULL,
+    account TEXT NOT NULL,
+    account_name TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    debit_cents INTEGER NOT NULL,
+    credit_cents INTEGER NOT NULL,
+    debit_count INTEGER NOT NULL,
+    credit_count INTEGER NOT NULL,
+    PRIMARY KEY (scope, month, category, account, currency)
+);
+"""
+
+# Output columns a rollup query may group by.
+GROUP_COLUMNS = {
+    "month": ("month",),
+    "category": ("category", "category_name"),
+    "account": ("account", "account_name"),
+    "currency": ("currency",),
+}
+
+
+@dataclass
+class RollupCoverage:
+    """Months held for a scope: `first_month` (YYYY-MM-01) through the `through` date."""
+
+    first_month: str
+    through: str
+    data_version: str | None = None
+    updated_at: float = 0.0
+
+
+@dataclass(frozen=True)
+class RollupCell:
+    month: str
+    category: str
+    category_name: str
+    account: str
+    account_name: str
+    currency: str
+    debit_cents: int
+    credit_cents: int
+    debit_count: int
+    credit_count: int
+
+
+class LedgerRollup:
+    """
+    Persistent month x category x account x currency totals per scope.
+
+    Months are stored as `YYYY-MM` and always replaced whole (`replace_months`), so a
+    refresh of an open month never double counts.
+    """
+
+    def __init__(self, file_path: str | Path | None = None) -> None:
+        raw_path = os.getenv("LEDGERMIND_LEDGER_ROLLUP_PATH")
+        self._file_path = Path(file_path or raw_path or default_state_file("ledger_rollup.sqlite"))
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def coverage(self, scope: str) -> RollupCoverage | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT first_month, through, data_version, updated_at FROM coverage WHERE scope = ?", (scope,)
+            ).fetchone()
+        return RollupCoverage(*row) if row is not None else None
+
+    def replace_months(
+        self,
+        scope: str,
+        first_month: str,
+        last_month: str,
+        cells: list[RollupCell],
+        coverage: RollupCoverage,
+        *,
+        previous: RollupCoverage | None,
+    ) -> None:
+        """
+        Swap in `cells` for months first_month..last_month (YYYY-MM) and store `coverage`, atomically.
+
+        Raises WatermarkConflict when the stored coverage is no longer `previous` (the one the
+        caller planned from), so two refreshes cannot interleave their month ranges.
+        """
+        coverage.updated_at = time.time()
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT updated_at FROM coverage WHERE scope = ?", (scope,)).fetchone()
+                if (row[0] if row is not None else None) != (previous.updated_at if previous is not None else None):
+                    raise WatermarkConflict(f"rollup coverage for scope {scope!r} changed since it was read")
+                conn.execute(
+                    "DELETE FROM rollup WHERE scope = ? AND month BETWEEN ? AND ?", (scope, first_month, last_month)
+                )
+                conn.executemany(
+                    "INSERT INTO rollup VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            scope,
+                            cell.month,
+                            cell.category,
+                            cell.category_name,
+                            cell.account,
+                            cell.account_name,
+                            cell.currency,
+                            cell.debit_cents,
+                            cell.credit_cents,
+                            cell.debit_count,
+                            cell.credit_count,
+                        )
+                        for cell in cells
+                    ],
+                )
+                conn.execute(
+                    """
+                    INSERT INTO coverage (scope, first_month, through, data_version, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(scope) DO UPDATE SET
+                        first_month = excluded.first_month,
+                        through = excluded.through,
+                        data_version = excluded.data_version,
+                        updated_at = excluded.updated_at
+                    """,
+                    (scope, coverage.first_month, coverage.through, coverage.data_version, coverage.updated_at),
+                )
+        logger.info("ledger rollup months replaced scope=%s months=%s..%s cells=%d", scope, first_month, last_month, len(cells))
+
+    def totals(
+        self,
+        scope: str,
+        first_month: str,
+        last_month: str,
+        group_by: tuple[str, ...] = (),
+        accounts: list[str] | None = None,
+        categories: list[str] | None = None,
+        currency: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Summed debit/credit cents and counts for months first_month..last_month (YYYY-MM).
+
+        - `group_by` takes GROUP_COLUMNS keys; an empty tuple gives one grand-total row (zeros
+          when nothing matches)
+        - `accounts`, `categories` and `currency` match like TransactionQuery filters
+          (account ids exact, category ids case-insensitive)
+        """
+        columns = [column for key in group_by for column in GROUP_COLUMNS[key]]
+        where = ["scope = ?", "month BETWEEN ? AND ?"]
+        params: list[Any] = [scope, first_month, last_month]
+        if accounts:
+            where.append(f"account IN ({', '.join('?' * len(accounts))})")
+            params.extend(str(account) for account in accounts)
+        if categories:
+            where.append(f"LOWER(category) IN ({', '.join('?' * len(categories))})")
+            params.extend(str(category).lower() for category in categories)
+        if currency:
+            where.append("currency = ?")
+            params.append(currency)
+        keys = [GROUP_COLUMNS[key][0] for key in group_by]
+        # Names can change between months; any one of a key's labels is fine.
+        selected = [f"MAX({column})" if column.endswith("_name") else column for column in columns]
+        sums = ["SUM(debit_cents)", "SUM(credit_cents)", "SUM(debit_count)", "SUM(credit_count)"]
+        sql = f"SELECT {', '.join([*selected, *sums])} FROM rollup WHERE {' AND '.join(where)}"
+        if keys:
+            sql += f" GROUP BY {', '.join(keys)} ORDER BY {', '.join(keys)}"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        names = [*columns, "debit_cents", "credit_cents", "debit_count", "credit_count"]
+        return [{name: (value if value is not None else 0) for name, value in zip(names, row)} for row in rows]
+
+    def reset(self, scope: str | None = None) -> None:
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                for table in ("coverage", "rollup"):
+                    if scope is None:
+                        conn.execute(f"DELETE FROM {table}")
+                    else:
+                        conn.execute(f"DELETE FROM {table} WHERE scope = ?", (scope,))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._file_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from domain.subscriptions import SubscriptionEntry
+from infrastructure.persistence.incremental_state import Watermark, claim_watermark, default_state_file
+from logs import get_logger
+
+logger = get_logger("SubscriptionIndex")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    scope TEXT PRIMARY KEY,
+    through TEXT NOT NULL,
+    boundary_ids TEXT NOT NULL,
+    data_version TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS merchants (
+    scope TEXT NOT NULL,
+    merchant TEXT NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (scope, merchant)
+);
+"""
+
+
+class SubscriptionIndex:
+    """
+    Persistent per-scope merchant charge histories (SubscriptionEntry) and watermark.
+
+    A scope is whatever the caller keys the index on (ledger, filters); `save` replaces
+    a scope's watermark and touched merchants in one transaction.
+    """
+
+    def __init__(self, file_path: str | Path | None = None) -> None:
+        raw_path = os.getenv("LEDGERMIND_SUBSCRIPTION_INDEX_PATH")
+        self._file_path = Path(file_path or raw_path or default_state_file("subscription_index.sqlite"))
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def load(self, scope: str) -> tuple[Watermark | None, dict[str, SubscriptionEntry]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT through, boundary_ids, data_version, updated_at FROM watermarks WHERE scope = ?", (scope,)
+            ).fetchone()
+            if row is None:
+                return None, {}
+            entries = {
+                merchant: SubscriptionEntry.from_dict(json.loads(payload))
+                for merchant, payload in conn.execute("SELECT merchant, entry FROM merchants WHERE scope = ?", (scope,))
+            }
+        return Watermark(row[0], json.loads(row[1]), row[2], row[3]), entries
+
+    def save(self, scope: str, watermark: Watermark, entries: dict[str, SubscriptionEntry], *, previous: Watermark | None) -> None:
+        """Write the scope; raises WatermarkConflict when its watermark is no longer `previous` (the one loaded)."""
+        watermark.updated_at = time.time()
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                claim_watermark(conn, scope, previous)
+                conn.execute(
+                    """
+                    INSERT INTO watermarks (scope, through, boundary_ids, data_version, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(scope) DO UPDATE SET
+                        through = excluded.through,
+                        boundary_ids = excluded.boundary_ids,
+                        data_version = excluded.data_version,
+                        updated_at = excluded.updated_at
+                    """,
+                    (scope, watermark.through, json.dumps(watermark.boundary_ids), watermark.data_version, watermark.updated_at),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO merchants (scope, merchant, entry) VALUES (?, ?, ?)",
+                    [(scope, merchant, json.dumps(entry.to_dict())) for merchant, entry in entries.items()],
+                )
+        logger.info("subscription index saved scope=%s through=%s merchants=%d", scope, watermark.through, len(entries))
+
+    def reset(self, scope: str | None = None) -> None:
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                for table in ("watermarks", "merchants"):
+                    if scope is None:
+                        conn.execute(f"DELETE FROM {table}")
+                    else:
+                        conn.execute(f"DELETE FROM {table} WHERE scope = ?", (scope,))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._file_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+from datetime import date
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from domain.models import MetadataSource, Money, Transaction, TransactionType
+from logs import get_logger
+
+logger = get_logger("TransactionMirror")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    posted_on TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    amount_minor INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    txn_type TEXT NOT NULL,
+    account_id TEXT,
+    metadata TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS transactions_live_posted_on ON transactions (deleted, posted_on);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class TransactionMirror:
+    """
+    Local SQLite copy of one provider's normalized transactions.
+
+    Rows are keyed by provider transaction id. Deleted rows are kept as tombstones
+    (`deleted = 1`) so an incremental sync can retire them without a full reload.
+
+    With a `metadata_loader`, deferred metadata exposing `to_record()` is stored as
+    those raw inputs (a JSON array) instead of the decoded dict, and rebuilt through
+    the loader on first access after a read.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        metadata_loader: Callable[[list[Any]], MetadataSource] | None = None,
+    ) -> None:
+        self._file_path = Path(file_path)
+        self._metadata_loader = metadata_loader
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def get_state(self, key: str) -> str | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def apply(
+        self,
+        upserts: Iterable[Transaction],
+        tombstones: Iterable[str] = (),
+        *,
+        replace: bool = False,
+        state: dict[str, str] | None = None,
+    ) -> int:
+        """
+        Write a sync batch atomically.
+
+        `replace=True` drops every existing row first (full reload). Sync state entries are
+        written in the same transaction so a crash never leaves rows and cursor out of step.
+        """
+        records = [self._to_record(txn) for txn in upserts]
+        deleted_ids = [(str(txn_id),) for txn_id in tombstones]
+        with self._write_lock, closing(self._connect()) as conn:
+            with conn:
+                if replace:
+                    conn.execute("DELETE FROM transactions")
+                conn.executemany(
+                    """
+                    INSERT INTO transactions
+                        (id, posted_on, description, category, amount_minor, currency, txn_type, account_id, metadata, deleted)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    ON CONFLICT(id) DO UPDATE SET
+                        posted_on = excluded.posted_on,
+                        description = excluded.description,
+                        category = excluded.category,
+                        amount_minor = excluded.amount_minor,
+                        currency = excluded.currency,
+                        txn_type = excluded.txn_type,
+                        account_id = excluded.account_id,
+                        metadata = excluded.metadata,
+                        deleted = 0
+                    """,
+                    records,
+                )
+                conn.executemany("UPDATE transactions SET deleted = 1 WHERE id = ?", deleted_ids)
+                for key, value in (state or {}).items():
+                    conn.execute(
+                        "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                        (key, value),
+                    )
+        logger.info(
+            "mirror applied upserts=%d tombstones=%d replace=%s path=%s",
+            len(records),
+            len(deleted_ids),
+            replace,
+            self._file_path,
+        )
+        return len(records) + len(deleted_ids)
+
+    def query(self, start: date, end: date) -> list[Transaction]:
+        return [txn for batch in self.iter_query(start, end) for txn in batch]
+
+    def iter_query(self, start: date, end: date, batch_size: int = 1000) -> Iterator[list[Transaction]]:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                """
+                SELECT id, posted_on, description, category, amount_minor, currency, txn_type, account_id, metadata
+                FROM transactions
+                WHERE deleted = 0 AND posted_on BETWEEN ? AND ?
+                ORDER BY posted_on, id
+                """,
+                (start.isoformat(), end.isoformat()),
+            )
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    return
+                yield [self._from_record(row) for row in records]
+
+    def count(self, include_deleted: bool = False) -> int:
+        sql = "SELECT COUNT(*) FROM transactions" + ("" if include_deleted else " WHERE deleted = 0")
+        with closing(self._connect()) as conn:
+            return int(conn.execute(sql).fetchone()[0])
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._file_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _to_record(self, txn: Transaction) -> tuple:
+        return (
+            txn.id,
+            txn.posted_on.isoformat(),
+            txn.description,
+            txn.category,
+            txn.value.minor_units,
+            txn.value.currency,
+            txn.txn_type.value,
+            txn.account_id,
+            self._encode_metadata(txn),
+        )
+
+    def _encode_metadata(self, txn: Transaction) -> str:
+        to_record = getattr(txn.metadata_source, "to_record", None)
+        if self._metadata_loader is not None and callable(to_record):
+            # Keeps the sync path from decoding metadata nobody has asked for yet.
+            return json.dumps(to_record(), default=str)
+        return json.dumps(txn.metadata, default=str)
+
+    def _decode_metadata(self, text: str) -> dict[str, Any]:
+        decoded = json.loads(text)
+        if isinstance(decoded, list) and self._metadata_loader is not None:
+            source = self._metadata_loader(decoded)
+            return source() if callable(source) else (source or {})
+        return decoded if isinstance(decoded, dict) else {}
+
+    def _from_record(self, row: tuple) -> Transaction:
+        txn_id, posted_on, description, category, amount_minor, currency, txn_type, account_id, metadata = row
+        return Transaction(
+            id=txn_id,
+            posted_on=date.fromisoformat(posted_on),
+            description=sys.intern(description),
+            category=sys.intern(category),
+            value=Money.from_minor(amount_minor, currency),
+            txn_type=TransactionType(txn_type),
+            account_id=account_id,
+            metadata=partial(self._decode_metadata, metadata) if metadata else None,
+        )
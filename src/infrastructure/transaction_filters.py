@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+from domain.models import Transaction, TransactionType
+
+_Check = Callable[[Transaction], bool]
+
+
+def _parse_date(value: Any) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _as_minor_units(value: Any) -> Decimal:
+    # Exact bound in cents; repr() of the float keeps the comparison identical to the
+    # previous float() based one for the two-decimal amounts providers produce.
+    return Decimal(repr(float(value))) * 100
+
+
+class TransactionPredicate:
+    """
+    TransactionQuery filters compiled once into the minimal set of per-row checks.
+
+    - sets, lowercased text, parsed dates and amount bounds are prepared once per query
+    - inactive filters produce no check at all, so a date-only query costs one compare per row
+    - semantics match the previous per-row matcher in GetTransactions
+    """
+
+    __slots__ = ("_checks",)
+
+    def __init__(self, args: dict[str, Any]) -> None:
+        self._checks: tuple[_Check, ...] = tuple(self._compile(args))
+
+    @property
+    def is_trivial(self) -> bool:
+        return not self._checks
+
+    def __call__(self, txn: Transaction) -> bool:
+        for check in self._checks:
+            if not check(txn):
+                return False
+        return True
+
+    def filter(self, txns: Iterable[Transaction]) -> list[Transaction]:
+        """Apply each check as one pass over the survivors of the previous one."""
+        rows = txns if isinstance(txns, list) else list(txns)
+        for check in self._checks:
+            rows = [txn for txn in rows if check(txn)]
+        return rows
+
+    def _compile(self, args: dict[str, Any]) -> list[_Check]:
+        checks: list[_Check] = []
+
+        date_range = args.get("date_range")
+        if isinstance(date_range, dict):
+            start = _parse_date(date_range.get("start"))
+            end = _parse_date(date_range.get("end"))
+            if start and end:
+                checks.append(lambda t: start <= t.posted_on <= end)
+            elif start:
+                checks.append(lambda t: t.posted_on >= start)
+            elif end:
+                checks.append(lambda t: t.posted_on <= end)
+
+        # TransactionQuery rejects contradicting txn_type/positive, so either one decides.
+        positive = args.get("positive")
+        txn_type = args.get("txn_type")
+        if txn_type:
+            wanted_type = TransactionType(str(txn_type))
+            checks.append(lambda t: t.txn_type == wanted_type)
+        elif positive is not None:
+            wanted_type = TransactionType.DEBIT if positive else TransactionType.CREDIT
+            checks.append(lambda t: t.txn_type == wanted_type)
+
+        accounts = frozenset(str(a) for a in (args.get("accounts") or []))
+        if accounts:
+            checks.append(lambda t: (t.account_id or "") in accounts)
+
+        categories = frozenset(str(c).lower() for c in (args.get("categories") or []))
+        if categories:
+            checks.append(lambda t: t.category.lower() in categories)
+
+        currency = args.get("currency")
+        if currency:
+            checks.append(lambda t: t.value.currency == currency)
+
+        min_amount = args.get("min_amount")
+        max_amount = args.get("max_amount")
+        if min_amount is not None and max_amount is not None:
+            lo, hi = _as_minor_units(min_amount), _as_minor_units(max_amount)
+            checks.append(lambda t: lo <= t.value.minor_units <= hi)
+        elif min_amount is not None:
+            lo = _as_minor_units(min_amount)
+            checks.append(lambda t: t.value.minor_units >= lo)
+        elif max_amount is not None:
+            hi = _as_minor_units(max_amount)
+            checks.append(lambda t: t.value.minor_units <= hi)
+
+        query = (args.get("query") or "").strip().lower()
+        if query:
+            checks.append(lambda t: query in t.description.lower() or query in t.category.lower())
+
+        return checks
+
+
+def compile_transaction_filters(args: dict[str, Any]) -> TransactionPredicate:
+    return TransactionPredicate(args)
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from domain.schemas import UserRequest
+from infrastructure.get_transactions import get_transactions
+from infrastructure.ledger_sync import get_sync_worker, start_sync_worker, stop_sync_worker
 from interface.cli import build_engine
 
-app = FastAPI(title="LedgerMind API")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    if os.getenv("LEDGERMIND_SYNC_WORKER", "false").strip().lower() not in {"0", "false", "no", "off"}:
+        start_sync_worker(get_transactions)
+    yield
+    stop_sync_worker()
+    # Close pooled Actual sessions so the budget file is released cleanly.
+    get_transactions.close()
+
+
+app = FastAPI(title="LedgerMind API", lifespan=lifespan)
 engine = build_engine()
 
 @app.get("/", response_class=HTMLResponse)
@@ -95,6 +111,19 @@ def index() -> str:
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
+@app.get("/sync")
+def sync_status() -> dict:
+    worker = get_sync_worker()
+    return worker.status() if worker is not None else {"running": False}
+
+@app.post("/sync")
+def sync_notify() -> dict:
+    worker = get_sync_worker()
+    if worker is None:
+        return {"running": False, "notified": False}
+    worker.notify()
+    return {**worker.status(), "notified": True}
+
 @app.post("/analyze")
 def analyze(request: UserRequest) -> dict:
     answer, issues = engine.run(request)
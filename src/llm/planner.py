@@ -200,9 +200,12 @@ class PlannerLLM:
             "ledgers.category_summary": "Compute spending and income totals by category",
             "ledger.category_summary": "Compute spending and income totals by category",
             "ledgers.month_summary": "Summarize monthly spending, income, and net cashflow",
+            "ledgers.trend": "Show how spending by category, account or merchant trends over recent periods",
+            "ledgers.compare_periods": "Compare spending and income between two periods by category",
             "detect.recurring_charges": "Detect recurring charges worth review",
             "detect.subscriptions": "Detect recurring charges worth review",
             "detect.anomalies": "Find unusually large or irregular transactions",
+            "forecast.cashflow": "Project cashflow over several horizons with confidence bands",
             "forecast.cashflow_30d": "Project near-term cashflow from recent patterns",
             "policy.check_recommendation": "Validate recommendation against policy profile",
         }
@@ -1,6 +1,9 @@
 from tools.detect import anomalies  # noqa: F401
 from tools.detect import recurring_charges  # noqa: F401
+from tools.forecast import cashflow  # noqa: F401
 from tools.forecast import cashflow_30d  # noqa: F401
 from tools.ledger import category_summary  # noqa: F401
+from tools.ledger import compare_periods  # noqa: F401
 from tools.ledger import month_summary  # noqa: F401
+from tools.ledger import trend  # noqa: F401
 from tools.policy import check_recommendation  # noqa: F401
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import date, timedelta
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+
+from domain.transaction_frame import TransactionFrame
+from infrastructure.ledger_sync import get_sync_worker, read_sync_state
+from infrastructure.persistence.incremental_state import Watermark, WatermarkConflict
+
+_T = TypeVar("_T")
+_REFRESH_ATTEMPTS = 3
+_scope_locks: dict[str, threading.Lock] = {}
+_scope_locks_guard = threading.Lock()
+
+
+def incremental_enabled(request: Any, env_var: str) -> bool:
+    """`incremental` tool arg, falling back to the boolean env var `env_var` (default off)."""
+    args = request.args if isinstance(getattr(request, "args", None), dict) else {}
+    value = args.get("incremental")
+    if value is None:
+        value = os.getenv(env_var, "false")
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() not in {"", "0", "false", "no", "off"}
+
+
+def current_data_version() -> str | None:
+    """Latest synced data version: the in-process sync worker's, else the shared state file's."""
+    worker = get_sync_worker()
+    state = worker.state if worker is not None else read_sync_state()
+    return state.data_version if state is not None else None
+
+
+def scope_key(request: Any, filters: dict[str, Any], prefix: str, **extra: Any) -> str:
+    """Stable store key from the ledger, the non-date filters and `extra` settings."""
+    context = getattr(request, "context", None)
+    key = {
+        "ledger_id": getattr(context, "ledger_id", None),
+        "filters": {name: value for name, value in filters.items() if name != "date_range"},
+        **extra,
+    }
+    digest = hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+    return f"{key['ledger_id']}:{prefix}:{digest}"
+
+
+def incremental_fetch_range(
+    filters: dict[str, Any], watermark: Watermark | None, lookback_days: int
+) -> tuple[str, str] | None:
+    """
+    Dates an incremental store still needs, or None when it is current.
+
+    - no watermark: the `lookback_days` window ending at the requested end (capped at today)
+    - otherwise from the watermark date on; skipped when the sync data version is unchanged
+      and the watermark already covers the requested end
+    """
+    end = min(date.fromisoformat(filters["date_range"]["end"]), date.today())
+    if watermark is None:
+        return (end - timedelta(days=lookback_days - 1)).isoformat(), end.isoformat()
+    through = date.fromisoformat(watermark.through)
+    version = current_data_version()
+    if through >= end and version is not None and version == watermark.data_version:
+        return None
+    return through.isoformat(), max(through, end).isoformat()
+
+
+def unseen_rows(frame: TransactionFrame, watermark: Watermark | None) -> TransactionFrame:
+    """Drop rows already folded in on the watermark date."""
+    if watermark is None or not watermark.boundary_ids:
+        return frame
+    return frame.select(~np.isin(frame.ids, watermark.boundary_ids))
+
+
+def advance_watermark(frame: TransactionFrame, through: str, previous: Watermark | None) -> Watermark:
+    """Watermark after folding in `frame`, fetched up to and including `through`."""
+    boundary = frame.ids[frame.day == date.fromisoformat(through).toordinal()].tolist()
+    if previous is not None and previous.through == through:
+        boundary = list(dict.fromkeys([*previous.boundary_ids, *boundary]))
+    return Watermark(through=through, boundary_ids=boundary, data_version=current_data_version())
+
+
+def serialized_refresh(scope: str, refresh: Callable[[], _T]) -> _T:
+    """
+    Run a store's load -> fold -> save `refresh` for `scope` one caller at a time.
+
+    Threads of this process queue on a per-scope lock; a save from another process is
+    detected by the store (WatermarkConflict) and the whole refresh runs again from a fresh load.
+    """
+    with _scope_locks_guard:
+        lock = _scope_locks.setdefault(scope, threading.Lock())
+    with lock:
+        for _ in range(_REFRESH_ATTEMPTS - 1):
+            try:
+                return refresh()
+            except WatermarkConflict:
+                continue
+        return refresh()
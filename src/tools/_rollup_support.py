@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+from domain.transaction_frame import TransactionFrame, month_codes, month_start
+from infrastructure.persistence.ledger_rollup import LedgerRollup, RollupCell, RollupCoverage
+from tools._incremental_support import current_data_version, incremental_enabled, scope_key, serialized_refresh
+from tools._transactions_support import fetch_filtered_frame
+
+# Filters the rollup can answer, and filters that pick which rows exist (part of the scope).
+_ROLLUP_FILTERS = frozenset({"date_range", "accounts", "categories", "currency"})
+_SCOPE_FILTERS = frozenset({"source", "providers", "provider_names"})
+
+
+def rollup_enabled(request: Any) -> bool:
+    """`incremental` tool arg, falling back to LEDGERMIND_LEDGER_ROLLUP (default off)."""
+    return incremental_enabled(request, "LEDGERMIND_LEDGER_ROLLUP")
+
+
+def rollup_months(filters: dict[str, Any]) -> tuple[date, date] | None:
+    """
+    First days of the first and last requested months, or None when the rollup cannot answer.
+
+    Needs a date range of whole calendar months and no filters beyond accounts, categories,
+    currency and provider selection.
+    """
+    for key, value in filters.items():
+        if key in _ROLLUP_FILTERS or key in _SCOPE_FILTERS:
+            continue
+        if value not in (None, [], "") and not (key == "exclude_transfers" and value is False):
+            return None
+    try:
+        start = date.fromisoformat(str(filters["date_range"]["start"]))
+        end = date.fromisoformat(str(filters["date_range"]["end"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+    if start.day != 1 or end.day != monthrange(end.year, end.month)[1] or end < start:
+        return None
+    return start, end.replace(day=1)
+
+
+def build_cells(frame: TransactionFrame) -> list[RollupCell]:
+    """Month x category x account x currency totals of `frame` from one `np.unique` over packed keys."""
+    if not len(frame):
+        return []
+    months = month_codes(frame.day)
+    first_month = int(months.min())
+    dims = (
+        int(months.max()) - first_month + 1,
+        len(frame.category_keys),
+        len(frame.account_keys),
+        len(frame.currency_names),
+    )
+    packed = np.ravel_multi_index((months - first_month, frame.category_codes, frame.account_codes, frame.currency_codes), dims)
+    keys, inverse = np.unique(packed, return_inverse=True)
+    debit_cents = np.bincount(inverse, weights=np.where(frame.is_credit, 0, frame.amount_cents))
+    credit_cents = np.bincount(inverse, weights=np.where(frame.is_credit, frame.amount_cents, 0))
+    credit_count = np.bincount(inverse, weights=frame.is_credit)
+    debit_count = np.bincount(inverse) - credit_count
+
+    month, category, account, currency = np.unravel_index(keys, dims)
+    return [
+        RollupCell(
+            month=month_start(first_month + int(month[i])).strftime("%Y-%m"),
+            category=frame.category_keys[category[i]],
+            category_name=frame.category_names[category[i]],
+            account=frame.account_keys[account[i]],
+            account_name=frame.account_names[account[i]],
+            currency=frame.currency_names[currency[i]],
+            debit_cents=int(round(debit_cents[i])),
+            credit_cents=int(round(credit_cents[i])),
+            debit_count=int(debit_count[i]),
+            credit_count=int(credit_count[i]),
+        )
+        for i in range(len(keys))
+    ]
+
+
+def _load_months(
+    store: LedgerRollup,
+    scope: str,
+    base: dict[str, Any],
+    start: date,
+    end: date,
+    coverage: RollupCoverage,
+    previous: RollupCoverage | None,
+) -> None:
+    frame = fetch_filtered_frame({**base, "date_range": {"start": start.isoformat(), "end": end.isoformat()}})
+    store.replace_months(scope, start.strftime("%Y-%m"), end.strftime("%Y-%m"), build_cells(frame), coverage, previous=previous)
+
+
+def refresh_rollup(store: LedgerRollup, request: Any, filters: dict[str, Any], first: date, last: date) -> str:
+    """
+    Bring the rollup up to date for months `first`..`last` and return its scope key.
+
+    - a new scope is built from `first` through today
+    - months before the covered range are backfilled once; closed months are never refetched
+    - the month before the last refresh and everything after it are rebuilt, unless the
+      sync data version is unchanged and the coverage already reaches the requested end
+    - refreshes of one scope are serialized (see `serialized_refresh`)
+    """
+    base = {key: value for key, value in filters.items() if key in _SCOPE_FILTERS and value}
+    scope = scope_key(request, base, "rollup")
+    serialized_refresh(scope, lambda: _refresh_scope(store, scope, base, first, last))
+    return scope
+
+
+def _refresh_scope(store: LedgerRollup, scope: str, base: dict[str, Any], first: date, last: date) -> None:
+    coverage = store.coverage(scope)
+    today = date.today()
+    version = current_data_version()
+    if coverage is None:
+        built = RollupCoverage(first.isoformat(), today.isoformat(), version)
+        _load_months(store, scope, base, first, max(first, today), built, None)
+        return
+
+    covered_from = date.fromisoformat(coverage.first_month)
+    if first < covered_from:
+        backfilled = RollupCoverage(first.isoformat(), coverage.through, coverage.data_version)
+        _load_months(store, scope, base, first, covered_from - timedelta(days=1), backfilled, coverage)
+        coverage = backfilled
+
+    through = date.fromisoformat(coverage.through)
+    refresh_from = (through.replace(day=1) - timedelta(days=1)).replace(day=1)
+    last_end = last.replace(day=monthrange(last.year, last.month)[1])
+    current = version is not None and version == coverage.data_version and through >= min(last_end, today)
+    if last >= refresh_from and not current:
+        end = max(today, through)
+        refreshed = RollupCoverage(coverage.first_month, end.isoformat(), version)
+        _load_months(store, scope, base, refresh_from, end, refreshed, coverage)
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
 from calendar import monthrange
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, timedelta
-from typing import Any
+from itertools import chain
+from typing import Any, Iterator
 
 from domain.schemas import TransactionQuery
-from infrastructure.get_transactions import get_transactions
+from domain.transaction_frame import TransactionFrame
+from infrastructure.get_transactions import GetTransactions, TransactionDataset, get_transactions
+
+# Set by ToolExecutor while a plan runs: a shared prefetched dataset, or the executor's own providers.
+_active_dataset: ContextVar[TransactionDataset | GetTransactions | None] = ContextVar(
+    "ledgermind_transaction_dataset", default=None
+)
+
+
+@contextmanager
+def use_transaction_dataset(dataset: TransactionDataset | GetTransactions | None) -> Iterator[None]:
+    token = _active_dataset.set(dataset)
+    try:
+        yield
+    finally:
+        _active_dataset.reset(token)
 
 
 def _coerce_date(value: Any) -> date | None:
@@ -80,7 +98,7 @@ def set_month_date_range(filters: dict[str, Any], year: int, month_number: int)
     return filters
 
 
-def fetch_transaction_rows(request: Any, default_days: int = 30) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def _prepare_request_filters(request: Any, default_days: int) -> dict[str, Any]:
     filters = ensure_date_range(_extract_request_filters(request), default_days=default_days)
     if hasattr(request, "filters"):
         try:
@@ -89,5 +107,42 @@ def fetch_transaction_rows(request: Any, default_days: int = 30) -> tuple[list[d
             # Leave request.filters untouched if the caller is not a pydantic ToolRequest
             # or if validation is intentionally deferred.
             pass
-    rows = get_transactions.get_transactions(filters)
+    return filters
+
+
+def fetch_transaction_rows(request: Any, default_days: int = 30) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    filters = _prepare_request_filters(request, default_days)
+    dataset = _active_dataset.get()
+    source = dataset if dataset is not None else get_transactions
+    rows = source.get_transactions(filters)
     return rows, filters
+
+
+def iter_transaction_rows(
+    request: Any,
+    default_days: int = 30,
+    include_metadata: bool = True,
+) -> tuple[Iterator[dict[str, Any]], dict[str, Any]]:
+    """Like `fetch_transaction_rows`, but rows are streamed; for single-pass aggregations."""
+    filters = _prepare_request_filters(request, default_days)
+    dataset = _active_dataset.get()
+    source = dataset if dataset is not None else get_transactions
+    return source.iter_transactions(filters, include_metadata=include_metadata), filters
+
+
+def fetch_transaction_frame(request: Any, default_days: int = 30) -> tuple[TransactionFrame, dict[str, Any]]:
+    """Columnar frame built straight from the row stream, for vectorized tools."""
+    rows, filters = iter_transaction_rows(request, default_days=default_days, include_metadata=False)
+    return TransactionFrame.from_rows(rows), filters
+
+
+def fetch_filtered_frame(*filter_sets: dict[str, Any]) -> TransactionFrame:
+    """
+    Frame for explicit filter dicts rather than a request's, e.g. a store refreshing its own range.
+
+    Several filter sets are fetched one after another into one frame; they must not overlap.
+    """
+    dataset = _active_dataset.get()
+    source = dataset if dataset is not None else get_transactions
+    rows = chain.from_iterable(source.iter_transactions(filters, include_metadata=False) for filters in filter_sets)
+    return TransactionFrame.from_rows(rows)
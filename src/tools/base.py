@@ -6,6 +6,7 @@ from typing import Any
 
 from domain.schemas import ToolRequest, ToolResponse, TransactionQuery
 from pydantic import ValidationError
+from tools._transactions_support import _extract_request_filters, ensure_date_range
 
 
 @dataclass(frozen=True)
@@ -25,3 +26,21 @@ class Tool(ABC):
 
     def spec(self) -> ToolSpec:
         return ToolSpec(name=self.name, description=self.description, args_schema={})
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        """Effective transaction filters this call will fetch, or None if the tool does not read transactions."""
+        return None
+
+    def transaction_filter_sets(self, request: ToolRequest) -> list[dict[str, Any]]:
+        """Every filter set this call will fetch; tools reading several disjoint ranges override this."""
+        filters = self.transaction_filters(request)
+        return [filters] if filters else []
+
+
+class TransactionTool(Tool):
+    """Tool that reads transactions; without an explicit date_range it looks back `lookback_days`."""
+
+    lookback_days: int = 30
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        return ensure_date_range(_extract_request_filters(request), default_days=self.lookback_days)
@@ -1,70 +1,332 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from statistics import mean
+import os
+from datetime import date
 from typing import Any
 
-from domain.schemas import ToolArgs, ToolRequest, ToolResponse
+import numpy as np
+
+from domain.running_stats import RunningStats
+from domain.schemas import ToolArgs, ToolRequest, ToolResponse, TransactionQuery
+from domain.transaction_frame import TransactionFrame, cents_to_float, group_count, group_median, group_sum
+from infrastructure.persistence.anomaly_baselines import AnomalyBaselineStore
+from infrastructure.persistence.incremental_state import Watermark
 from logs import get_logger
-from tools._transactions_support import fetch_transaction_rows
-from tools.base import Tool, ToolSpec
+from tools._incremental_support import (
+    advance_watermark,
+    incremental_enabled,
+    incremental_fetch_range,
+    scope_key,
+    serialized_refresh,
+    unseen_rows,
+)
+from tools._transactions_support import _extract_request_filters, ensure_date_range, fetch_transaction_frame
+from tools.base import TransactionTool, ToolSpec
 from tools.registry import register_tool
 
+METHODS = ("mean", "zscore", "mad")
+DEFAULT_THRESHOLDS = {"mean": 2.0, "zscore": 3.0, "mad": 3.5}
+# Scales a median absolute deviation to a normal standard deviation.
+_MAD_SCALE = 1.4826
+_MIN_PEERS = 3
+
+
+def _anomaly_args(request: ToolRequest) -> tuple[str | None, float, int]:
+    args = request.args if isinstance(request.args, dict) else {}
+    method = str(args.get("method") or "mean").strip().lower()
+    if method not in METHODS:
+        return None, 0.0, 0
+    try:
+        threshold = float(args["threshold"]) if args.get("threshold") is not None else DEFAULT_THRESHOLDS[method]
+    except (TypeError, ValueError):
+        threshold = DEFAULT_THRESHOLDS[method]
+    try:
+        limit = max(1, int(args.get("limit") or 20))
+    except (TypeError, ValueError):
+        limit = 20
+    return method, threshold, limit
+
+
+def category_baselines(
+    codes: np.ndarray,
+    amount_cents: np.ndarray,
+    size: int,
+    method: str,
+    threshold: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score every debit against its category in O(n) (O(n log n) for `mad`).
+
+    Returns `(eligible, avg, cutoff, score)` per row, amounts in cents:
+    - mean: leave-one-out mean from category totals; cutoff max(threshold x mean, mean + $50)
+    - zscore: leave-one-out mean/std via per-category centered sums of squares;
+      cutoff mean + threshold x std
+    - mad: category median and scaled median absolute deviation; cutoff
+      median + threshold x 1.4826 x MAD
+    """
+    amount = amount_cents.astype(np.float64)
+    counts = group_count(codes, size)
+    totals = group_sum(codes, amount_cents, size).astype(np.float64)
+    row_count = counts[codes]
+    peers = row_count - 1
+    eligible = peers >= _MIN_PEERS
+    avg = np.divide(totals[codes] - amount, peers, out=np.zeros_like(amount), where=eligible)
+
+    if method == "mean":
+        cutoff = np.maximum(avg * threshold, avg + 5000.0)
+        score = np.divide(amount, avg, out=np.zeros_like(amount), where=avg > 0)
+        return eligible, avg, cutoff, score
+
+    if method == "zscore":
+        group_mean = np.divide(totals, counts, out=np.zeros(size), where=counts > 0)
+        deviation = amount - group_mean[codes]
+        m2 = np.bincount(codes, weights=deviation * deviation, minlength=size)[codes]
+        # Welford removal of the row itself; stays stable for large cent values.
+        m2_peers = np.maximum(m2 - deviation * (amount - avg), 0.0)
+        std = np.sqrt(np.divide(m2_peers, peers - 1, out=np.zeros_like(amount), where=eligible))
+        std = np.maximum(std, 1.0)
+        return eligible, avg, avg + threshold * std, (amount - avg) / std
+
+    median = group_median(codes, amount_cents, size)
+    abs_dev = np.abs(amount - median[codes])
+    mad = group_median(codes, abs_dev, size)
+    # All-equal categories have MAD 0; fall back to the mean absolute deviation.
+    mean_abs_dev = np.divide(np.bincount(codes, weights=abs_dev, minlength=size), counts, out=np.zeros(size), where=counts > 0)
+    spread = np.where(mad > 0, _MAD_SCALE * mad, 1.2533 * mean_abs_dev)
+    spread = np.maximum(spread, 1.0)[codes]
+    center = median[codes]
+    return eligible, avg, center + threshold * spread, (amount - center) / spread
+
+
+def stored_baselines(
+    stats: dict[str, RunningStats],
+    labels: list[str],
+    codes: np.ndarray,
+    amount_cents: np.ndarray,
+    method: str,
+    threshold: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Same `(eligible, avg, cutoff, score)` as `category_baselines`, against persisted per-category stats.
+
+    Rows are not part of `stats` yet, so no leave-one-out is needed; `mad` uses the
+    sketch median and IQR / 1.349 as its robust spread.
+    """
+    entries = [stats.get(label) or RunningStats() for label in labels]
+    count = np.array([entry.count for entry in entries], dtype=np.float64)
+    mean = np.array([entry.mean for entry in entries], dtype=np.float64)
+    amount = amount_cents.astype(np.float64)
+    eligible = count[codes] >= _MIN_PEERS
+    avg = mean[codes]
+
+    if method == "mean":
+        cutoff = np.maximum(avg * threshold, avg + 5000.0)
+        score = np.divide(amount, avg, out=np.zeros_like(amount), where=avg > 0)
+        return eligible, avg, cutoff, score
+    if method == "zscore":
+        std = np.maximum(np.array([entry.std for entry in entries], dtype=np.float64), 1.0)[codes]
+        return eligible, avg, avg + threshold * std, (amount - avg) / std
+
+    center = np.array([entry.quantile(0.5) for entry in entries], dtype=np.float64)[codes]
+    spread = np.array([(entry.quantile(0.75) - entry.quantile(0.25)) / 1.349 for entry in entries], dtype=np.float64)
+    spread = np.maximum(spread, 1.0)[codes]
+    return eligible, avg, center + threshold * spread, (amount - center) / spread
+
+
+def fold_into_baselines(stats: dict[str, RunningStats], labels: list[str], codes: np.ndarray, amount_cents: np.ndarray) -> None:
+    """Merge debits into the per-category stats, one vectorized batch per category."""
+    order = np.argsort(codes, kind="stable")
+    counts = group_count(codes, len(labels))
+    for code, values in enumerate(np.split(amount_cents[order], np.cumsum(counts)[:-1])):
+        if len(values):
+            stats.setdefault(labels[code], RunningStats()).add_many(values)
+
+
+def decay_baselines(stats: dict[str, RunningStats], elapsed_days: int, half_life_days: float) -> None:
+    """Age the stored stats by `elapsed_days`, halving the weight of older debits every `half_life_days` (0 = never)."""
+    if elapsed_days <= 0 or half_life_days <= 0:
+        return
+    factor = 0.5 ** (elapsed_days / half_life_days)
+    for entry in stats.values():
+        entry.decay(factor)
+
+
+def top_k(indices: np.ndarray, values: np.ndarray, k: int) -> np.ndarray:
+    """`indices` of the k largest `values`, descending, ties by position; O(n) selection before the sort."""
+    if len(indices) > k:
+        keep = np.argpartition(-values, k - 1)[:k]
+        # Admit every row tied with the k-th value so tie-breaking stays positional.
+        kth = values[keep].min()
+        chosen = np.flatnonzero(values >= kth)
+        indices, values = indices[chosen], values[chosen]
+    order = np.lexsort((indices, -values))[:k]
+    return indices[order]
+
+
+def _incremental_enabled(request: ToolRequest) -> bool:
+    return incremental_enabled(request, "LEDGERMIND_ANOMALY_BASELINES")
+
+
+def _anomaly_record(
+    debits: TransactionFrame, i: int, avg: np.ndarray, cutoff: np.ndarray, score: np.ndarray, method: str
+) -> dict[str, Any]:
+    anomaly = {
+        "transaction_id": debits.ids[i],
+        "posted_on": debits.posted_on(i).isoformat(),
+        "description": debits.merchant_names[debits.merchant_codes[i]],
+        "category": debits.category_names[debits.category_codes[i]],
+        "amount": cents_to_float(debits.amount_cents[i]),
+        "category_avg_amount": round(float(avg[i]) / 100, 2),
+        "threshold": round(float(cutoff[i]) / 100, 2),
+        "reason": "amount exceeds category baseline",
+    }
+    if method != "mean":
+        anomaly["score"] = round(float(score[i]), 2)
+    return anomaly
+
 
 @register_tool
-class DetectAnomaliesTool(Tool):
+class DetectAnomaliesTool(TransactionTool):
+    """
+    Category-baseline anomaly detection.
+
+    By default baselines are rebuilt from the lookback window on every call. With
+    `incremental` (arg, or LEDGERMIND_ANOMALY_BASELINES=true) they live in an
+    AnomalyBaselineStore keyed by ledger, filters, method and threshold:
+    - the first call builds them from `lookback_days` of debits
+    - later calls fetch only rows posted on or after the stored watermark date, score
+      the unseen ones against the stored baselines, then fold them in
+    - when the sync data version and watermark show nothing new, nothing is fetched
+    - stored stats decay as the watermark advances, halving every
+      LEDGERMIND_ANOMALY_BASELINE_HALF_LIFE_DAYS (default `lookback_days`), so they track recent history
+    - concurrent refreshes of one scope are serialized (see `serialized_refresh`)
+    Transactions backdated before the watermark are not picked up until the scope is reset.
+    """
+
     name = "detect.anomalies"
-    description = "Flag unusually large transactions compared with the user's recent history by category."
+    description = (
+        "Flag unusually large transactions compared with the user's recent history by category. "
+        "Optional `method`: mean (default), zscore or mad; optional `threshold` and `limit` (default 20); "
+        "`incremental: true` scores only new transactions against persisted baselines."
+    )
+    lookback_days = 120
+
+    def __init__(self, baseline_store: AnomalyBaselineStore | None = None) -> None:
+        self._baseline_store = baseline_store
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        filters = super().transaction_filters(request)
+        method, threshold, _ = _anomaly_args(request)
+        if method is None or not _incremental_enabled(request):
+            return filters
+        scope = scope_key(request, filters, method, method=method, threshold=threshold)
+        watermark, _ = self._get_store().load(scope)
+        fetch_range = incremental_fetch_range(filters, watermark, self.lookback_days)
+        if fetch_range is None:
+            return None
+        return {**filters, "date_range": {"start": fetch_range[0], "end": fetch_range[1]}}
 
     def run(self, request: ToolRequest) -> ToolResponse:
         logger.info("run start request_id=%s", request.request_id)
-        rows, filters = fetch_transaction_rows(request, default_days=120)
-        debit_rows = [r for r in rows if r.get("txn_type") != "credit"]
-
-        by_category: dict[str, list[tuple[str, float]]] = defaultdict(list)
-        for row in debit_rows:
-            by_category[str(row.get("category") or "uncategorized")].append(
-                (str(row.get("id") or ""), float(row.get("amount") or 0))
+        method, threshold, limit = _anomaly_args(request)
+        if method is None:
+            return ToolResponse(
+                request_id=request.request_id,
+                tool=self.name,
+                ok=False,
+                errors=[f"method must be one of: {', '.join(METHODS)}"],
+                context=request.context,
             )
+        if _incremental_enabled(request):
+            return self._run_incremental(request, method, threshold, limit)
+        frame, filters = fetch_transaction_frame(request, default_days=self.lookback_days)
+        debits = frame.select(~frame.is_credit)
 
-        anomalies: list[dict[str, Any]] = []
-        for row in debit_rows:
-            category = str(row.get("category") or "uncategorized")
-            amount = float(row.get("amount") or 0)
-            history = by_category.get(category, [])
-            peers = [peer_amount for peer_id, peer_amount in history if peer_id != str(row.get("id") or "")]
-            if len(peers) < 3:
-                continue
-            avg = mean(peers)
-            threshold = max(avg * 2.0, avg + 50.0)
-            if amount < threshold:
-                continue
-            anomalies.append(
-                {
-                    "transaction_id": row.get("id"),
-                    "posted_on": row.get("posted_on"),
-                    "description": row.get("description"),
-                    "category": category,
-                    "amount": round(amount, 2),
-                    "category_avg_amount": round(avg, 2),
-                    "threshold": round(threshold, 2),
-                    "reason": "amount exceeds category baseline",
-                }
-            )
+        amount = debits.amount_cents.astype(np.float64)
+        eligible, avg, cutoff, score = category_baselines(
+            debits.category_codes, debits.amount_cents, len(debits.category_names), method, threshold
+        )
+        flagged = np.flatnonzero(eligible & (amount >= cutoff))
+        flagged_count = len(flagged)
+        flagged = top_k(flagged, amount[flagged], limit)
+
+        anomalies = [_anomaly_record(debits, i, avg, cutoff, score, method) for i in flagged.tolist()]
 
-        anomalies.sort(key=lambda x: x["amount"], reverse=True)
         return ToolResponse(
             request_id=request.request_id,
             tool=self.name,
             result={
-                "anomalies": anomalies[:20],
-                "transaction_count": len(rows),
-                "analyzed_debits": len(debit_rows),
+                "anomalies": anomalies,
+                "method": method,
+                "transaction_count": len(frame),
+                "analyzed_debits": len(debits),
+                "flagged_count": flagged_count,
                 "filters_used": filters,
             },
             context=request.context,
         )
 
+    def _run_incremental(self, request: ToolRequest, method: str, threshold: float, limit: int) -> ToolResponse:
+        filters = ensure_date_range(_extract_request_filters(request), default_days=self.lookback_days)
+        scope = scope_key(request, filters, method, method=method, threshold=threshold)
+        store = self._get_store()
+
+        def refresh() -> tuple[Watermark | None, dict[str, RunningStats], int, int]:
+            watermark, stats = store.load(scope)
+            fetch_range = incremental_fetch_range(filters, watermark, self.lookback_days)
+            if fetch_range is None:
+                return watermark, stats, 0, 0
+            request.filters = TransactionQuery.model_validate({**filters, "date_range": {"start": fetch_range[0], "end": fetch_range[1]}})
+            frame, _ = fetch_transaction_frame(request, default_days=self.lookback_days)
+            debits = unseen_rows(frame.select(~frame.is_credit), watermark)
+            labels = debits.category_names
+            if watermark is None:
+                scored = category_baselines(debits.category_codes, debits.amount_cents, len(labels), method, threshold)
+            else:
+                elapsed = (date.fromisoformat(fetch_range[1]) - date.fromisoformat(watermark.through)).days
+                decay_baselines(stats, elapsed, self._half_life_days())
+                scored = stored_baselines(stats, labels, debits.category_codes, debits.amount_cents, method, threshold)
+            eligible, avg, cutoff, score = scored
+            flagged = np.flatnonzero(eligible & (debits.amount_cents >= cutoff))
+            fold_into_baselines(stats, labels, debits.category_codes, debits.amount_cents)
+
+            saved = advance_watermark(debits, fetch_range[1], watermark)
+            records = [_anomaly_record(debits, i, avg, cutoff, score, method) for i in flagged.tolist()]
+            store.save(scope, saved, stats, records, previous=watermark)
+            return saved, stats, len(frame), len(debits)
+
+        watermark, stats, fetched, new_debits = serialized_refresh(scope, refresh)
+        date_range = filters["date_range"]
+        anomalies, flagged_count = store.flagged(scope, date_range["start"], date_range["end"], limit)
+        return ToolResponse(
+            request_id=request.request_id,
+            tool=self.name,
+            result={
+                "anomalies": anomalies,
+                "method": method,
+                "transaction_count": fetched,
+                "analyzed_debits": new_debits,
+                "flagged_count": flagged_count,
+                "baseline": {
+                    "incremental": True,
+                    "through": watermark.through if watermark is not None else None,
+                    "categories": len(stats),
+                    "debits": round(sum(entry.count for entry in stats.values())),
+                    "half_life_days": self._half_life_days(),
+                },
+                "filters_used": filters,
+            },
+            context=request.context,
+        )
+
+    def _half_life_days(self) -> float:
+        return float(os.getenv("LEDGERMIND_ANOMALY_BASELINE_HALF_LIFE_DAYS") or self.lookback_days)
+
+    def _get_store(self) -> AnomalyBaselineStore:
+        if self._baseline_store is None:
+            self._baseline_store = AnomalyBaselineStore()
+        return self._baseline_store
+
     def spec(self) -> ToolSpec:
         return ToolSpec(name=self.name, description=self.description, args_schema=ToolArgs.model_json_schema())
 logger = get_logger("Tool:detect.anomalies")
@@ -1,93 +1,255 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict
 from datetime import date
-from statistics import mean
+from functools import lru_cache
 from typing import Any
 
-from domain.schemas import ToolArgs, ToolRequest, ToolResponse
+import numpy as np
+
+from domain.schemas import ToolArgs, ToolRequest, ToolResponse, TransactionQuery
+from domain.subscriptions import SubscriptionEntry, classify_cadence, stable_amount
+from domain.transaction_frame import TransactionFrame, group_count, group_median
+from infrastructure.persistence.incremental_state import Watermark
+from infrastructure.persistence.subscription_index import SubscriptionIndex
 from logs import get_logger
-from tools._transactions_support import fetch_transaction_rows
-from tools.base import Tool, ToolSpec
+from tools._incremental_support import (
+    advance_watermark,
+    incremental_enabled,
+    incremental_fetch_range,
+    scope_key,
+    serialized_refresh,
+    unseen_rows,
+)
+from tools._transactions_support import _extract_request_filters, ensure_date_range, fetch_transaction_frame
+from tools.base import TransactionTool, ToolSpec
 from tools.registry import register_tool
 
+_DIGITS = re.compile(r"\d+")
+_NON_ALPHA = re.compile(r"[^a-z ]+")
+_SPACES = re.compile(r"\s+")
+
 
-def _norm_merchant(text: str) -> str:
-    value = (text or "").lower()
-    value = re.sub(r"\d+", "", value)
-    value = re.sub(r"[^a-z ]+", " ", value)
-    value = re.sub(r"\s+", " ", value).strip()
+@lru_cache(maxsize=65536)
+def normalize_merchant(text: str) -> str:
+    value = _DIGITS.sub("", (text or "").lower())
+    value = _NON_ALPHA.sub(" ", value)
+    value = _SPACES.sub(" ", value).strip()
     return value or "unknown"
 
 
-def _parse_posted_on(row: dict[str, Any]) -> date | None:
-    try:
-        return date.fromisoformat(str(row.get("posted_on")))
-    except Exception:
-        return None
+def detect_recurring(frame: TransactionFrame) -> list[dict[str, Any]]:
+    """
+    Find recurring debits for every merchant at once.
 
+    - raw descriptions are normalized once per distinct string, then rows are sorted
+      by (merchant, day) and intervals come from one `np.diff`
+    - a merchant's cadence is the CADENCES band holding its median interval; amounts must
+      stay within max($3, 25% of the average)
+    """
+    debits = frame.select(~frame.is_credit)
+    if not len(debits):
+        return []
+    index: dict[str, int] = {}
+    lookup = np.array([index.setdefault(normalize_merchant(name), len(index)) for name in debits.merchant_names], dtype=np.int32)
+    names = list(index)
+    codes = lookup[debits.merchant_codes]
+    size = len(names)
 
-def _detect(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    by_merchant: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for row in rows:
-        if row.get("txn_type") == "credit":
-            continue
-        by_merchant[_norm_merchant(str(row.get("description") or ""))].append(row)
+    order = np.lexsort((debits.day, codes))
+    codes = codes[order]
+    days = debits.day[order].astype(np.int64)
+    cents = debits.amount_cents[order]
+    counts = group_count(codes, size)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = np.flatnonzero(counts)
 
-    candidates: list[dict[str, Any]] = []
-    for merchant, entries in by_merchant.items():
-        parsed = []
-        for row in entries:
-            posted = _parse_posted_on(row)
-            if posted is None:
-                continue
-            parsed.append((posted, float(row.get("amount") or 0.0), row))
-        parsed.sort(key=lambda x: x[0])
-        if len(parsed) < 3:
-            continue
+    same = codes[1:] == codes[:-1]
+    deltas = np.diff(days)[same]
+    delta_codes = codes[1:][same]
+    median_interval = group_median(delta_codes, deltas, size)
+    mean_interval = np.divide(
+        np.bincount(delta_codes, weights=deltas, minlength=size), counts - 1, out=np.zeros(size), where=counts > 1
+    )
+    totals = np.bincount(codes, weights=cents, minlength=size)
+    low = np.minimum.reduceat(cents, starts[present]) if len(present) else np.zeros(0, dtype=np.int64)
+    high = np.maximum.reduceat(cents, starts[present]) if len(present) else np.zeros(0, dtype=np.int64)
 
-        deltas = [(parsed[i][0] - parsed[i - 1][0]).days for i in range(1, len(parsed))]
-        avg_delta = mean(deltas)
-        if not (24 <= avg_delta <= 38):
+    candidates: list[dict[str, Any]] = []
+    for position, code in enumerate(present.tolist()):
+        count = int(counts[code])
+        cadence = classify_cadence(float(median_interval[code]), count)
+        if cadence is None:
             continue
-
-        amounts = [p[1] for p in parsed]
-        avg_amount = mean(amounts)
-        spread = max(amounts) - min(amounts)
-        if avg_amount <= 0 or spread > max(3.0, avg_amount * 0.25):
+        avg_cents = totals[code] / count
+        spread = int(high[position] - low[position])
+        if not stable_amount(avg_cents, spread):
             continue
 
-        next_est = parsed[-1][0].toordinal() + round(avg_delta)
+        last = starts[code] + count - 1
+        avg_interval = float(mean_interval[code])
         candidates.append(
             {
-                "merchant": merchant,
-                "count": len(parsed),
-                "avg_amount": round(avg_amount, 2),
-                "avg_interval_days": round(avg_delta, 1),
-                "amount_spread": round(spread, 2),
-                "last_seen": parsed[-1][0].isoformat(),
-                "next_expected_on": date.fromordinal(next_est).isoformat(),
-                "examples": [p[2]["description"] for p in parsed[-2:]],
+                "merchant": names[code],
+                "cadence": cadence[0],
+                "count": count,
+                "avg_amount": round(avg_cents / 100, 2),
+                "avg_interval_days": round(avg_interval, 1),
+                "amount_spread": round(spread / 100, 2),
+                "last_seen": date.fromordinal(int(days[last])).isoformat(),
+                "next_expected_on": date.fromordinal(int(days[last]) + round(avg_interval)).isoformat(),
+                "examples": [debits.merchant_names[debits.merchant_codes[order[i]]] for i in range(max(starts[code], last - 1), last + 1)],
             }
         )
 
     return sorted(candidates, key=lambda x: (x["count"], x["avg_amount"]), reverse=True)
 
 
-class _RecurringBase(Tool):
-    description = "Detect likely recurring charges (subscriptions and repeating bills) from recent debit transactions."
+def recurring_row_mask(frame: TransactionFrame, merchants: set[str]) -> np.ndarray:
+    """Debit rows whose normalized merchant is in `merchants` (as returned by `detect_recurring`)."""
+    by_code = np.array([normalize_merchant(name) in merchants for name in frame.merchant_names], dtype=bool)
+    return by_code[frame.merchant_codes] & ~frame.is_credit if len(by_code) else np.zeros(len(frame), dtype=bool)
+
+
+def fold_into_index(entries: dict[str, SubscriptionEntry], debits: TransactionFrame) -> dict[str, SubscriptionEntry]:
+    """
+    Fold new debits into per-merchant index entries (in place).
+
+    Rows are grouped by normalized merchant and sorted by day, so each entry gets one
+    `add_charges` call; returns the entries touched.
+    """
+    if not len(debits):
+        return {}
+    index: dict[str, int] = {}
+    lookup = np.array([index.setdefault(normalize_merchant(name), len(index)) for name in debits.merchant_names], dtype=np.int32)
+    names = list(index)
+    codes = lookup[debits.merchant_codes]
+    order = np.lexsort((debits.day, codes))
+
+    touched: dict[str, SubscriptionEntry] = {}
+    for group in np.split(order, np.flatnonzero(np.diff(codes[order])) + 1):
+        merchant = names[codes[group[0]]]
+        entry = entries.setdefault(merchant, SubscriptionEntry(merchant=merchant))
+        entry.add_charges(
+            debits.day[group].tolist(),
+            debits.amount_cents[group].tolist(),
+            [debits.merchant_names[code] for code in debits.merchant_codes[group[-2:]].tolist()],
+        )
+        touched[merchant] = entry
+    return touched
+
+
+def _incremental_enabled(request: ToolRequest) -> bool:
+    return incremental_enabled(request, "LEDGERMIND_SUBSCRIPTION_INDEX")
+
+
+def _flag_changes(request: ToolRequest) -> bool:
+    args = request.args if isinstance(request.args, dict) else {}
+    value = args.get("flag_changes", False)
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() not in {"", "0", "false", "no", "off"}
+
+
+class _RecurringBase(TransactionTool):
+    """
+    Recurring-charge detection.
+
+    By default the lookback window is rescanned on every call. With `incremental` (arg,
+    or LEDGERMIND_SUBSCRIPTION_INDEX=true) answers come from a SubscriptionIndex keyed by
+    ledger and filters:
+    - the first call builds it from `lookback_days` of debits
+    - later calls fetch only rows posted on or after the stored watermark date and fold
+      the unseen ones into their merchant entries
+    - merchants last charged before the requested start are left out of `detected`
+    `flag_changes: true` adds per-subscription `alerts` (missed or changed charges).
+    """
+
+    description = (
+        "Detect likely recurring charges (subscriptions and repeating bills) from recent debit transactions. "
+        "`incremental: true` answers from a persisted subscription index; `flag_changes: true` adds missed "
+        "and changed-amount alerts."
+    )
+    lookback_days = 180
+
+    def __init__(self, index: SubscriptionIndex | None = None) -> None:
+        self._index = index
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        filters = super().transaction_filters(request)
+        if not _incremental_enabled(request):
+            return filters
+        watermark, _ = self._get_index().load(scope_key(request, filters, "subscriptions"))
+        fetch_range = incremental_fetch_range(filters, watermark, self.lookback_days)
+        if fetch_range is None:
+            return None
+        return {**filters, "date_range": {"start": fetch_range[0], "end": fetch_range[1]}}
 
     def run(self, request: ToolRequest) -> ToolResponse:
         logger.info("run start request_id=%s tool=%s", request.request_id, self.name)
-        rows, filters = fetch_transaction_rows(request, default_days=180)
+        if _incremental_enabled(request):
+            return self._run_incremental(request)
+        frame, filters = fetch_transaction_frame(request, default_days=self.lookback_days)
+        detected = detect_recurring(frame)
+        if _flag_changes(request):
+            entries: dict[str, SubscriptionEntry] = {}
+            fold_into_index(entries, frame.select(~frame.is_credit))
+            today = date.today()
+            for item in detected:
+                item["alerts"] = entries[item["merchant"]].alerts(today, item["cadence"])
         result = {
-            "detected": _detect(rows),
-            "transaction_count": len(rows),
+            "detected": detected,
+            "transaction_count": len(frame),
             "filters_used": filters,
         }
         return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
 
+    def _run_incremental(self, request: ToolRequest) -> ToolResponse:
+        filters = ensure_date_range(_extract_request_filters(request), default_days=self.lookback_days)
+        scope = scope_key(request, filters, "subscriptions")
+        index = self._get_index()
+
+        def refresh() -> tuple[Watermark | None, dict[str, SubscriptionEntry], int, int]:
+            watermark, entries = index.load(scope)
+            fetch_range = incremental_fetch_range(filters, watermark, self.lookback_days)
+            if fetch_range is None:
+                return watermark, entries, 0, 0
+            request.filters = TransactionQuery.model_validate({**filters, "date_range": {"start": fetch_range[0], "end": fetch_range[1]}})
+            frame, _ = fetch_transaction_frame(request, default_days=self.lookback_days)
+            debits = unseen_rows(frame.select(~frame.is_credit), watermark)
+            touched = fold_into_index(entries, debits)
+            saved = advance_watermark(debits, fetch_range[1], watermark)
+            index.save(scope, saved, touched, previous=watermark)
+            return saved, entries, len(frame), len(debits)
+
+        # Serialized per scope so concurrent calls cannot fold the same charges twice.
+        watermark, entries, fetched, new_debits = serialized_refresh(scope, refresh)
+
+        start = date.fromisoformat(filters["date_range"]["start"]).toordinal()
+        today = date.today() if _flag_changes(request) else None
+        detected = [
+            record
+            for entry in entries.values()
+            if entry.last_day >= start and (record := entry.summary(today)) is not None
+        ]
+        result = {
+            "detected": sorted(detected, key=lambda x: (x["count"], x["avg_amount"]), reverse=True),
+            "transaction_count": fetched,
+            "new_debits": new_debits,
+            "index": {
+                "incremental": True,
+                "through": watermark.through if watermark is not None else None,
+                "merchants": len(entries),
+            },
+            "filters_used": filters,
+        }
+        return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
+
+    def _get_index(self) -> SubscriptionIndex:
+        if self._index is None:
+            self._index = SubscriptionIndex()
+        return self._index
+
     def spec(self) -> ToolSpec:
         return ToolSpec(name=self.name, description=self.description, args_schema=ToolArgs.model_json_schema())
 
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from domain.schemas import ToolArgs, ToolRequest, ToolResponse
+from logs import get_logger
+from tools._transactions_support import fetch_transaction_frame
+from tools.base import TransactionTool, ToolSpec
+from tools.forecast.engine import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_HORIZONS,
+    FORECAST_METHOD,
+    MAX_HORIZON_DAYS,
+    forecast_cashflow,
+    lookback_window,
+)
+from tools.registry import register_tool
+
+
+def _forecast_args(request: ToolRequest) -> tuple[tuple[int, ...] | None, float | None]:
+    args = request.args if isinstance(request.args, dict) else {}
+    raw_horizons = args.get("horizons") or DEFAULT_HORIZONS
+    try:
+        horizons = tuple(sorted({int(value) for value in raw_horizons}))
+    except (TypeError, ValueError):
+        horizons = ()
+    try:
+        confidence = float(args.get("confidence") or DEFAULT_CONFIDENCE)
+    except (TypeError, ValueError):
+        confidence = -1.0
+    valid_horizons = horizons if horizons and all(1 <= h <= MAX_HORIZON_DAYS for h in horizons) else None
+    return valid_horizons, confidence if 0 < confidence < 1 else None
+
+
+@register_tool
+class CashflowForecastTool(TransactionTool):
+    """Every requested horizon and its band from one fetch and one daily series (see `forecast_cashflow`)."""
+
+    name = "forecast.cashflow"
+    description = (
+        "Project income, spend and net cashflow for several horizons (default 30, 60 and 90 days) with "
+        "weekday/day-of-month seasonality, scheduled recurring charges and a confidence band. "
+        "Optional `horizons` (list of days) and `confidence` (default 0.8)."
+    )
+    lookback_days = 180
+
+    def run(self, request: ToolRequest) -> ToolResponse:
+        logger.info("run start request_id=%s", request.request_id)
+        horizons, confidence = _forecast_args(request)
+        errors = []
+        if horizons is None:
+            errors.append(f"horizons must be a list of days between 1 and {MAX_HORIZON_DAYS}")
+        if confidence is None:
+            errors.append("confidence must be between 0 and 1")
+        if errors:
+            return ToolResponse(request_id=request.request_id, tool=self.name, ok=False, errors=errors, context=request.context)
+
+        frame, filters = fetch_transaction_frame(request, default_days=self.lookback_days)
+        start, days = lookback_window(filters, self.lookback_days)
+        forecast = forecast_cashflow(frame, start, days, date.today() + timedelta(days=1), horizons, confidence)
+        result: dict[str, Any] = {
+            "lookback_days": days,
+            "lookback_transaction_count": len(frame),
+            **forecast,
+            "method": FORECAST_METHOD,
+            "filters_used": filters,
+        }
+        return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
+
+    def spec(self) -> ToolSpec:
+        return ToolSpec(name=self.name, description=self.description, args_schema=ToolArgs.model_json_schema())
+logger = get_logger("Tool:forecast.cashflow")
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+
+from domain.transaction_frame import TransactionFrame
+from tools.detect.recurring_charges import detect_recurring, recurring_row_mask
+
+DEFAULT_HORIZONS = (30, 60, 90)
+MAX_HORIZON_DAYS = 365
+DEFAULT_CONFIDENCE = 0.8
+FORECAST_METHOD = "weekday/day-of-month seasonal daily model plus scheduled recurring charges"
+# Seasonal effects are group sums over (count + _SHRINK): sparse weekdays/days of month
+# are pulled toward the overall level instead of echoing one unusual day.
+_SHRINK = 2.0
+
+
+def lookback_window(filters: dict[str, Any], default_days: int) -> tuple[date, int]:
+    """(start, days) of the filters' date range, else the `default_days` ending today."""
+    date_range = filters.get("date_range", {})
+    try:
+        start = date.fromisoformat(str(date_range.get("start")))
+        end = date.fromisoformat(str(date_range.get("end")))
+        return start, max((end - start).days + 1, 1)
+    except Exception:
+        return date.today() - timedelta(days=default_days - 1), default_days
+
+
+def daily_flows(frame: TransactionFrame, start: date, days: int) -> np.ndarray:
+    """Dense (2, days) cents array of daily income (row 0) and spend (row 1) from `start`."""
+    offset = frame.day.astype(np.int64) - start.toordinal()
+    inside = (offset >= 0) & (offset < days)
+    flows = np.zeros((2, days))
+    for row, mask in enumerate((inside & frame.is_credit, inside & ~frame.is_credit)):
+        flows[row] = np.bincount(offset[mask], weights=frame.amount_cents[mask], minlength=days)
+    return flows
+
+
+def _calendar(start: date, days: int) -> tuple[np.ndarray, np.ndarray]:
+    """Weekday (Monday=0) and zero-based day-of-month codes for `days` days from `start`."""
+    dates = np.datetime64(start.isoformat(), "D") + np.arange(days)
+    weekday = (dates.astype(np.int64) + 3) % 7
+    day_of_month = (dates - dates.astype("datetime64[M]")).astype(np.int64)
+    return weekday, day_of_month
+
+
+def _effects(values: np.ndarray, codes: np.ndarray, size: int) -> np.ndarray:
+    counts = np.bincount(codes, minlength=size)
+    sums = np.stack([np.bincount(codes, weights=row, minlength=size) for row in values])
+    return sums / (counts + _SHRINK)
+
+
+def scheduled_spend(
+    recurring: list[dict[str, Any]], start: date, days: int, window_end: date
+) -> tuple[np.ndarray, list[dict[str, Any]]]:
+    """
+    Daily cents of detected recurring charges over `days` days from `start`.
+
+    - each charge repeats every rounded `avg_interval_days` from `next_expected_on`, rolled
+      forward to `start`
+    - charges already a full period overdue at `window_end` are treated as cancelled
+    """
+    spend = np.zeros(days)
+    events: list[dict[str, Any]] = []
+    first = start.toordinal()
+    for item in recurring:
+        period = max(1, round(item["avg_interval_days"]))
+        next_day = date.fromisoformat(item["next_expected_on"]).toordinal()
+        if next_day + period <= window_end.toordinal():
+            continue
+        if next_day < first:
+            next_day += -(-(first - next_day) // period) * period
+        offsets = np.arange(next_day - first, days, period)
+        if not len(offsets):
+            continue
+        spend[offsets] += round(item["avg_amount"] * 100)
+        events.append(
+            {
+                "merchant": item["merchant"],
+                "cadence": item["cadence"],
+                "amount": item["avg_amount"],
+                "dates": [(start + timedelta(days=int(offset))).isoformat() for offset in offsets],
+            }
+        )
+    return spend, events
+
+
+def forecast_cashflow(
+    frame: TransactionFrame,
+    window_start: date,
+    window_days: int,
+    forecast_start: date,
+    horizons: tuple[int, ...] = DEFAULT_HORIZONS,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> dict[str, Any]:
+    """
+    Project income, spend and net for every horizon from one daily series.
+
+    - recurring debits (`detect_recurring`) are taken out of the history and replayed
+      forward as scheduled charges
+    - the rest is a per-series level plus shrunk weekday and day-of-month effects, fitted
+      on the dense daily arrays
+    - the net band is +/- z * sigma * sqrt(h), sigma being the daily net residual deviation
+    """
+    window_end = window_start + timedelta(days=window_days - 1)
+    recurring = detect_recurring(frame)
+    base = frame.select(~recurring_row_mask(frame, {item["merchant"] for item in recurring}))
+
+    flows = daily_flows(base, window_start, window_days)
+    weekday, day_of_month = _calendar(window_start, window_days)
+    level = flows.mean(axis=1, keepdims=True)
+    centred = flows - level
+    weekly = _effects(centred, weekday, 7)
+    monthly = _effects(centred - weekly[:, weekday], day_of_month, 31)
+    residual = centred - weekly[:, weekday] - monthly[:, day_of_month]
+    sigma = float(np.std(residual[0] - residual[1], ddof=1)) if window_days > 1 else 0.0
+
+    longest = max(horizons)
+    future_weekday, future_day_of_month = _calendar(forecast_start, longest)
+    path = np.clip(level + weekly[:, future_weekday] + monthly[:, future_day_of_month], 0.0, None)
+    scheduled, events = scheduled_spend(recurring, forecast_start, longest, window_end)
+    path[1] += scheduled
+    cumulative = np.cumsum(path, axis=1)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    projections: list[dict[str, Any]] = []
+    for horizon in horizons:
+        income, spend = cumulative[:, horizon - 1] / 100
+        spread = z * sigma * np.sqrt(horizon) / 100
+        projections.append(
+            {
+                "horizon_days": horizon,
+                "start": forecast_start.isoformat(),
+                "end": (forecast_start + timedelta(days=horizon - 1)).isoformat(),
+                "net_cashflow": round(float(income - spend), 2),
+                "spend": round(float(spend), 2),
+                "income": round(float(income), 2),
+                "scheduled_spend": round(float(scheduled[:horizon].sum()) / 100, 2),
+                "net_low": round(float(income - spend - spread), 2),
+                "net_high": round(float(income - spend + spread), 2),
+            }
+        )
+    return {
+        "projections": projections,
+        "confidence": confidence,
+        "scheduled_events": events,
+        "baseline_daily_income": round(float(level[0, 0]) / 100, 2),
+        "baseline_daily_spend": round(float(level[1, 0]) / 100, 2),
+        "daily_net_std": round(sigma / 100, 2),
+    }
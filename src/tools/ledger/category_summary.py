@@ -1,60 +1,106 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Any
 
+import numpy as np
+
 from domain.schemas import ToolArgs, ToolRequest, ToolResponse
+from domain.transaction_frame import TransactionFrame, cents_to_float, group_count, group_sum
+from infrastructure.persistence.ledger_rollup import LedgerRollup
 from logs import get_logger
-from tools._transactions_support import fetch_transaction_rows
-from tools.base import Tool, ToolSpec
+from tools._rollup_support import refresh_rollup, rollup_enabled, rollup_months
+from tools._transactions_support import _extract_request_filters, ensure_date_range, fetch_transaction_frame
+from tools.base import TransactionTool, ToolSpec
 from tools.registry import register_tool
 
 
-def _build_category_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    groups: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "category": "uncategorized",
-            "txn_count": 0,
-            "debit_total": 0.0,
-            "credit_total": 0.0,
-            "net_total": 0.0,
+def _build_category_summary(frame: TransactionFrame) -> dict[str, Any]:
+    size = len(frame.category_names)
+    counts = group_count(frame.category_codes, size)
+    credit = group_sum(frame.category_codes, np.where(frame.is_credit, frame.amount_cents, 0), size)
+    debit = group_sum(frame.category_codes, np.where(frame.is_credit, 0, frame.amount_cents), size)
+    # Stable sort keeps first-appearance order between equal totals.
+    order = np.argsort(-(debit + credit), kind="stable")
+
+    categories = [
+        {
+            "category": frame.category_names[code],
+            "txn_count": int(counts[code]),
+            "debit_total": cents_to_float(debit[code]),
+            "credit_total": cents_to_float(credit[code]),
+            "net_total": cents_to_float(credit[code] - debit[code]),
         }
-    )
+        for code in order.tolist()
+    ]
+    return {
+        "categories": categories,
+        "category_count": len(categories),
+        "total_debit": cents_to_float(debit.sum()),
+        "total_credit": cents_to_float(credit.sum()),
+        "net_total": cents_to_float(credit.sum() - debit.sum()),
+        "transaction_count": len(frame),
+    }
 
-    for row in rows:
-        category = str(row.get("category") or "uncategorized")
-        amount = float(row.get("amount") or 0.0)
-        txn_type = str(row.get("txn_type") or "debit")
-        entry = groups[category]
-        entry["category"] = category
-        entry["txn_count"] += 1
-        if txn_type == "credit":
-            entry["credit_total"] += amount
-            entry["net_total"] += amount
-        else:
-            entry["debit_total"] += amount
-            entry["net_total"] -= amount
 
-    categories = sorted(groups.values(), key=lambda x: (x["debit_total"] + x["credit_total"]), reverse=True)
+def _rollup_category_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    rows = sorted(rows, key=lambda row: -(row["debit_cents"] + row["credit_cents"]))
+    debit = sum(row["debit_cents"] for row in rows)
+    credit = sum(row["credit_cents"] for row in rows)
+    categories = [
+        {
+            "category": row["category_name"],
+            "txn_count": row["debit_count"] + row["credit_count"],
+            "debit_total": cents_to_float(row["debit_cents"]),
+            "credit_total": cents_to_float(row["credit_cents"]),
+            "net_total": cents_to_float(row["credit_cents"] - row["debit_cents"]),
+        }
+        for row in rows
+    ]
     return {
         "categories": categories,
         "category_count": len(categories),
-        "total_debit": round(sum(c["debit_total"] for c in categories), 2),
-        "total_credit": round(sum(c["credit_total"] for c in categories), 2),
-        "net_total": round(sum(c["net_total"] for c in categories), 2),
+        "total_debit": cents_to_float(debit),
+        "total_credit": cents_to_float(credit),
+        "net_total": cents_to_float(credit - debit),
+        "transaction_count": sum(category["txn_count"] for category in categories),
+        "rollup": True,
     }
 
 
-class _CategorySummaryBase(Tool):
+class _CategorySummaryBase(TransactionTool):
     name = "ledgers.category_summary"
-    description = "Summarize spend/income totals grouped by category for the filtered transaction date range."
+    description = (
+        "Summarize spend/income totals grouped by category for the filtered transaction date range. "
+        "`incremental: true` answers whole-month ranges from the persisted monthly rollup."
+    )
+
+    def __init__(self, rollup: LedgerRollup | None = None) -> None:
+        self._rollup = rollup
 
     def run(self, request: ToolRequest) -> ToolResponse:
         logger.info("run start request_id=%s", request.request_id)
-        rows, filters = fetch_transaction_rows(request, default_days=30)
-        result = _build_category_summary(rows)
+        months = None
+        if rollup_enabled(request):
+            filters = ensure_date_range(_extract_request_filters(request), default_days=self.lookback_days)
+            months = rollup_months(filters)
+        if months is not None:
+            if self._rollup is None:
+                self._rollup = LedgerRollup()
+            scope = refresh_rollup(self._rollup, request, filters, *months)
+            rows = self._rollup.totals(
+                scope,
+                months[0].strftime("%Y-%m"),
+                months[1].strftime("%Y-%m"),
+                group_by=("category",),
+                accounts=filters.get("accounts"),
+                categories=filters.get("categories"),
+                currency=filters.get("currency"),
+            )
+            result = _rollup_category_summary(rows)
+        else:
+            frame, filters = fetch_transaction_frame(request, default_days=self.lookback_days)
+            result = _build_category_summary(frame)
         result["filters_used"] = filters
-        result["transaction_count"] = len(rows)
         return ToolResponse(
             request_id=request.request_id,
             tool=self.name,
@@ -62,6 +108,13 @@ class _CategorySummaryBase(Tool):
             context=request.context,
         )
 
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        filters = super().transaction_filters(request)
+        if filters is not None and rollup_enabled(request) and rollup_months(filters) is not None:
+            # The rollup fetches only what it is missing; nothing to prefetch.
+            return None
+        return filters
+
     def spec(self) -> ToolSpec:
         return ToolSpec(name=self.name, description=self.description, args_schema=ToolArgs.model_json_schema())
 
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+from domain.schemas import ToolRequest, ToolResponse
+from domain.transaction_frame import TransactionFrame, cents_to_float
+from logs import get_logger
+from tools._transactions_support import _coerce_date, _extract_request_filters, fetch_filtered_frame
+from tools.base import TransactionTool, ToolSpec
+from tools.registry import register_tool
+
+PERIOD_NAMES = ("previous", "current")
+
+
+def _default_ranges(today: date) -> dict[str, tuple[date, date]]:
+    """Month to date against the same days of the previous month, clipped to that month's end."""
+    current_start = today.replace(day=1)
+    previous_month_end = current_start - timedelta(days=1)
+    previous_start = previous_month_end.replace(day=1)
+    previous_end = min(previous_start + timedelta(days=today.day - 1), previous_month_end)
+    return {"previous": (previous_start, previous_end), "current": (current_start, today)}
+
+
+def _compare_args(request: ToolRequest) -> tuple[dict[str, Any] | None, list[str]]:
+    args = request.args if isinstance(request.args, dict) else {}
+    ranges = _default_ranges(date.today())
+    errors = []
+    for name in PERIOD_NAMES:
+        raw = args.get(name)
+        if raw is None:
+            continue
+        start = _coerce_date(raw.get("start")) if isinstance(raw, dict) else None
+        end = _coerce_date(raw.get("end")) if isinstance(raw, dict) else None
+        if start is None or end is None or start > end:
+            errors.append(f"{name} must be a date range {{start, end}} with start <= end")
+            continue
+        ranges[name] = (start, end)
+    try:
+        top = int(args.get("top", 20))
+    except (TypeError, ValueError):
+        top = 0
+    if top < 1:
+        errors.append("top must be a positive integer")
+    if not errors:
+        (previous_start, previous_end), (current_start, current_end) = ranges["previous"], ranges["current"]
+        if previous_start <= current_end and current_start <= previous_end:
+            errors.append("previous and current ranges must not overlap")
+    if errors:
+        return None, errors
+    return {"ranges": ranges, "top": top}, []
+
+
+def _period_filters(request: ToolRequest, ranges: dict[str, tuple[date, date]]) -> list[dict[str, Any]]:
+    """One filter set per period, so the gap between the ranges is never fetched."""
+    filter_sets = []
+    for name in PERIOD_NAMES:
+        start, end = ranges[name]
+        filters = _extract_request_filters(request)
+        filters["date_range"] = {"start": start.isoformat(), "end": end.isoformat()}
+        filter_sets.append(filters)
+    return filter_sets
+
+
+def period_tags(frame: TransactionFrame, ranges: dict[str, tuple[date, date]]) -> np.ndarray:
+    """Index into PERIOD_NAMES for every row, or -1 for rows outside both ranges."""
+    tags = np.full(len(frame), -1, dtype=np.int64)
+    for index, name in enumerate(PERIOD_NAMES):
+        start, end = ranges[name]
+        tags[(frame.day >= start.toordinal()) & (frame.day <= end.toordinal())] = index
+    return tags
+
+
+def compare_frame(frame: TransactionFrame, ranges: dict[str, tuple[date, date]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(period x category) debit cents, credit cents and counts, each from one bincount over the tagged rows."""
+    width = max(len(frame.category_names), 1)
+    tags = period_tags(frame, ranges)
+    keep = tags >= 0
+    cells = tags[keep] * width + frame.category_codes[keep]
+    is_credit = frame.is_credit[keep]
+    amounts = frame.amount_cents[keep]
+    size = len(PERIOD_NAMES) * width
+    debit = np.bincount(cells, weights=np.where(is_credit, 0, amounts), minlength=size).reshape(-1, width)
+    credit = np.bincount(cells, weights=np.where(is_credit, amounts, 0), minlength=size).reshape(-1, width)
+    counts = np.bincount(cells, minlength=size).reshape(-1, width)
+    return debit.round().astype(np.int64), credit.round().astype(np.int64), counts
+
+
+def _change_pct(new: int, old: int) -> float | None:
+    return round((new - old) / abs(old) * 100, 1) if old else None
+
+
+@register_tool
+class ComparePeriodsTool(TransactionTool):
+    """
+    Side-by-side totals for two date ranges, fetched as two ranges into one frame.
+
+    Each row is tagged with its range in a single scan, so the per-category deltas
+    come from one bincount per measure rather than two full summaries.
+    """
+
+    name = "ledgers.compare_periods"
+    description = (
+        "Compare spending and income between two date ranges, e.g. this month vs last month. "
+        "Args: `current` and `previous` ({start, end}; default month to date vs the same days of the previous month), "
+        "optional `top` categories to return (default 20). Returns totals for each range, their changes and "
+        "per-category deltas ranked by absolute change."
+    )
+
+    def run(self, request: ToolRequest) -> ToolResponse:
+        logger.info("run start request_id=%s", request.request_id)
+        options, errors = _compare_args(request)
+        if options is None:
+            return ToolResponse(request_id=request.request_id, tool=self.name, ok=False, errors=errors, context=request.context)
+
+        ranges = options["ranges"]
+        filter_sets = _period_filters(request, ranges)
+        frame = fetch_filtered_frame(*filter_sets)
+        filters = {key: value for key, value in filter_sets[0].items() if key != "date_range"}
+        filters["date_ranges"] = [filter_set["date_range"] for filter_set in filter_sets]
+        debit, credit, counts = compare_frame(frame, ranges)
+        previous, current = 0, 1
+
+        periods = {}
+        for index, name in enumerate(PERIOD_NAMES):
+            start, end = ranges[name]
+            periods[name] = {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "days": (end - start).days + 1,
+                "transaction_count": int(counts[index].sum()),
+                "debit_total": cents_to_float(debit[index].sum()),
+                "credit_total": cents_to_float(credit[index].sum()),
+                "net_cashflow": cents_to_float(credit[index].sum() - debit[index].sum()),
+            }
+
+        debit_change = debit[current] - debit[previous]
+        credit_change = credit[current] - credit[previous]
+        net_change = credit_change - debit_change
+        present = np.flatnonzero(counts.sum(axis=0))
+        magnitude = np.maximum(np.abs(debit_change), np.abs(credit_change))[present]
+        ranked = present[np.argsort(-magnitude, kind="stable")][: options["top"]]
+        categories = [
+            {
+                "category": frame.category_names[code],
+                "previous_debit": cents_to_float(debit[previous, code]),
+                "current_debit": cents_to_float(debit[current, code]),
+                "debit_change": cents_to_float(debit_change[code]),
+                "debit_change_pct": _change_pct(int(debit[current, code]), int(debit[previous, code])),
+                "previous_credit": cents_to_float(credit[previous, code]),
+                "current_credit": cents_to_float(credit[current, code]),
+                "credit_change": cents_to_float(credit_change[code]),
+                "net_change": cents_to_float(net_change[code]),
+                "previous_count": int(counts[previous, code]),
+                "current_count": int(counts[current, code]),
+            }
+            for code in ranked.tolist()
+        ]
+
+        total_debit = debit.sum(axis=1)
+        total_credit = credit.sum(axis=1)
+        result = {
+            "periods": periods,
+            "change": {
+                "debit_change": cents_to_float(total_debit[current] - total_debit[previous]),
+                "debit_change_pct": _change_pct(int(total_debit[current]), int(total_debit[previous])),
+                "credit_change": cents_to_float(total_credit[current] - total_credit[previous]),
+                "credit_change_pct": _change_pct(int(total_credit[current]), int(total_credit[previous])),
+                "net_change": cents_to_float(
+                    (total_credit[current] - total_debit[current]) - (total_credit[previous] - total_debit[previous])
+                ),
+                "transaction_count_change": periods["current"]["transaction_count"] - periods["previous"]["transaction_count"],
+            },
+            "categories": categories,
+            "category_count": len(present),
+            "filters_used": filters,
+        }
+        return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        # Two disjoint ranges; see transaction_filter_sets.
+        return None
+
+    def transaction_filter_sets(self, request: ToolRequest) -> list[dict[str, Any]]:
+        options, _ = _compare_args(request)
+        if options is None:
+            return []
+        return _period_filters(request, options["ranges"])
+
+    def spec(self) -> ToolSpec:
+        date_range = {
+            "type": "object",
+            "properties": {"start": {"type": "string", "format": "date"}, "end": {"type": "string", "format": "date"}},
+            "required": ["start", "end"],
+        }
+        return ToolSpec(
+            name=self.name,
+            description=self.description,
+            args_schema={
+                "type": "object",
+                "properties": {
+                    "current": date_range,
+                    "previous": date_range,
+                    "top": {"type": "integer", "minimum": 1},
+                    "currency": {"type": "string"},
+                    "filters": {"type": "object"},
+                },
+            },
+        )
+logger = get_logger("Tool:ledgers.compare_periods")
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from calendar import month_name
-from collections import Counter
+from calendar import month_name, monthrange
 from datetime import date
 from typing import Any
 
+import numpy as np
+
 from domain.schemas import ToolRequest, ToolResponse, TransactionQuery
+from domain.transaction_frame import TransactionFrame, cents_to_float, group_count, group_sum, month_codes, month_start
+from infrastructure.persistence.ledger_rollup import LedgerRollup
 from logs import get_logger
-from tools._transactions_support import _extract_request_filters, fetch_transaction_rows, set_month_date_range
-from tools.base import Tool, ToolSpec
+from tools._rollup_support import refresh_rollup, rollup_enabled, rollup_months
+from tools._transactions_support import _extract_request_filters, ensure_date_range, fetch_transaction_frame
+from tools.base import TransactionTool, ToolSpec
 from tools.registry import register_tool
 
+MAX_MONTHS = 120
+_TOP_CATEGORIES = 5
+
 
 def _as_int(value: Any) -> int | None:
     try:
@@ -19,62 +26,246 @@ def _as_int(value: Any) -> int | None:
         return None
 
 
+def _month_code(year: int | None, month_number: int | None) -> int | None:
+    """Months since 1970-01 (as `month_codes`), or None for an invalid month."""
+    if year is None or month_number is None or not 1 <= month_number <= 12 or not 1970 <= year <= 9999:
+        return None
+    return (year - 1970) * 12 + month_number - 1
+
+
+def _parse_month(item: Any, default_year: int) -> int | None:
+    if isinstance(item, dict):
+        return _month_code(_as_int(item.get("year")) or default_year, _as_int(item.get("month_number") or item.get("month")))
+    if isinstance(item, str) and "-" in item:
+        year, _, month = item.partition("-")
+        return _month_code(_as_int(year), _as_int(month))
+    return _month_code(default_year, _as_int(item))
+
+
+def _year_range_months(value: Any) -> list[int] | None:
+    """Every month of the years in `value` (a year or {"start", "end"}), stopping at the current month."""
+    if isinstance(value, dict):
+        first, last = _as_int(value.get("start")), _as_int(value.get("end") or value.get("start"))
+    else:
+        first = last = _as_int(value)
+    if first is None or last is None or last < first:
+        return None
+    start, end = _month_code(first, 1), _month_code(last, 12)
+    if start is None or end is None:
+        return None
+    today = date.today()
+    return list(range(start, min(end, _month_code(today.year, today.month)) + 1))
+
+
+def _month_args(request: ToolRequest) -> tuple[list[int] | None, bool]:
+    """
+    Requested month codes (sorted, unique) and whether this is a batch request.
+
+    - `months`: month numbers of `year`, "YYYY-MM" strings or {"year", "month_number"} items
+    - `year_range`: a year or {"start", "end"} years, every month up to the current one
+    - otherwise the single `month_number` of `year` (default current year)
+    """
+    args = request.args if isinstance(request.args, dict) else {}
+    year = _as_int(args.get("year")) or date.today().year
+    if isinstance(args.get("months"), list):
+        parsed = [_parse_month(item, year) for item in args["months"]]
+        codes = None if None in parsed else sorted(set(parsed))
+        batch = True
+    elif args.get("year_range") is not None:
+        codes = _year_range_months(args["year_range"])
+        batch = True
+    else:
+        code = _month_code(year, _as_int(args.get("month_number") or args.get("month")))
+        codes = None if code is None else [code]
+        batch = False
+    if not codes or len(codes) > MAX_MONTHS:
+        return None, batch
+    return codes, batch
+
+
+def _covering_filters(request: ToolRequest, codes: list[int]) -> dict[str, Any]:
+    first, last = month_start(codes[0]), month_start(codes[-1])
+    filters = _extract_request_filters(request)
+    filters["date_range"] = {
+        "start": first.isoformat(),
+        "end": last.replace(day=monthrange(last.year, last.month)[1]).isoformat(),
+    }
+    return filters
+
+
+def _frame_buckets(frame: TransactionFrame, codes: list[int]) -> tuple[np.ndarray, ...]:
+    """
+    Per requested month: debit cents, credit cents, row count, and debit cents / debit
+    counts per category, from one bucketing of the frame's rows.
+    """
+    requested = np.asarray(codes, dtype=np.int64)
+    size = len(requested)
+    months = month_codes(frame.day)
+    position = np.minimum(np.searchsorted(requested, months), size - 1)
+    keep = requested[position] == months
+    index = position[keep]
+    debit = np.where(frame.is_credit, 0, frame.amount_cents)[keep]
+    credit = np.where(frame.is_credit, frame.amount_cents, 0)[keep]
+    is_debit = ~frame.is_credit[keep]
+
+    categories = len(frame.category_names)
+    cells = index[is_debit] * categories + frame.category_codes[keep][is_debit]
+    by_category = group_sum(cells, debit[is_debit], size * categories).reshape(size, categories)
+    category_counts = group_count(cells, size * categories).reshape(size, categories)
+    return (
+        group_sum(index, debit, size),
+        group_sum(index, credit, size),
+        group_count(index, size),
+        by_category,
+        category_counts,
+    )
+
+
+def _month_record(code: int, debit_cents: int, credit_cents: int, count: int, top: list[tuple[str, int]]) -> dict[str, Any]:
+    start = month_start(code)
+    debit_total = cents_to_float(debit_cents)
+    credit_total = cents_to_float(credit_cents)
+    return {
+        "year": start.year,
+        "month_number": start.month,
+        "month_name": month_name[start.month],
+        "transaction_count": int(count),
+        "debit_total": debit_total,
+        "credit_total": credit_total,
+        "net_cashflow": round(credit_total - debit_total, 2),
+        "top_debit_categories": [{"category": name, "debit_total": cents_to_float(cents)} for name, cents in top],
+    }
+
+
+def _deltas(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Change between each pair of consecutive requested months."""
+    deltas = []
+    for previous, current in zip(records, records[1:]):
+        debit_change = round(current["debit_total"] - previous["debit_total"], 2)
+        deltas.append(
+            {
+                "from": f"{previous['year']}-{previous['month_number']:02d}",
+                "to": f"{current['year']}-{current['month_number']:02d}",
+                "debit_change": debit_change,
+                "credit_change": round(current["credit_total"] - previous["credit_total"], 2),
+                "net_change": round(current["net_cashflow"] - previous["net_cashflow"], 2),
+                "debit_change_pct": round(debit_change / previous["debit_total"] * 100, 1) if previous["debit_total"] else None,
+            }
+        )
+    return deltas
+
+
 @register_tool
-class MonthSummaryTool(Tool):
+class MonthSummaryTool(TransactionTool):
     name = "ledgers.month_summary"
     description = (
         "Summarize monthly spending/income totals and top categories. "
-        "Takes `month_number` (1-12) as an argument; optional `year` defaults to current year."
+        "Takes `month_number` (1-12) as an argument; optional `year` defaults to current year. "
+        "For several months pass `months` (month numbers or YYYY-MM) or `year_range` ({start, end} years); "
+        "one fetch covers them all and the result adds month-over-month deltas. "
+        "`incremental: true` answers from the persisted monthly rollup when the filters allow it."
     )
 
+    def __init__(self, rollup: LedgerRollup | None = None) -> None:
+        self._rollup = rollup
+
     def run(self, request: ToolRequest) -> ToolResponse:
         logger.info("run start request_id=%s", request.request_id)
-        args = request.args if isinstance(request.args, dict) else {}
-        month_number = _as_int(args.get("month_number") or args.get("month"))
-        year = _as_int(args.get("year")) or date.today().year
+        codes, batch = _month_args(request)
 
-        if month_number is None or month_number < 1 or month_number > 12:
+        if codes is None:
             return ToolResponse(
                 request_id=request.request_id,
                 tool=self.name,
                 ok=False,
-                errors=["month_number must be an integer from 1 to 12"],
+                errors=[
+                    f"months must be a non-empty list of up to {MAX_MONTHS} valid months"
+                    if batch
+                    else "month_number must be an integer from 1 to 12"
+                ],
                 context=request.context,
             )
 
-        filters = _extract_request_filters(request)
-        set_month_date_range(filters, year, month_number)
-        request.filters = TransactionQuery.model_validate(filters)
-        rows, filters = fetch_transaction_rows(request, default_days=31)
-
-        debit_total = round(sum(float(r.get("amount") or 0) for r in rows if r.get("txn_type") != "credit"), 2)
-        credit_total = round(sum(float(r.get("amount") or 0) for r in rows if r.get("txn_type") == "credit"), 2)
-        net_cashflow = round(credit_total - debit_total, 2)
+        request.filters = TransactionQuery.model_validate(_covering_filters(request, codes))
+        filters = ensure_date_range(_extract_request_filters(request), default_days=31)
+        use_rollup = rollup_enabled(request) and rollup_months(filters) is not None
+        if use_rollup:
+            records = self._records_from_rollup(request, filters, codes)
+        else:
+            frame, filters = fetch_transaction_frame(request, default_days=31)
+            records = self._records_from_frame(frame, codes)
+        extra = {"rollup": True} if use_rollup else {}
 
-        by_category = Counter()
-        for row in rows:
-            if row.get("txn_type") == "credit":
-                continue
-            by_category[str(row.get("category") or "uncategorized")] += float(row.get("amount") or 0)
-
-        top_categories = [
-            {"category": cat, "debit_total": round(total, 2)}
-            for cat, total in by_category.most_common(5)
-        ]
+        if not batch:
+            result = {**records[0], **extra, "filters_used": filters}
+            return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
 
+        debit_total = round(sum(record["debit_total"] for record in records), 2)
+        credit_total = round(sum(record["credit_total"] for record in records), 2)
         result = {
-            "year": year,
-            "month_number": month_number,
-            "month_name": month_name[month_number],
-            "transaction_count": len(rows),
+            "months": records,
+            "deltas": _deltas(records),
+            "month_count": len(records),
+            "transaction_count": sum(record["transaction_count"] for record in records),
             "debit_total": debit_total,
             "credit_total": credit_total,
-            "net_cashflow": net_cashflow,
-            "top_debit_categories": top_categories,
+            "net_cashflow": round(credit_total - debit_total, 2),
+            **extra,
             "filters_used": filters,
         }
         return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
 
+    @staticmethod
+    def _records_from_frame(frame: TransactionFrame, codes: list[int]) -> list[dict[str, Any]]:
+        debit, credit, counts, by_category, category_counts = _frame_buckets(frame, codes)
+        records = []
+        for i, code in enumerate(codes):
+            # Only categories with debits compete; stable sort keeps first-appearance order on ties.
+            candidates = np.flatnonzero(category_counts[i])
+            ranked = candidates[np.argsort(-by_category[i, candidates], kind="stable")][:_TOP_CATEGORIES]
+            top = [(frame.category_names[c], int(by_category[i, c])) for c in ranked.tolist()]
+            records.append(_month_record(code, int(debit[i]), int(credit[i]), int(counts[i]), top))
+        return records
+
+    def _records_from_rollup(self, request: ToolRequest, filters: dict[str, Any], codes: list[int]) -> list[dict[str, Any]]:
+        if self._rollup is None:
+            self._rollup = LedgerRollup()
+        first, last = month_start(codes[0]), month_start(codes[-1])
+        scope = refresh_rollup(self._rollup, request, filters, first, last)
+        query = {
+            "first_month": first.strftime("%Y-%m"),
+            "last_month": last.strftime("%Y-%m"),
+            "accounts": filters.get("accounts"),
+            "categories": filters.get("categories"),
+            "currency": filters.get("currency"),
+        }
+        totals = {row["month"]: row for row in self._rollup.totals(scope, group_by=("month",), **query)}
+        by_category: dict[str, list[dict[str, Any]]] = {}
+        for row in self._rollup.totals(scope, group_by=("month", "category"), **query):
+            if row["debit_count"]:
+                by_category.setdefault(row["month"], []).append(row)
+
+        records = []
+        empty = {"debit_cents": 0, "credit_cents": 0, "debit_count": 0, "credit_count": 0}
+        for code in codes:
+            month = month_start(code).strftime("%Y-%m")
+            total = totals.get(month, empty)
+            ranked = sorted(by_category.get(month, []), key=lambda row: -row["debit_cents"])[:_TOP_CATEGORIES]
+            top = [(row["category_name"], row["debit_cents"]) for row in ranked]
+            count = total["debit_count"] + total["credit_count"]
+            records.append(_month_record(code, total["debit_cents"], total["credit_cents"], count, top))
+        return records
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        codes, _ = _month_args(request)
+        if codes is None:
+            return None
+        filters = _covering_filters(request, codes)
+        if rollup_enabled(request) and rollup_months(filters) is not None:
+            # The rollup fetches only what it is missing; nothing to prefetch.
+            return None
+        return filters
+
     def spec(self) -> ToolSpec:
         return ToolSpec(
             name=self.name,
@@ -92,10 +283,20 @@ class MonthSummaryTool(Tool):
                         "type": "integer",
                         "description": "Four-digit year for the monthly summary. Defaults to current year.",
                     },
+                    "months": {
+                        "type": "array",
+                        "items": {"type": ["integer", "string"]},
+                        "description": "Several months: numbers (1-12) of `year` or YYYY-MM strings.",
+                    },
+                    "year_range": {
+                        "type": "object",
+                        "properties": {"start": {"type": "integer"}, "end": {"type": "integer"}},
+                        "description": "Every month of these years, up to the current month.",
+                    },
                     "currency": {"type": "string"},
                     "filters": {"type": "object"},
                 },
-                "required": ["month_number"],
+                "anyOf": [{"required": ["month_number"]}, {"required": ["months"]}, {"required": ["year_range"]}],
             },
         )
 logger = get_logger("Tool:ledgers.month_summary")
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+from domain.schemas import ToolRequest, ToolResponse, TransactionQuery
+from domain.transaction_frame import TransactionFrame, cents_to_float, month_codes, month_start
+from logs import get_logger
+from tools._transactions_support import _extract_request_filters, fetch_transaction_frame
+from tools.base import TransactionTool, ToolSpec
+from tools.detect.recurring_charges import normalize_merchant
+from tools.registry import register_tool
+
+PERIODS = ("week", "month", "quarter")
+DIMENSIONS = ("category", "account", "merchant")
+METRICS = ("debit", "credit", "net")
+MAX_PERIODS = 156
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except Exception:
+        return None
+
+
+def period_codes(day: np.ndarray, period: str) -> np.ndarray:
+    """Consecutive integer period numbers for date ordinals (weeks start on Monday)."""
+    if period == "week":
+        return (day.astype(np.int64) - 1) // 7
+    months = month_codes(day)
+    return months // 3 if period == "quarter" else months
+
+
+def period_start(code: int, period: str) -> date:
+    if period == "week":
+        return date.fromordinal(code * 7 + 1)
+    return month_start(code * 3 if period == "quarter" else code)
+
+
+def _trend_args(request: ToolRequest) -> tuple[dict[str, Any] | None, list[str]]:
+    args = request.args if isinstance(request.args, dict) else {}
+    period = str(args.get("period") or "month").strip().lower()
+    dimension = str(args.get("dimension") or "category").strip().lower()
+    metric = str(args.get("metric") or "debit").strip().lower()
+    periods = _as_int(args.get("periods", 12))
+    top = _as_int(args.get("top", 20))
+    try:
+        end = date.fromisoformat(str(args["end"])) if args.get("end") else date.today()
+    except ValueError:
+        end = None
+
+    errors = []
+    if period not in PERIODS:
+        errors.append(f"period must be one of: {', '.join(PERIODS)}")
+    if dimension not in DIMENSIONS:
+        errors.append(f"dimension must be one of: {', '.join(DIMENSIONS)}")
+    if metric not in METRICS:
+        errors.append(f"metric must be one of: {', '.join(METRICS)}")
+    if periods is None or not 1 <= periods <= MAX_PERIODS:
+        errors.append(f"periods must be an integer from 1 to {MAX_PERIODS}")
+    if top is None or top < 1:
+        errors.append("top must be a positive integer")
+    if end is None:
+        errors.append("end must be an ISO date (YYYY-MM-DD)")
+    if errors:
+        return None, errors
+    return {"period": period, "dimension": dimension, "metric": metric, "periods": periods, "top": top, "end": end}, []
+
+
+def _window(options: dict[str, Any]) -> tuple[int, list[tuple[date, date]]]:
+    """First period code and (start, end) dates of the `periods` periods ending with the one holding `end`."""
+    period = options["period"]
+    last = int(period_codes(np.array([options["end"].toordinal()]), period)[0])
+    first = last - options["periods"] + 1
+    starts = [period_start(code, period) for code in range(first, last + 2)]
+    return first, [(start, following - timedelta(days=1)) for start, following in zip(starts, starts[1:])]
+
+
+def _dimension(frame: TransactionFrame, dimension: str) -> tuple[np.ndarray, list[str]]:
+    if dimension == "category":
+        return frame.category_codes, frame.category_names
+    if dimension == "account":
+        return frame.account_codes, frame.account_names
+    # Merchants are grouped by normalized description, as in recurring-charge detection.
+    index: dict[str, int] = {}
+    lookup = np.array([index.setdefault(normalize_merchant(name), len(index)) for name in frame.merchant_names], dtype=np.int32)
+    return (lookup[frame.merchant_codes] if len(lookup) else frame.merchant_codes), list(index)
+
+
+def trend_matrix(frame: TransactionFrame, options: dict[str, Any], first: int) -> tuple[np.ndarray, list[str]]:
+    """Period x dimension cents matrix for `options["periods"]` periods from period code `first`, in one bincount."""
+    codes, labels = _dimension(frame, options["dimension"])
+    size = options["periods"]
+    position = period_codes(frame.day, options["period"]) - first
+    keep = (position >= 0) & (position < size)
+    if options["metric"] == "debit":
+        values = np.where(frame.is_credit, 0, frame.amount_cents)
+    elif options["metric"] == "credit":
+        values = np.where(frame.is_credit, frame.amount_cents, 0)
+    else:
+        values = frame.signed_cents
+    width = max(len(labels), 1)
+    cells = position[keep] * width + codes[keep]
+    matrix = np.bincount(cells, weights=values[keep], minlength=size * width).reshape(size, width)
+    return matrix, labels
+
+
+def _growth_pct(new: np.ndarray, old: np.ndarray) -> list[float | None]:
+    return [round((n - o) / abs(o) * 100, 1) if o else None for n, o in zip(new.tolist(), old.tolist())]
+
+
+@register_tool
+class TrendTool(TransactionTool):
+    """
+    Period x dimension totals for the last N weeks, months or quarters from one fetch.
+
+    Slopes are least-squares fits over the period index (cents per period, then dollars);
+    `growth_pct` compares the last period with the first, `last_change_pct` with the previous.
+    """
+
+    name = "ledgers.trend"
+    description = (
+        "Trend of spending (or income/net) over the last N periods broken down by a dimension. "
+        "Args: `period` week|month|quarter (default month), `periods` (default 12), `dimension` "
+        "category|account|merchant (default category), `metric` debit|credit|net (default debit), "
+        "optional `end` date (default today) and `top` series to return (default 20). "
+        "Returns per-period values, totals, slopes and growth rates."
+    )
+
+    def run(self, request: ToolRequest) -> ToolResponse:
+        logger.info("run start request_id=%s", request.request_id)
+        options, errors = _trend_args(request)
+        if options is None:
+            return ToolResponse(request_id=request.request_id, tool=self.name, ok=False, errors=errors, context=request.context)
+
+        first, windows = _window(options)
+        request.filters = TransactionQuery.model_validate(self._window_filters(request, windows))
+        frame, filters = fetch_transaction_frame(request, default_days=31)
+        matrix, labels = trend_matrix(frame, options, first)
+
+        size = options["periods"]
+        x = np.arange(size) - (size - 1) / 2
+        slopes = x @ matrix / (x @ x) if size > 1 else np.zeros(matrix.shape[1])
+        totals = matrix.sum(axis=0)
+        present = np.flatnonzero(np.abs(matrix).sum(axis=0))
+        ranked = present[np.argsort(-np.abs(totals[present]), kind="stable")][: options["top"]]
+        growth = _growth_pct(matrix[-1], matrix[0])
+        last_change = _growth_pct(matrix[-1], matrix[-2]) if size > 1 else [None] * matrix.shape[1]
+
+        series = [
+            {
+                "key": labels[code],
+                "values": [cents_to_float(value) for value in matrix[:, code].round().tolist()],
+                "total": cents_to_float(round(totals[code])),
+                "slope_per_period": round(float(slopes[code]) / 100, 2),
+                "growth_pct": growth[code],
+                "last_change_pct": last_change[code],
+            }
+            for code in ranked.tolist()
+        ]
+        period_totals = matrix.sum(axis=1)
+        result = {
+            "period": options["period"],
+            "dimension": options["dimension"],
+            "metric": options["metric"],
+            "periods": [{"start": start.isoformat(), "end": end.isoformat()} for start, end in windows],
+            "series": series,
+            "period_totals": [cents_to_float(value) for value in period_totals.round().tolist()],
+            "total_slope_per_period": round(float(x @ period_totals / (x @ x)) / 100, 2) if size > 1 else 0.0,
+            "dimension_count": len(present),
+            "transaction_count": len(frame),
+            "filters_used": filters,
+        }
+        return ToolResponse(request_id=request.request_id, tool=self.name, result=result, context=request.context)
+
+    @staticmethod
+    def _window_filters(request: ToolRequest, windows: list[tuple[date, date]]) -> dict[str, Any]:
+        filters = _extract_request_filters(request)
+        filters["date_range"] = {"start": windows[0][0].isoformat(), "end": windows[-1][1].isoformat()}
+        return filters
+
+    def transaction_filters(self, request: ToolRequest) -> dict[str, Any] | None:
+        options, _ = _trend_args(request)
+        if options is None:
+            return None
+        return self._window_filters(request, _window(options)[1])
+
+    def spec(self) -> ToolSpec:
+        return ToolSpec(
+            name=self.name,
+            description=self.description,
+            args_schema={
+                "type": "object",
+                "properties": {
+                    "period": {"type": "string", "enum": list(PERIODS)},
+                    "periods": {"type": "integer", "minimum": 1, "maximum": MAX_PERIODS},
+                    "dimension": {"type": "string", "enum": list(DIMENSIONS)},
+                    "metric": {"type": "string", "enum": list(METRICS)},
+                    "end": {"type": "string", "format": "date"},
+                    "top": {"type": "integer", "minimum": 1},
+                    "currency": {"type": "string"},
+                    "filters": {"type": "object"},
+                },
+            },
+        )
+logger = get_logger("Tool:ledgers.trend")
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from types import SimpleNamespace
+
+try:
+    from actual.database import Accounts, Payees, Transactions  # type: ignore
+    from sqlmodel import Session, SQLModel, create_engine  # type: ignore
+except Exception:  # pragma: no cover - actualpy is an optional runtime dependency
+    Transactions = None
+
+from scripts.actual.get_transactions import fetch_transactions, iter_transactions
+
+
+@unittest.skipIf(Transactions is None, "actualpy is not installed")
+class ActualBridgePushdownTests(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        self.session = Session(engine)
+        self.session.add(Accounts(id="acc-checking", name="Checking"))
+        self.session.add(Accounts(id="acc-card", name="Card"))
+        self.session.add(Payees(id="payee-wf", name="Whole Foods"))
+        for txn_id, acct, category, amount, day, payee, notes in [
+            ("t1", "acc-checking", "cat-groceries", -4210, 20260110, "payee-wf", None),
+            ("t2", "acc-checking", None, 250000, 20260131, None, "Payroll"),
+            ("t3", "acc-card", "cat-groceries", -100, 20260201, None, None),
+            ("t4", "acc-card", "cat-dining", -2500, 20260115, None, "Lunch"),
+        ]:
+            self.session.add(
+                Transactions(
+                    id=txn_id,
+                    acct=acct,
+                    category_id=category,
+                    amount=amount,
+                    date=day,
+                    payee_id=payee,
+                    notes=notes,
+                    is_parent=0,
+                    is_child=0,
+                    tombstone=0,
+                )
+            )
+        self.session.add(
+            Transactions(id="t5", acct="acc-card", amount=-999, date=20260112, is_parent=0, is_child=0, tombstone=1)
+        )
+        self.session.commit()
+        self.actual = SimpleNamespace(session=self.session)
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def _ids(self, start: date, end: date, **filters) -> list[str]:
+        return sorted(row["id"] for row in fetch_transactions(start, end, actual=self.actual, filters=filters))
+
+    def test_date_range_is_inclusive_and_skips_tombstones(self) -> None:
+        self.assertEqual(self._ids(date(2026, 1, 1), date(2026, 1, 31)), ["t1", "t2", "t4"])
+
+    def test_row_on_end_date_is_included(self) -> None:
+        # actualpy's get_transactions treats end_date as exclusive; the pushdown query does not.
+        self.assertEqual(self._ids(date(2026, 1, 31), date(2026, 1, 31)), ["t2"])
+        self.assertEqual(self._ids(date(2026, 2, 1), date(2026, 2, 1)), ["t3"])
+
+    def test_null_is_parent_counts_as_a_regular_row(self) -> None:
+        self.session.add(Transactions(id="t6", acct="acc-card", amount=-700, date=20260120, is_parent=None, tombstone=0))
+        self.session.add(Transactions(id="t7", acct="acc-card", amount=-900, date=20260120, is_parent=1, tombstone=0))
+        self.session.commit()
+
+        self.assertEqual(self._ids(date(2026, 1, 20), date(2026, 1, 20)), ["t6"])
+
+    def test_accounts_and_categories(self) -> None:
+        jan_feb = (date(2026, 1, 1), date(2026, 2, 28))
+        self.assertEqual(self._ids(*jan_feb, accounts=["acc-card"]), ["t3", "t4"])
+        self.assertEqual(self._ids(*jan_feb, categories=["CAT-GROCERIES"]), ["t1", "t3"])
+        self.assertEqual(self._ids(*jan_feb, categories=["uncategorized"]), ["t2"])
+
+    def test_direction_and_amount_bounds(self) -> None:
+        jan_feb = (date(2026, 1, 1), date(2026, 2, 28))
+        self.assertEqual(self._ids(*jan_feb, txn_type="credit"), ["t2"])
+        self.assertEqual(self._ids(*jan_feb, positive=True, min_amount=1.0, max_amount=42.10), ["t1", "t3", "t4"])
+        self.assertEqual(self._ids(*jan_feb, min_amount=25.01), ["t1", "t2"])
+
+    def test_query_matches_payee_notes_or_category(self) -> None:
+        jan_feb = (date(2026, 1, 1), date(2026, 2, 28))
+        self.assertEqual(self._ids(*jan_feb, query="whole"), ["t1"])
+        self.assertEqual(self._ids(*jan_feb, query="lunch"), ["t4"])
+        self.assertEqual(self._ids(*jan_feb, query="dining"), ["t4"])
+
+    def test_query_ignores_tombstoned_payees(self) -> None:
+        self.session.add(Payees(id="payee-old", name="Corner Deli", tombstone=1))
+        self.session.add(
+            Transactions(id="t6", acct="acc-card", amount=-700, date=20260120, payee_id="payee-old", notes="Sandwich",
+                         is_parent=0, is_child=0, tombstone=0)
+        )
+        self.session.commit()
+        jan = (date(2026, 1, 1), date(2026, 1, 31))
+
+        self.assertEqual(self._ids(*jan, query="deli"), [])
+        self.assertEqual(self._ids(*jan, query="sandwich"), ["t6"])
+
+    def test_iter_transactions_streams_same_rows_in_batches(self) -> None:
+        jan_feb = (date(2026, 1, 1), date(2026, 2, 28))
+        batches = list(iter_transactions(*jan_feb, actual=self.actual, filters={"positive": True}, batch_size=2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(
+            [row["id"] for batch in batches for row in batch],
+            [row["id"] for row in fetch_transactions(*jan_feb, actual=self.actual, filters={"positive": True})],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    from actual.database import Accounts, Categories, CategoryGroups, Transactions  # type: ignore
+    from sqlmodel import Session, SQLModel, create_engine  # type: ignore
+except Exception:  # pragma: no cover - actualpy is an optional runtime dependency
+    Transactions = None
+
+from scripts.actual._session_pool import ActualSessionPool
+from scripts.actual.bridge_client import ActualBridgeClient, ActualBridgeError
+from scripts.actual.bridge_server import ActualBridgeServer
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider, ActualProviderError
+
+
+@unittest.skipIf(Transactions is None, "actualpy is not installed")
+class ActualBridgeWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        tmp = Path(self._tmp.name)
+        self.engine = create_engine(f"sqlite:///{tmp / 'db.sqlite'}", connect_args={"check_same_thread": False})
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            session.add(Accounts(id="acc-1", name="Checking"))
+            session.add(CategoryGroups(id="grp-1", name="Food", is_income=0))
+            session.add(Categories(id="cat-1", name="Groceries", cat_group="grp-1"))
+            for index in range(5):
+                session.add(
+                    Transactions(
+                        id=f"t{index}",
+                        acct="acc-1",
+                        category_id="cat-1",
+                        amount=-(index + 1) * 100,
+                        date=20260110 + index,
+                        notes=f"Shop {index}",
+                        is_parent=0,
+                        is_child=0,
+                        tombstone=0,
+                    )
+                )
+            session.commit()
+
+        self.opens = 0
+        self.server = ActualBridgeServer(tmp / "bridge.sock", pool=self._pool(count_opens=True))
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.client = ActualBridgeClient(self.server.socket_path, timeout_seconds=10)
+        self.query = TransactionQuery.model_validate({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+
+    def _pool(self, count_opens: bool = False) -> ActualSessionPool:
+        @contextmanager
+        def opener():
+            if count_opens:
+                self.opens += 1
+            with Session(self.engine) as session:
+                yield SimpleNamespace(session=session)
+
+        return ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+
+    def test_bridge_mode_matches_live_provider(self) -> None:
+        live = ActualLedgerProvider(session_pool=self._pool(), mode="live")
+        bridged = ActualLedgerProvider(mode="bridge", bridge_client=self.client)
+        self.addCleanup(live.close)
+
+        expected = live.fetch_transactions(self.query)
+        got = bridged.fetch_transactions(self.query)
+        streamed = [txn for batch in bridged.iter_transaction_batches(self.query) for txn in batch]
+
+        self.assertEqual(len(expected), 5)
+        self.assertEqual(got, expected)
+        self.assertEqual(streamed, expected)
+        self.assertEqual(got[0].category_name, "Groceries")
+        self.assertEqual(self.opens, 1)
+
+    def test_stream_arrives_in_batches_and_abandoning_it_keeps_the_client(self) -> None:
+        batches = self.client.iter_transactions(date(2026, 1, 1), date(2026, 1, 31), batch_size=2)
+        self.assertEqual(len(next(batches)), 2)
+        batches.close()
+
+        deadline = time.monotonic() + 5
+        while not self.server.pool._idle and time.monotonic() < deadline:
+            time.sleep(0.01)
+        rows = self.client.fetch_transactions(date(2026, 1, 1), date(2026, 1, 31))
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(self.opens, 1)
+        self.assertEqual(
+            [len(batch) for batch in self.client.iter_transactions(date(2026, 1, 1), date(2026, 1, 31), batch_size=2)],
+            [2, 2, 1],
+        )
+
+    def test_errors_are_reported_to_the_caller(self) -> None:
+        with self.assertRaises(ActualBridgeError):
+            self.client.call("no_such_method")
+        self.assertEqual(self.client.ping()["data_version"], self.server.pool.data_version)
+
+        offline = ActualLedgerProvider(
+            mode="bridge",
+            resolve_names=False,
+            bridge_client=ActualBridgeClient(Path(self._tmp.name) / "missing.sock", timeout_seconds=1),
+        )
+        with self.assertRaises(ActualProviderError):
+            offline.fetch_transactions(self.query)
+
+
+if __name__ == "__main__":
+    unittest.main()
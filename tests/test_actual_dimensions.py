@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts.actual._session_pool import ActualSessionPool
+from domain.models import Money, Transaction
+from domain.transaction_frame import TransactionFrame
+from infrastructure.ledger_providers.actual_dimensions import ActualDimensions
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+
+PAYLOAD = {
+    "categories": [{"id": "cat-1", "name": "Groceries", "group_id": "grp-1"}],
+    "category_groups": [{"id": "grp-1", "name": "Food", "is_income": False}],
+    "accounts": [{"id": "acc-1", "name": "Checking"}],
+    "payees": [{"id": "payee-1", "name": "Whole Foods"}],
+}
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.pending: list[tuple[str, str]] = []
+
+    def sync(self):
+        changes = [SimpleNamespace(table=SimpleNamespace(__tablename__=t), id=i) for t, i in self.pending]
+        self.pending = []
+        return changes
+
+
+class ActualDimensionsTests(unittest.TestCase):
+    def test_names_are_interned_and_resolved_in_bulk(self) -> None:
+        dimensions = ActualDimensions.from_payload(PAYLOAD)
+        txns = [
+            Transaction(f"t{i}", date(2026, 1, 1), "x", "cat-1", Money(), account_id="acc-1") for i in range(3)
+        ] + [Transaction("t9", date(2026, 1, 1), "x", "uncategorized", Money())]
+
+        dimensions.annotate(txns, ["payee-1", None, "payee-1", None])
+
+        self.assertEqual((txns[0].category_name, txns[0].category_group, txns[0].account_name), ("Groceries", "Food", "Checking"))
+        self.assertIs(txns[0].category_name, txns[2].category_name)
+        self.assertEqual([t.payee_name for t in txns], ["Whole Foods", None, "Whole Foods", None])
+        self.assertEqual((txns[3].category_name, txns[3].account_name), (None, None))
+
+    def test_frame_labels_categories_by_name_but_groups_by_id(self) -> None:
+        rows = [
+            {"id": "a", "posted_on": "2026-01-01", "category": "cat-1", "category_name": "Groceries", "amount": 1.0},
+            {"id": "b", "posted_on": "2026-01-02", "category": "cat-2", "category_name": "Groceries", "amount": 2.0},
+            {"id": "c", "posted_on": "2026-01-03", "category": "cat-3", "amount": 3.0},
+        ]
+        frame = TransactionFrame.from_rows(rows)
+
+        self.assertEqual(frame.category_codes.tolist(), [0, 1, 2])
+        self.assertEqual(frame.category_names, ["Groceries", "Groceries", "cat-3"])
+
+
+class ActualProviderDimensionsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = _FakeClient()
+
+        @contextmanager
+        def opener():
+            yield self.client
+
+        self.pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=0, opener=opener)
+        self.provider = ActualLedgerProvider(session_pool=self.pool)
+        self.loads = 0
+
+        def load():
+            with self.provider._checkout_client():
+                self.loads += 1
+            return PAYLOAD
+
+        patcher = patch.object(self.provider, "_load_dimensions_payload", side_effect=load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reloads_only_when_dimension_tables_change(self) -> None:
+        first = self.provider.dimensions()
+        with self.pool.session():
+            pass
+        self.client.pending = [("transactions", "t1")]
+        with self.pool.session():
+            pass
+        self.assertIs(self.provider.dimensions(), first)
+
+        self.client.pending = [("payees", "payee-2")]
+        with self.pool.session():
+            pass
+        second = self.provider.dimensions()
+
+        self.assertEqual(self.loads, 2)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.payee("payee-1"), "Whole Foods")
+
+    def test_normalized_rows_carry_names(self) -> None:
+        txn = self.provider._normalize_transaction_row(
+            {"id": "t1", "date": 20260105, "amount": -500, "account": "acc-1", "category": "cat-1", "payee": "payee-1"},
+            self.provider.dimensions(),
+        )
+
+        self.assertEqual(
+            (txn.category, txn.category_name, txn.category_group, txn.account_name, txn.payee_name),
+            ("cat-1", "Groceries", "Food", "Checking", "Whole Foods"),
+        )
+
+    def test_disabled_or_failing_load_leaves_names_empty(self) -> None:
+        self.assertIsNone(ActualLedgerProvider(session_pool=self.pool, resolve_names=False).dimensions())
+        with patch.object(self.provider, "_load_dimensions_payload", side_effect=RuntimeError("offline")):
+            self.assertIsNone(self.provider.dimensions())
+            self.assertIsNone(self.provider.dimensions())
+
+
+if __name__ == "__main__":
+    unittest.main()
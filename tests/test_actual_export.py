@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    from actual.database import Accounts, Transactions  # type: ignore
+    from sqlmodel import Session, SQLModel, create_engine  # type: ignore
+except Exception:  # pragma: no cover - actualpy is an optional runtime dependency
+    Transactions = None
+
+from scripts.actual._actualpy_common import iter_date_windows, open_export, write_ndjson
+from scripts.actual.get_budget_month import budget_category_rows, month_range
+from scripts.actual.get_transactions import export_transactions, fetch_transactions
+
+
+class ExportHelperTests(unittest.TestCase):
+    def test_date_windows_cover_range_newest_first(self) -> None:
+        windows = list(iter_date_windows(date(2026, 1, 1), date(2026, 1, 10), 4))
+
+        self.assertEqual(
+            windows,
+            [
+                (date(2026, 1, 7), date(2026, 1, 10)),
+                (date(2026, 1, 3), date(2026, 1, 6)),
+                (date(2026, 1, 1), date(2026, 1, 2)),
+            ],
+        )
+        self.assertEqual(list(iter_date_windows(date(2026, 1, 1), date(2026, 1, 10), None)), [(date(2026, 1, 1), date(2026, 1, 10))])
+
+    def test_gzip_file_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out" / "rows.ndjson.gz"
+            with open_export(str(path), compress=True) as stream:
+                count = write_ndjson(stream, [{"id": "a", "day": date(2026, 1, 2)}, {"id": "b", "day": None}])
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                records = [json.loads(line) for line in handle]
+
+        self.assertEqual(count, 2)
+        self.assertEqual(records, [{"id": "a", "day": "2026-01-02"}, {"id": "b", "day": None}])
+
+    def test_budget_payload_flattens_to_category_records(self) -> None:
+        payload = {
+            "month": "2026-01",
+            "categoryGroups": [
+                {"id": "g1", "name": "Food", "categories": [{"id": "c1", "name": "Groceries", "group_id": "g1", "spent": -500}]}
+            ],
+        }
+
+        self.assertEqual(
+            list(budget_category_rows(payload)),
+            [{"month": "2026-01", "group_name": "Food", "id": "c1", "name": "Groceries", "group_id": "g1", "spent": -500}],
+        )
+        self.assertEqual(month_range("2025-11", "2026-02"), ["2025-11", "2025-12", "2026-01", "2026-02"])
+
+
+@unittest.skipIf(Transactions is None, "actualpy is not installed")
+class TransactionExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        self.session = Session(engine)
+        self.session.add(Accounts(id="acc-1", name="Checking"))
+        for day in range(1, 21):
+            self.session.add(
+                Transactions(
+                    id=f"t{day:02d}",
+                    acct="acc-1",
+                    amount=-day * 100,
+                    date=20260100 + day,
+                    is_parent=0,
+                    is_child=0,
+                    tombstone=0,
+                )
+            )
+        self.session.commit()
+        self.actual = SimpleNamespace(session=self.session)
+
+    def tearDown(self) -> None:
+        self.session.close()
+
+    def test_chunked_ndjson_matches_single_payload(self) -> None:
+        start, end = date(2026, 1, 1), date(2026, 1, 31)
+        stream = io.StringIO()
+
+        count = export_transactions(start, end, stream, actual=self.actual, chunk_days=7, batch_size=3)
+        exported = [json.loads(line) for line in stream.getvalue().splitlines()]
+        expected = json.loads(json.dumps(fetch_transactions(start, end, actual=self.actual), default=str))
+
+        self.assertEqual(count, 20)
+        self.assertEqual([row["id"] for row in exported], [row["id"] for row in expected])
+        self.assertEqual(exported[0], expected[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
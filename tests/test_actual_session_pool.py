@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from unittest.mock import patch
+
+from scripts.actual._session_pool import ActualSessionPool
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+
+
+class _FakeClient:
+    def __init__(self, idx: int) -> None:
+        self.idx = idx
+        self.sync_calls = 0
+        self.closed = False
+
+    def sync(self) -> list:
+        self.sync_calls += 1
+        return []
+
+
+class _FakeOpener:
+    def __init__(self) -> None:
+        self.clients: list[_FakeClient] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def __call__(self):
+        with self._lock:
+            client = _FakeClient(len(self.clients))
+            self.clients.append(client)
+        try:
+            yield client
+        finally:
+            client.closed = True
+
+
+class ActualSessionPoolTests(unittest.TestCase):
+    def test_reuses_client_across_checkouts(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(len(opener.clients), 1)
+        self.assertEqual(first.sync_calls, 0)
+
+    def test_syncs_when_interval_elapsed(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=0, opener=opener)
+
+        with pool.session():
+            pass
+        with pool.session() as client:
+            pass
+
+        self.assertEqual(client.sync_calls, 1)
+        self.assertEqual(pool.sync_all(), 1)
+        self.assertEqual(client.sync_calls, 2)
+
+    def test_checkout_during_sync_all_waits_instead_of_opening(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+        with pool.session() as client:
+            pass
+        version = pool.data_version
+        syncing, release = threading.Event(), threading.Event()
+
+        def slow_sync() -> list:
+            syncing.set()
+            release.wait(5)
+            return []
+
+        client.sync = slow_sync
+        worker = threading.Thread(target=pool.sync_all)
+        worker.start()
+        self.assertTrue(syncing.wait(5))
+        checked_out: list[object] = []
+
+        def request_session() -> None:
+            with pool.session() as pooled:
+                checked_out.append(pooled)
+
+        request = threading.Thread(target=request_session)
+        request.start()
+        request.join(0.1)
+        self.assertEqual(checked_out, [])
+        release.set()
+        worker.join(5)
+        request.join(5)
+
+        self.assertEqual(checked_out, [client])
+        self.assertEqual(len(opener.clients), 1)
+        self.assertEqual(pool.data_version, version)
+        self.assertEqual(len(pool._idle), 1)
+
+    def test_failed_request_discards_client(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+
+        with self.assertRaises(ValueError):
+            with pool.session():
+                raise ValueError("boom")
+        with pool.session() as client:
+            pass
+
+        self.assertEqual(len(opener.clients), 2)
+        self.assertTrue(opener.clients[0].closed)
+        self.assertIs(client, opener.clients[1])
+
+    def test_abandoned_stream_returns_client_to_pool(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+
+        def stream():
+            with pool.session() as client:
+                yield client
+                yield client
+
+        rows = stream()
+        first = next(rows)
+        rows.close()
+        with pool.session() as client:
+            pass
+
+        self.assertIs(client, first)
+        self.assertEqual(len(opener.clients), 1)
+        self.assertFalse(first.closed)
+
+    def test_close_releases_idle_clients_and_rejects_checkout(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+        with pool.session():
+            pass
+
+        pool.close()
+
+        self.assertTrue(opener.clients[0].closed)
+        with self.assertRaises(RuntimeError):
+            with pool.session():
+                pass
+
+    def test_checkout_times_out_when_pool_exhausted(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, checkout_timeout_seconds=0.01, opener=opener)
+
+        with pool.session():
+            with self.assertRaises(RuntimeError):
+                with pool.session():
+                    pass
+
+
+class ActualProviderSessionPoolTests(unittest.TestCase):
+    def test_provider_checks_out_pooled_client(self) -> None:
+        opener = _FakeOpener()
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=3600, opener=opener)
+        provider = ActualLedgerProvider(session_pool=pool)
+        seen: list[object] = []
+
+        def fake_fetch(start_date: date, end_date: date, actual=None, filters=None):
+            seen.append(actual)
+            return [{"id": "t1", "date": "2026-01-05", "amount": -1250}]
+
+        query = TransactionQuery.model_validate({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+        with patch.object(provider, "_import_actualpy_bridge", return_value=(None, fake_fetch)):
+            provider.fetch_transactions(query)
+            provider.fetch_transactions(query)
+
+        self.assertEqual(len(opener.clients), 1)
+        self.assertEqual(seen, [opener.clients[0], opener.clients[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing, nullcontext
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+try:
+    from actual.database import Accounts, Categories, CategoryGroups, Payees, Transactions  # type: ignore
+    from sqlmodel import Session, SQLModel, create_engine  # type: ignore
+except Exception:  # pragma: no cover - actualpy is an optional runtime dependency
+    Transactions = None
+
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_dimensions import ActualDimensions
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+from infrastructure.ledger_providers.actual_sqlite import ActualSQLiteReader
+
+
+@unittest.skipIf(Transactions is None, "actualpy is not installed")
+class ActualSQLiteReaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "db.sqlite"
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            session.add(Accounts(id="acc-checking", name="Checking"))
+            session.add(Accounts(id="acc-card", name="Card"))
+            session.add(Payees(id="payee-wf", name="Whole Foods"))
+            session.add(CategoryGroups(id="grp-food", name="Food", is_income=0))
+            session.add(Categories(id="cat-groceries", name="Groceries", cat_group="grp-food", is_income=0))
+            session.add(Categories(id="cat-dining", name="Dining Out", cat_group="grp-food", is_income=0))
+            for txn_id, acct, category, amount, day, payee, notes, raw in [
+                ("t1", "acc-checking", "cat-groceries", -4210, 20260110, "payee-wf", None, None),
+                ("t2", "acc-checking", None, 250000, 20260131, None, "Payroll", None),
+                ("t3", "acc-card", "cat-groceries", -100, 20260201, None, None, '{"transactionAmount": {"currency": "EUR"}}'),
+                ("t4", "acc-card", "cat-dining", -2500, 20260115, None, "Lunch", None),
+                ("t6", "acc-card", "cat-dining", -700, 20260115, None, None, None),
+            ]:
+                session.add(
+                    Transactions(
+                        id=txn_id,
+                        acct=acct,
+                        category_id=category,
+                        amount=amount,
+                        date=day,
+                        payee_id=payee,
+                        notes=notes,
+                        raw_synced_data=raw,
+                        is_parent=0,
+                        is_child=0,
+                        tombstone=0,
+                    )
+                )
+            session.add(
+                Transactions(id="t5", acct="acc-card", amount=-999, date=20260112, is_parent=0, is_child=0, tombstone=1)
+            )
+            session.commit()
+        self.query = TransactionQuery(date_range={"start": "2026-01-01", "end": "2026-02-28"})
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self._tmp.cleanup()
+
+    def _bridge_transactions(self, query: TransactionQuery) -> list:
+        provider = ActualLedgerProvider(use_session_pool=False)
+        with Session(self.engine) as session:
+            actual = SimpleNamespace(session=session)
+            with patch.object(provider, "_checkout_client", return_value=nullcontext(actual)):
+                return provider.fetch_transactions(query)
+
+    def test_matches_bridge_rows_and_metadata(self) -> None:
+        expected = self._bridge_transactions(self.query)
+        reader = ActualSQLiteReader(self.db_path)
+        dimensions = ActualDimensions.from_payload(reader.fetch_dimensions())
+        actual = reader.fetch(date(2026, 1, 1), date(2026, 2, 28), dimensions=dimensions)
+
+        self.assertEqual([txn.id for txn in actual], ["t3", "t2", "t4", "t6", "t1"])
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual[0].value.currency, "EUR")
+        self.assertEqual(actual[4].description, "Whole Foods")
+        self.assertEqual(actual[1].category, "uncategorized")
+        self.assertEqual((actual[4].category_name, actual[4].category_group), ("Groceries", "Food"))
+        self.assertEqual((actual[4].account_name, actual[4].payee_name), ("Checking", "Whole Foods"))
+        self.assertIsNone(actual[1].category_name)
+
+    def test_tombstoned_payee_is_not_used_as_description(self) -> None:
+        with Session(self.engine) as session:
+            session.add(Payees(id="payee-old", name="Corner Deli", tombstone=1))
+            session.add(
+                Transactions(id="t7", acct="acc-card", amount=-300, date=20260120, payee_id="payee-old", notes="Sandwich",
+                             is_parent=0, is_child=0, tombstone=0)
+            )
+            session.commit()
+        query = TransactionQuery(date_range={"start": "2026-01-20", "end": "2026-01-20"})
+
+        actual = ActualSQLiteReader(self.db_path).fetch(date(2026, 1, 20), date(2026, 1, 20))
+        self.assertEqual([txn.description for txn in actual], ["Sandwich"])
+        self.assertEqual([txn.description for txn in self._bridge_transactions(query)], ["Sandwich"])
+
+    def test_provider_sqlite_mode_pushes_accounts_and_streams(self) -> None:
+        provider = ActualLedgerProvider(use_session_pool=False, mode="sqlite")
+        provider._sqlite_reader = ActualSQLiteReader(self.db_path, provider_name=provider.name)
+        provider._stream_batch_size = 1
+        query = self.query.model_copy(update={"accounts": ["acc-card"]})
+
+        self.assertEqual(provider.pushdown_filters(query), frozenset({"date_range", "accounts"}))
+        batches = list(provider.iter_transaction_batches(query))
+        self.assertEqual([len(batch) for batch in batches], [1, 1, 1])
+        txns = provider.fetch_transactions(query)
+        self.assertEqual([txn.id for txn in txns], ["t3", "t4", "t6"])
+        self.assertEqual([txn.category_name for txn in txns], ["Groceries", "Dining Out", "Dining Out"])
+        self.assertEqual({txn.account_name for txn in txns}, {"Card"})
+
+    def test_reuses_existing_date_index_or_creates_one_when_opted_in(self) -> None:
+        ActualSQLiteReader(self.db_path, ensure_index=True).fetch(date(2026, 1, 1), date(2026, 1, 31))
+        self.assertNotIn("ledgermind_transactions_date", self._index_names())
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            for name in self._index_names():
+                if conn.execute(f"PRAGMA index_info({name})").fetchone()[2] == "date":
+                    conn.execute(f"DROP INDEX {name}")
+            conn.commit()
+        reader = ActualSQLiteReader(self.db_path, ensure_index=True)
+        self.assertEqual(len(reader.fetch(date(2026, 1, 1), date(2026, 1, 31))), 4)
+        self.assertIn("ledgermind_transactions_date", self._index_names())
+
+    def test_default_reader_leaves_budget_file_untouched(self) -> None:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            for name in self._index_names():
+                if conn.execute(f"PRAGMA index_info({name})").fetchone()[2] == "date":
+                    conn.execute(f"DROP INDEX {name}")
+            conn.commit()
+        reader = ActualSQLiteReader(self.db_path)
+        version = reader.version()
+
+        reader.fetch(date(2026, 1, 1), date(2026, 1, 31))
+
+        self.assertEqual(reader.version(), version)
+        self.assertNotIn("ledgermind_transactions_date", self._index_names())
+
+    def _index_names(self) -> list[str]:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            return [row[1] for row in conn.execute("PRAGMA index_list(transactions)")]
+
+    def test_missing_database_is_reported(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            ActualSQLiteReader(Path(self._tmp.name) / "missing.sqlite").fetch(date(2026, 1, 1), date(2026, 1, 31))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+import tools  # noqa: F401
+from domain.running_stats import RunningStats
+from domain.schemas import ToolContext
+from infrastructure.ledger_sync import SyncState
+from infrastructure.persistence.anomaly_baselines import AnomalyBaselineStore
+from infrastructure.persistence.incremental_state import Watermark, WatermarkConflict
+from tools.detect.anomalies import DetectAnomaliesTool
+
+
+class RunningStatsTests(unittest.TestCase):
+    def test_batches_merge_to_whole_sample_statistics(self) -> None:
+        values = np.random.default_rng(5).integers(100, 100000, size=5000)
+        stats = RunningStats()
+        for chunk in np.array_split(values, 7):
+            stats.add_many(chunk)
+        restored = RunningStats.from_dict(stats.to_dict())
+
+        self.assertEqual((restored.count, restored.total), (5000, int(values.sum())))
+        self.assertAlmostEqual(restored.mean, float(values.mean()), places=6)
+        self.assertAlmostEqual(restored.std, float(values.std(ddof=1)), places=4)
+        for q in (0.25, 0.5, 0.75):
+            self.assertAlmostEqual(restored.quantile(q) / float(np.quantile(values, q)), 1.0, delta=0.03)
+
+    def test_decay_scales_weight_but_keeps_mean(self) -> None:
+        stats = RunningStats()
+        stats.add_many(np.array([1000, 2000, 3000]))
+
+        stats.decay(0.5)
+
+        self.assertEqual((stats.count, stats.total), (1.5, 3000.0))
+        self.assertEqual(stats.mean, 2000.0)
+        self.assertAlmostEqual(stats.quantile(0.5) / 2000.0, 1.0, delta=0.02)
+
+
+class BaselineStoreTests(unittest.TestCase):
+    def test_save_rejects_a_watermark_moved_by_another_writer(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "baselines.sqlite"
+            first, second = AnomalyBaselineStore(path), AnomalyBaselineStore(path)
+            first.save("scope", Watermark("2026-01-01"), {}, previous=None)
+            loaded, _ = first.load("scope")
+            second.save("scope", Watermark("2026-01-02"), {}, previous=loaded)
+
+            with self.assertRaises(WatermarkConflict):
+                first.save("scope", Watermark("2026-01-03"), {}, previous=loaded)
+            self.assertEqual(first.load("scope")[0].through, "2026-01-02")
+
+
+def _row(txn_id: str, posted_on: date, amount: float, category: str = "Groceries") -> dict:
+    return {
+        "id": txn_id,
+        "posted_on": posted_on.isoformat(),
+        "description": "Store",
+        "category": category,
+        "amount": amount,
+        "txn_type": "debit",
+    }
+
+
+class IncrementalAnomalyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tool = DetectAnomaliesTool(AnomalyBaselineStore(Path(self._tmp.name) / "baselines.sqlite"))
+        self.today = date.today()
+        self.rows = [_row(f"g{i}", self.today - timedelta(days=30 - i), 40.0 + i % 3) for i in range(20)]
+        self.rows.append(_row("old-big", self.today - timedelta(days=5), 150.0))
+        self.fetched_ranges: list[tuple[str, str]] = []
+        self.fetch_delay = 0.0
+
+        def iter_transactions(filters, include_metadata=True):
+            start, end = filters["date_range"]["start"], filters["date_range"]["end"]
+            self.fetched_ranges.append((start, end))
+            time.sleep(self.fetch_delay)
+            return iter([row for row in self.rows if start <= row["posted_on"] <= end])
+
+        patcher = patch("tools._transactions_support.get_transactions.iter_transactions", side_effect=iter_transactions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        version = patch("tools._incremental_support.read_sync_state", side_effect=lambda: self.sync_state)
+        version.start()
+        self.addCleanup(version.stop)
+        self.sync_state = SyncState(data_version="actual=v1")
+
+    def _run(self) -> dict:
+        request = SimpleNamespace(
+            request_id="req",
+            tool="detect.anomalies",
+            args={"incremental": True, "date_range": {"start": (self.today - timedelta(days=60)).isoformat(), "end": self.today.isoformat()}},
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+        response = self.tool.run(request)
+        self.assertTrue(response.ok)
+        return response.result
+
+    def test_only_new_activity_is_fetched_and_scored(self) -> None:
+        first = self._run()
+        self.assertEqual([a["transaction_id"] for a in first["anomalies"]], ["old-big"])
+        self.assertEqual(first["analyzed_debits"], 21)
+
+        # Same data version and nothing newer than the watermark: no fetch at all.
+        self._run()
+        self.assertEqual(len(self.fetched_ranges), 1)
+
+        self.rows.append(_row("new-big", self.today, 160.0))
+        self.rows.append(_row("new-small", self.today, 41.0))
+        self.sync_state = SyncState(data_version="actual=v2")
+        second = self._run()
+
+        self.assertEqual(self.fetched_ranges[-1], (self.today.isoformat(), self.today.isoformat()))
+        self.assertEqual(second["analyzed_debits"], 2)
+        self.assertEqual([a["transaction_id"] for a in second["anomalies"]], ["new-big", "old-big"])
+        self.assertEqual(second["baseline"]["debits"], 23)
+
+        # A refetch of the watermark day skips ids already folded in.
+        self.sync_state = SyncState(data_version="actual=v3")
+        third = self._run()
+        self.assertEqual((third["analyzed_debits"], third["baseline"]["debits"]), (0, 23))
+
+    def test_concurrent_runs_fold_new_debits_once(self) -> None:
+        self.fetch_delay = 0.05
+        results: list[dict] = []
+        threads = [threading.Thread(target=lambda: results.append(self._run())) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(self.fetched_ranges), 1)
+        self.assertEqual([r["baseline"]["debits"] for r in results], [21, 21])
+
+    def test_baselines_decay_as_the_watermark_advances(self) -> None:
+        self.today = date.today() - timedelta(days=120)
+        self.rows = [_row(f"g{i}", self.today - timedelta(days=30 - i), 40.0) for i in range(20)]
+        self._run()
+        self.today = date.today()
+        self.sync_state = SyncState(data_version="actual=v2")
+
+        result = self._run()
+
+        # 120 days later the 20 old debits weigh as 10.
+        self.assertEqual((result["baseline"]["debits"], result["baseline"]["half_life_days"]), (10, 120.0))
+
+    def test_transaction_filters_narrow_prefetch_to_new_range(self) -> None:
+        request = SimpleNamespace(args={"incremental": True}, filters=None, context=ToolContext(user_id="u", ledger_id="ldg_main"))
+        self.assertEqual(
+            self.tool.transaction_filters(request)["date_range"]["start"],
+            (self.today - timedelta(days=119)).isoformat(),
+        )
+        self._run()
+
+        self.assertIsNone(self.tool.transaction_filters(request))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import statistics
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from domain.transaction_frame import group_median
+from tools.detect.anomalies import category_baselines, top_k
+from tools.registry import registry
+
+
+class AnomalyScoringTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(3)
+        self.codes = rng.integers(0, 4, size=200).astype(np.int32)
+        self.amounts = rng.integers(100, 20000, size=200).astype(np.int64)
+
+    def _peers(self, i: int) -> list[int]:
+        return [int(a) for j, (c, a) in enumerate(zip(self.codes, self.amounts)) if c == self.codes[i] and j != i]
+
+    def test_zscore_matches_leave_one_out_statistics(self) -> None:
+        eligible, avg, cutoff, score = category_baselines(self.codes, self.amounts, 4, "zscore", 3.0)
+
+        for i in range(0, 200, 17):
+            peers = self._peers(i)
+            self.assertTrue(eligible[i])
+            self.assertAlmostEqual(avg[i], statistics.mean(peers), places=6)
+            std = statistics.stdev(peers)
+            self.assertAlmostEqual(cutoff[i], statistics.mean(peers) + 3.0 * std, places=4)
+            self.assertAlmostEqual(score[i], (self.amounts[i] - statistics.mean(peers)) / std, places=6)
+
+    def test_mad_uses_category_median(self) -> None:
+        medians = group_median(self.codes, self.amounts, 4)
+        for code in range(4):
+            values = self.amounts[self.codes == code]
+            self.assertEqual(medians[code], statistics.median(values.tolist()))
+
+        _, _, cutoff, _ = category_baselines(self.codes, self.amounts, 4, "mad", 3.5)
+        values = self.amounts[self.codes == 0].tolist()
+        median = statistics.median(values)
+        mad = statistics.median([abs(v - median) for v in values])
+        self.assertAlmostEqual(cutoff[np.flatnonzero(self.codes == 0)[0]], median + 3.5 * 1.4826 * mad, places=4)
+
+    def test_top_k_orders_by_value_then_position(self) -> None:
+        indices = np.arange(10)
+        values = np.array([5, 9, 9, 1, 9, 3, 7, 7, 2, 0], dtype=np.float64)
+
+        self.assertEqual(top_k(indices, values, 4).tolist(), [1, 2, 4, 6])
+        self.assertEqual(top_k(indices[:3], values[:3], 5).tolist(), [1, 2, 0])
+
+
+class AnomalyToolMethodTests(unittest.TestCase):
+    def _run(self, args: dict) -> dict:
+        rows = [
+            {"id": f"g{i}", "posted_on": f"2026-01-{i + 1:02d}", "description": "Store", "category": "Groceries",
+             "amount": 40.0 + i % 3, "txn_type": "debit"}
+            for i in range(12)
+        ] + [{"id": "big", "posted_on": "2026-01-20", "description": "Store", "category": "Groceries", "amount": 140.0,
+              "txn_type": "debit"}]
+        request = SimpleNamespace(
+            request_id="req",
+            tool="detect.anomalies",
+            args={"date_range": {"start": "2026-01-01", "end": "2026-01-31"}, **args},
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="l"),
+        )
+        with patch("tools._transactions_support.get_transactions.iter_transactions", return_value=iter(rows)):
+            return registry.get_tool("detect.anomalies").run(request)
+
+    def test_robust_methods_flag_outlier(self) -> None:
+        for method in ("mean", "zscore", "mad"):
+            response = self._run({"method": method})
+            self.assertTrue(response.ok)
+            self.assertEqual([a["transaction_id"] for a in response.result["anomalies"]], ["big"], method)
+            self.assertEqual(response.result["method"], method)
+
+    def test_unknown_method_is_rejected(self) -> None:
+        response = self._run({"method": "iforest"})
+
+        self.assertFalse(response.ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider, ActualProviderError, _previous_month
+from infrastructure.persistence.budget_month_cache import BudgetMonthCache
+
+
+def _payload(month: str, spent: int = -1000) -> dict:
+    return {
+        "month": month,
+        "incomeAvailable": 0,
+        "lastMonthOverspent": 0,
+        "forNextMonth": 0,
+        "totalBudgeted": 5000,
+        "toBudget": 0,
+        "fromLastMonth": 0,
+        "totalIncome": 0,
+        "totalSpent": spent,
+        "totalBalance": 5000 + spent,
+        "categoryGroups": [],
+    }
+
+
+class BudgetMonthsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = BudgetMonthCache(Path(self._tmp.name) / "budget.sqlite")
+        self.provider = ActualLedgerProvider(use_session_pool=False, budget_cache=self.cache)
+        today = date.today()
+        self.current = today.strftime("%Y-%m")
+        self.previous = _previous_month(today)
+        self.closed = [f"{today.year - 1:04d}-01", f"{today.year - 1:04d}-02"]
+        self.calls: list[list[str]] = []
+        self.spent = -1000
+
+        def fake_fetch(months: list[str]) -> dict:
+            self.calls.append(list(months))
+            return {month: _payload(month, self.spent) for month in months}
+
+        patcher = patch.object(self.provider, "_fetch_budget_months_via_python", side_effect=fake_fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_one_fetch_for_all_months_then_only_open_months_refresh(self) -> None:
+        months = [*self.closed, self.previous, self.current]
+
+        first = self.provider.fetch_budget_months(months)
+        self.spent = -2500
+        second = self.provider.fetch_budget_months(months)
+
+        self.assertEqual(self.calls, [months, [self.previous, self.current]])
+        self.assertEqual(list(second), months)
+        self.assertEqual(second[self.closed[0]], first[self.closed[0]])
+        self.assertEqual(second[self.closed[0]].totalSpent, -1000)
+        self.assertEqual(second[self.current].totalSpent, -2500)
+
+    def test_cache_is_keyed_by_budget_file(self) -> None:
+        with patch.dict("os.environ", {"ACTUAL_FILE": "budget-a"}):
+            self.provider.fetch_budget_months(self.closed)
+        with patch.dict("os.environ", {"ACTUAL_FILE": "budget-b"}):
+            self.provider.fetch_budget_months(self.closed)
+        with patch.dict("os.environ", {"ACTUAL_FILE": "budget-a"}):
+            self.provider.fetch_budget_months(self.closed)
+
+        self.assertEqual(self.calls, [self.closed, self.closed])
+        self.assertEqual(set(self.cache.get_many("budget-b", self.closed)), set(self.closed))
+
+    def test_bridge_failure_is_wrapped(self) -> None:
+        with patch.object(self.provider, "_fetch_budget_months_via_python", side_effect=RuntimeError("offline")):
+            with self.assertRaises(ActualProviderError):
+                self.provider.fetch_budget_months([self.current])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from domain.transaction_frame import TransactionFrame
+from tools.forecast.engine import _calendar, daily_flows, forecast_cashflow
+from tools.registry import registry
+
+
+def _ledger(start: date, days: int) -> list[dict]:
+    rows = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        rows.append({"id": f"d{offset}", "posted_on": day.isoformat(), "description": f"Cafe {offset}", "amount": 30.0, "txn_type": "debit"})
+        if day.day in (1, 15):
+            rows.append({"id": f"p{offset}", "posted_on": day.isoformat(), "description": "Payroll", "amount": 2000.0, "txn_type": "credit"})
+        if day.day == 3:
+            rows.append({"id": f"r{offset}", "posted_on": day.isoformat(), "description": "Landlord", "amount": 1500.0, "txn_type": "debit"})
+    return rows
+
+
+class ForecastEngineTests(unittest.TestCase):
+    def test_calendar_and_daily_flows(self) -> None:
+        weekday, day_of_month = _calendar(date(2026, 2, 27), 4)
+        self.assertEqual(weekday.tolist(), [4, 5, 6, 0])
+        self.assertEqual(day_of_month.tolist(), [26, 27, 0, 1])
+
+        frame = TransactionFrame.from_rows(_ledger(date(2026, 1, 1), 3))
+        flows = daily_flows(frame, date(2026, 1, 1), 3)
+        self.assertEqual(flows.tolist(), [[200000, 0, 0], [3000, 3000, 153000]])
+
+    def test_all_horizons_from_one_series_with_scheduled_rent(self) -> None:
+        start = date(2025, 7, 1)
+        frame = TransactionFrame.from_rows(_ledger(start, 184))
+        result = forecast_cashflow(frame, start, 184, date(2026, 1, 1), (30, 60, 90))
+
+        self.assertEqual([p["horizon_days"] for p in result["projections"]], [30, 60, 90])
+        self.assertEqual([event["merchant"] for event in result["scheduled_events"]], ["landlord"])
+        self.assertEqual(result["scheduled_events"][0]["dates"][:2], ["2026-01-03", "2026-02-03"])
+        thirty, sixty, ninety = result["projections"]
+        self.assertEqual((thirty["scheduled_spend"], ninety["scheduled_spend"]), (1500.0, 4500.0))
+        # Paydays land on the 1st/15th; the day-of-month effect carries them instead of a flat average.
+        self.assertGreater(thirty["income"], 2 * 2000 * 0.6)
+        self.assertLess(thirty["spend"], ninety["spend"])
+        for projection in result["projections"]:
+            self.assertLessEqual(projection["net_low"], projection["net_cashflow"])
+            self.assertGreaterEqual(projection["net_high"], projection["net_cashflow"])
+
+
+class CashflowForecastToolTests(unittest.TestCase):
+    def _request(self, args: dict) -> SimpleNamespace:
+        return SimpleNamespace(
+            request_id="req",
+            tool="forecast.cashflow",
+            args=args,
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+
+    @patch("tools._transactions_support.get_transactions.iter_transactions")
+    def test_one_fetch_answers_every_horizon(self, mock_iter_transactions) -> None:
+        mock_iter_transactions.return_value = iter(_ledger(date(2026, 1, 1), 90))
+        args = {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}, "horizons": [90, 30, 45], "confidence": 0.9}
+
+        res = registry.get_tool("forecast.cashflow").run(self._request(args))
+
+        self.assertTrue(res.ok)
+        self.assertEqual(mock_iter_transactions.call_count, 1)
+        self.assertEqual([p["horizon_days"] for p in res.result["projections"]], [30, 45, 90])
+        self.assertEqual((res.result["confidence"], res.result["lookback_days"]), (0.9, 90))
+
+    def test_rejects_invalid_horizons(self) -> None:
+        res = registry.get_tool("forecast.cashflow").run(self._request({"horizons": [0, 400], "confidence": 2}))
+
+        self.assertFalse(res.ok)
+        self.assertEqual(len(res.errors), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from tools.ledger.compare_periods import _default_ranges
+from tools.registry import registry
+
+
+def _row(txn_id: str, posted_on: str, category: str, amount: float, txn_type: str = "debit") -> dict:
+    return {
+        "id": txn_id,
+        "posted_on": posted_on,
+        "description": "Store",
+        "category": category,
+        "amount": amount,
+        "txn_type": txn_type,
+    }
+
+
+class ComparePeriodsToolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = [
+            _row("g1", "2026-01-05", "Groceries", 300.0),
+            _row("g2", "2026-02-05", "Groceries", 360.0),
+            _row("d1", "2026-01-09", "Dining", 200.0),
+            _row("d2", "2026-02-09", "Dining", 50.0),
+            _row("t2", "2026-02-12", "Travel", 90.0),
+            _row("p1", "2026-01-01", "Income", 3000.0, txn_type="credit"),
+            _row("p2", "2026-02-01", "Income", 3100.0, txn_type="credit"),
+            _row("x1", "2026-01-20", "Dining", 999.0),
+        ]
+        self.fetched: list[dict] = []
+
+        def iter_transactions(filters, include_metadata=True):
+            self.fetched.append(filters)
+            start, end = filters["date_range"]["start"], filters["date_range"]["end"]
+            return iter([row for row in self.rows if start <= row["posted_on"] <= end])
+
+        patcher = patch("tools._transactions_support.get_transactions.iter_transactions", side_effect=iter_transactions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, args: dict):
+        request = SimpleNamespace(
+            request_id="req",
+            tool="ledgers.compare_periods",
+            args=args,
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+        return registry.get_tool("ledgers.compare_periods").run(request)
+
+    def test_union_is_fetched_once_and_categories_ranked_by_change(self) -> None:
+        result = self._run(
+            {
+                "previous": {"start": "2026-01-01", "end": "2026-01-15"},
+                "current": {"start": "2026-02-01", "end": "2026-02-28"},
+            }
+        ).result
+
+        # Only the two periods are fetched; x1 in the gap between them is never read.
+        self.assertEqual(
+            [filters["date_range"] for filters in self.fetched],
+            [{"start": "2026-01-01", "end": "2026-01-15"}, {"start": "2026-02-01", "end": "2026-02-28"}],
+        )
+        previous, current = result["periods"]["previous"], result["periods"]["current"]
+        self.assertEqual((previous["debit_total"], previous["transaction_count"]), (500.0, 3))
+        self.assertEqual((current["debit_total"], current["credit_total"]), (500.0, 3100.0))
+        self.assertEqual(result["change"]["debit_change"], 0.0)
+        self.assertEqual(result["change"]["credit_change_pct"], 3.3)
+
+        self.assertEqual([c["category"] for c in result["categories"]], ["Dining", "Income", "Travel", "Groceries"])
+        dining = result["categories"][0]
+        self.assertEqual((dining["debit_change"], dining["debit_change_pct"], dining["net_change"]), (-150.0, -75.0, 150.0))
+        travel = result["categories"][2]
+        self.assertEqual((travel["previous_debit"], travel["debit_change_pct"]), (0.0, None))
+
+    def test_overlapping_ranges_are_rejected(self) -> None:
+        response = self._run(
+            {
+                "previous": {"start": "2026-01-01", "end": "2026-01-31"},
+                "current": {"start": "2026-01-31", "end": "2026-02-28"},
+            }
+        )
+
+        self.assertFalse(response.ok)
+        self.assertIn("overlap", response.errors[0])
+        self.assertEqual(self.fetched, [])
+
+    def test_default_previous_range_matches_month_to_date_span(self) -> None:
+        self.assertEqual(
+            _default_ranges(date(2026, 3, 15)),
+            {"previous": (date(2026, 2, 1), date(2026, 2, 15)), "current": (date(2026, 3, 1), date(2026, 3, 15))},
+        )
+        # Days past the end of a shorter previous month are clipped to its last day.
+        self.assertEqual(_default_ranges(date(2026, 3, 31))["previous"], (date(2026, 2, 1), date(2026, 2, 28)))
+        self.assertEqual(_default_ranges(date(2026, 1, 31))["previous"], (date(2025, 12, 1), date(2025, 12, 31)))
+
+
+if __name__ == "__main__":
+    unittest.main()
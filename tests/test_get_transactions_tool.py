@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
 import unittest
 from datetime import date
 from decimal import Decimal
+from unittest.mock import patch
 
 from domain.models import Money, Transaction, TransactionType
 from domain.actual_schemas import ActualBudgetMonth
@@ -93,6 +95,130 @@ class GetTransactionsSingletonTests(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["id"], "c1")
 
+    def test_post_filters_only_what_provider_does_not_push_down(self) -> None:
+        class _PushdownProvider(_FakeProvider):
+            supported_filters = frozenset({"date_range", "accounts"})
+
+            def fetch_transactions(self, _filter):
+                self.seen = _filter
+                # Natively evaluated: only rows for the requested accounts come back.
+                return [t for t in self._transactions if t.account_id in _filter.accounts]
+
+        p = _PushdownProvider("p", [
+            self._txn(id="t1", posted_on=date(2026, 1, 5), desc="Store", category="Groceries", amount="10.00", account_id="checking"),
+            self._txn(id="t2", posted_on=date(2026, 1, 6), desc="Store", category="Dining", amount="20.00", account_id="checking"),
+            self._txn(id="t3", posted_on=date(2026, 1, 7), desc="Store", category="Groceries", amount="30.00", account_id="savings"),
+        ])
+        svc = GetTransactions(providers=[p])
+
+        with patch.object(svc, "_compile_filters", wraps=svc._compile_filters) as compiler:
+            rows = svc.get_transactions(
+                {
+                    "date_range": {"start": "2026-01-01", "end": "2026-01-31"},
+                    "accounts": ["checking"],
+                    "categories": ["Groceries"],
+                }
+            )
+
+        self.assertEqual([r["id"] for r in rows], ["t1"])
+        self.assertEqual(p.seen.accounts, ["checking"])
+        residual = compiler.call_args.args[0]
+        self.assertIsNone(residual["accounts"])
+        self.assertIsNone(residual["date_range"])
+        self.assertEqual(residual["categories"], ["Groceries"])
+
+    def test_providers_are_fetched_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=2)
+
+        class _RendezvousProvider(_FakeProvider):
+            def fetch_transactions(self, _filter):
+                # Deadlocks (and times out) unless both providers run at the same time.
+                barrier.wait()
+                return super().fetch_transactions(_filter)
+
+        p1 = _RendezvousProvider("p1", [self._txn(id="t1", posted_on=date(2026, 1, 5), desc="A", category="X", amount="1.00", account_id="a")])
+        p2 = _RendezvousProvider("p2", [self._txn(id="t2", posted_on=date(2026, 1, 6), desc="B", category="Y", amount="2.00", account_id="b")])
+        svc = GetTransactions(providers=[p1, p2], max_workers=2)
+
+        result = svc.fetch({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual([r["id"] for r in result.rows], ["t1", "t2"])
+        svc.close()
+
+    def test_slow_or_failing_provider_yields_partial_result(self) -> None:
+        release = threading.Event()
+
+        class _SlowProvider(_FakeProvider):
+            fetch_timeout_seconds = 0.05
+
+            def fetch_transactions(self, _filter):
+                release.wait(2)
+                return super().fetch_transactions(_filter)
+
+        class _BrokenProvider(_FakeProvider):
+            def fetch_transactions(self, _filter):
+                raise ConnectionError("bridge offline")
+
+        ok = _FakeProvider("ok", [self._txn(id="t1", posted_on=date(2026, 1, 5), desc="A", category="X", amount="1.00", account_id="a")])
+        svc = GetTransactions(providers=[_SlowProvider("slow", []), ok, _BrokenProvider("broken", [])], max_workers=3)
+
+        result = svc.fetch({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+        release.set()
+
+        self.assertTrue(result.partial)
+        self.assertEqual([r["id"] for r in result.rows], ["t1"])
+        self.assertEqual(result.providers, ["ok"])
+        errors = {err.provider: err.to_dict() for err in result.errors}
+        self.assertTrue(errors["slow"]["timed_out"])
+        self.assertEqual(errors["broken"]["error_type"], "ConnectionError")
+        self.assertEqual(errors["broken"]["error"], "bridge offline")
+        svc.close()
+
+    def test_raises_when_every_provider_fails(self) -> None:
+        class _BrokenProvider(_FakeProvider):
+            def fetch_transactions(self, _filter):
+                raise ConnectionError("bridge offline")
+
+        svc = GetTransactions(providers=[_BrokenProvider("broken", [])])
+
+        with self.assertRaises(ConnectionError):
+            svc.get_transactions({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+        svc.close()
+
+    def test_iter_transactions_streams_default_provider_windows(self) -> None:
+        class _WindowedProvider(_FakeProvider):
+            stream_window_days = 31
+
+            def fetch_transactions(self, _filter):
+                self.windows.append((_filter.date_range.start, _filter.date_range.end))
+                return [t for t in self._transactions if _filter.date_range.start <= t.posted_on <= _filter.date_range.end]
+
+        p = _WindowedProvider("p", [
+            self._txn(id="t1", posted_on=date(2026, 1, 5), desc="A", category="Groceries", amount="1.00", account_id="a"),
+            self._txn(id="t2", posted_on=date(2026, 2, 20), desc="B", category="Dining", amount="2.00", account_id="a"),
+            self._txn(id="t3", posted_on=date(2026, 3, 30), desc="C", category="Groceries", amount="3.00", account_id="a"),
+        ])
+        p.windows = []
+        svc = GetTransactions(providers=[p])
+        filters = {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}, "categories": ["groceries"]}
+
+        stream = svc.iter_transactions(filters)
+        self.assertEqual(p.windows, [])
+        self.assertEqual(next(stream)["id"], "t1")
+        self.assertEqual(len(p.windows), 1)
+        self.assertEqual([r["id"] for r in stream], ["t3"])
+        self.assertEqual(
+            p.windows,
+            [
+                (date(2026, 1, 1), date(2026, 1, 31)),
+                (date(2026, 2, 1), date(2026, 3, 3)),
+                (date(2026, 3, 4), date(2026, 3, 31)),
+            ],
+        )
+        p.windows = []
+        self.assertEqual([r["id"] for r in svc.get_transactions(filters)], ["t1", "t3"])
+
     def test_requires_date_range(self) -> None:
         p = _FakeProvider("p", [])
         svc = GetTransactions(providers=[p])
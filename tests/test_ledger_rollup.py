@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from domain.transaction_frame import TransactionFrame
+from infrastructure.ledger_sync import SyncState
+from infrastructure.persistence.incremental_state import WatermarkConflict
+from infrastructure.persistence.ledger_rollup import LedgerRollup, RollupCoverage
+from tools._rollup_support import build_cells, rollup_months
+from tools.ledger.category_summary import CategorySummaryTool
+from tools.ledger.month_summary import MonthSummaryTool
+
+
+def _rows(today: date) -> list[dict]:
+    rows = []
+    for offset in range(0, 420, 3):
+        posted_on = (today - timedelta(days=offset)).isoformat()
+        rows.append(
+            {
+                "id": f"t{offset}",
+                "posted_on": posted_on,
+                "description": "Store",
+                "category": ("cat-food", "cat-fun", "cat-rent")[offset % 3],
+                "category_name": ("Food", "Fun", "Rent")[offset % 3],
+                "account_id": "checking" if offset % 2 else "card",
+                "amount": 10.0 + offset % 7,
+                "txn_type": "credit" if offset % 5 == 0 else "debit",
+                "currency": "USD",
+            }
+        )
+    return rows
+
+
+class RollupCellTests(unittest.TestCase):
+    def test_cells_match_raw_totals(self) -> None:
+        rows = _rows(date(2026, 3, 10))
+        cells = build_cells(TransactionFrame.from_rows(rows))
+
+        self.assertEqual(sum(c.debit_count + c.credit_count for c in cells), len(rows))
+        feb_food = [c for c in cells if c.month == "2026-02" and c.category == "cat-food"]
+        expected = sum(
+            round(r["amount"] * 100)
+            for r in rows
+            if r["posted_on"].startswith("2026-02") and r["category"] == "cat-food" and r["txn_type"] == "debit"
+        )
+        self.assertEqual(sum(c.debit_cents for c in feb_food), expected)
+        self.assertEqual({c.category_name for c in feb_food}, {"Food"})
+
+    def test_replace_rejects_coverage_changed_by_another_refresh(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            rollup = LedgerRollup(Path(tmp) / "rollup.sqlite")
+            rollup.replace_months("scope", "2026-01", "2026-01", [], RollupCoverage("2026-01-01", "2026-01-31"), previous=None)
+            planned = rollup.coverage("scope")
+            rollup.replace_months("scope", "2025-12", "2025-12", [], RollupCoverage("2025-12-01", "2026-01-31"), previous=planned)
+
+            with self.assertRaises(WatermarkConflict):
+                rollup.replace_months("scope", "2026-01", "2026-02", [], RollupCoverage("2026-01-01", "2026-02-28"), previous=planned)
+            self.assertEqual(rollup.coverage("scope").first_month, "2025-12-01")
+
+    def test_only_whole_month_ranges_with_supported_filters_qualify(self) -> None:
+        whole = {"date_range": {"start": "2025-01-01", "end": "2025-12-31"}, "accounts": ["card"], "exclude_transfers": False}
+        self.assertEqual(rollup_months(whole), (date(2025, 1, 1), date(2025, 12, 1)))
+        self.assertIsNone(rollup_months({**whole, "date_range": {"start": "2025-01-02", "end": "2025-12-31"}}))
+        self.assertIsNone(rollup_months({**whole, "min_amount": 5.0}))
+
+
+class RollupSummaryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        rollup = LedgerRollup(Path(self._tmp.name) / "rollup.sqlite")
+        self.month_tool = MonthSummaryTool(rollup)
+        self.category_tool = CategorySummaryTool(rollup)
+        self.today = date.today()
+        self.rows = _rows(self.today)
+        self.fetched_ranges: list[tuple[str, str]] = []
+        self.fetch_delay = 0.0
+
+        def iter_transactions(filters, include_metadata=True):
+            start, end = filters["date_range"]["start"], filters["date_range"]["end"]
+            accounts = filters.get("accounts") or []
+            self.fetched_ranges.append((start, end))
+            time.sleep(self.fetch_delay)
+            return iter(
+                [row for row in self.rows if start <= row["posted_on"] <= end and (not accounts or row["account_id"] in accounts)]
+            )
+
+        patcher = patch("tools._transactions_support.get_transactions.iter_transactions", side_effect=iter_transactions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        version = patch("tools._incremental_support.read_sync_state", side_effect=lambda: self.sync_state)
+        version.start()
+        self.addCleanup(version.stop)
+        self.sync_state = SyncState(data_version="actual=v1")
+
+    def _run(self, tool, args: dict) -> dict:
+        request = SimpleNamespace(
+            request_id="req",
+            tool=tool.name,
+            args=args,
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+        response = tool.run(request)
+        self.assertTrue(response.ok)
+        return response.result
+
+    def test_month_summary_matches_raw_and_reuses_closed_months(self) -> None:
+        closed = (self.today.replace(day=1) - timedelta(days=200)).replace(day=1)
+        args = {"month_number": closed.month, "year": closed.year}
+
+        raw = self._run(self.month_tool, args)
+        rolled = self._run(self.month_tool, {**args, "incremental": True})
+        for key in ("transaction_count", "debit_total", "credit_total", "net_cashflow", "top_debit_categories"):
+            self.assertEqual(rolled[key], raw[key], key)
+        self.assertTrue(rolled["rollup"])
+        fetches = len(self.fetched_ranges)
+
+        earlier = (closed - timedelta(days=1)).replace(day=1)
+        self._run(self.month_tool, {"month_number": earlier.month, "year": earlier.year, "incremental": True})
+        # Backfill of the one missing month; the open months stay current.
+        self.assertEqual(self.fetched_ranges[fetches:], [(earlier.isoformat(), (closed - timedelta(days=1)).isoformat())])
+
+        self._run(self.month_tool, {**args, "incremental": True})
+        self.assertEqual(len(self.fetched_ranges), fetches + 1)
+
+    def test_new_sync_rebuilds_only_open_months(self) -> None:
+        this_month = {"month_number": self.today.month, "year": self.today.year, "incremental": True}
+        self._run(self.month_tool, this_month)
+        self.rows.append({**self.rows[0], "id": "late", "amount": 500.0, "txn_type": "debit"})
+        self.sync_state = SyncState(data_version="actual=v2")
+
+        result = self._run(self.month_tool, this_month)
+
+        previous_month = (self.today.replace(day=1) - timedelta(days=1)).replace(day=1)
+        self.assertEqual(self.fetched_ranges[-1], (previous_month.isoformat(), self.today.isoformat()))
+        raw = self._run(self.month_tool, {**this_month, "incremental": False})
+        self.assertEqual((result["debit_total"], result["transaction_count"]), (raw["debit_total"], raw["transaction_count"]))
+
+    def test_category_summary_over_a_year(self) -> None:
+        year = self.today.year - 1
+        args = {"date_range": {"start": f"{year}-01-01", "end": f"{year}-12-31"}, "filters": {"accounts": ["card"]}}
+
+        raw = self._run(self.category_tool, args)
+        rolled = self._run(self.category_tool, {**args, "incremental": True})
+
+        self.assertEqual(rolled["transaction_count"], raw["transaction_count"])
+        self.assertEqual((rolled["total_debit"], rolled["total_credit"]), (raw["total_debit"], raw["total_credit"]))
+        self.assertEqual(
+            sorted(rolled["categories"], key=lambda c: c["category"]), sorted(raw["categories"], key=lambda c: c["category"])
+        )
+
+    def test_concurrent_refreshes_build_a_scope_once(self) -> None:
+        self.fetch_delay = 0.05
+        closed = (self.today.replace(day=1) - timedelta(days=200)).replace(day=1)
+        args = {"month_number": closed.month, "year": closed.year, "incremental": True}
+        results: list[dict] = []
+        threads = [threading.Thread(target=lambda: results.append(self._run(self.month_tool, args))) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(self.fetched_ranges), 1)
+        self.assertEqual(results[0], results[1])
+
+    def test_unsupported_filters_fall_back_to_raw_rows(self) -> None:
+        args = {"month_number": self.today.month, "year": self.today.year, "incremental": True, "min_amount": 12.0}
+        result = self._run(self.month_tool, args)
+
+        self.assertNotIn("rollup", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
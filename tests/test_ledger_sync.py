@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+from scripts.actual._session_pool import ActualSessionPool
+from domain.actual_schemas import ActualBudgetMonth
+from domain.models import Money, Transaction
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+from infrastructure.ledger_providers.provider import Provider
+from infrastructure.ledger_providers.range_cache import CachedProvider
+from infrastructure.ledger_sync import LedgerSyncWorker, read_sync_state
+
+
+class _Target:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.background: list[bool] = []
+        self.synced = threading.Event()
+        self.shared = False
+        self.invalidations = 0
+
+    def sync(self) -> dict:
+        self.calls += 1
+        self.synced.set()
+        return {"actual": f"v{self.calls}"}
+
+    def set_background_sync(self, enabled: bool) -> None:
+        self.background.append(enabled)
+
+    def reads_shared_data(self) -> bool:
+        return self.shared
+
+    def invalidate(self) -> None:
+        self.invalidations += 1
+
+
+class _VersionedProvider(Provider):
+    name = "versioned"
+
+    def __init__(self) -> None:
+        self.version = "v1"
+        self.fetches = 0
+
+    def fetch_budget_month(self, month: str) -> ActualBudgetMonth:
+        raise NotImplementedError
+
+    def fetch_transactions(self, _filter):
+        self.fetches += 1
+        return [Transaction("t1", date(2026, 1, 5), "Coffee", "Dining", Money(amount=Decimal("4.50")))]
+
+    def sync(self) -> str:
+        return self.version
+
+
+class LedgerSyncWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.state_path = Path(self._tmp.name) / "sync_state.json"
+        self.target = _Target()
+        self.worker = LedgerSyncWorker(self.target, interval_seconds=3600, state_path=self.state_path)
+
+    def tearDown(self) -> None:
+        self.worker.stop()
+        self._tmp.cleanup()
+
+    def test_sync_records_and_persists_version(self) -> None:
+        state = self.worker.sync_now()
+
+        self.assertEqual(state.data_version, "actual=v1")
+        self.assertEqual(state.sync_count, 1)
+        self.assertIsNotNone(state.last_synced_at)
+        self.assertEqual(read_sync_state(self.state_path).data_version, "actual=v1")
+
+    def test_inline_freshness_only_syncs_when_stale(self) -> None:
+        self.assertTrue(self.worker.ensure_fresh(60))
+        self.assertTrue(self.worker.ensure_fresh(60))
+        self.assertEqual(self.target.calls, 1)
+
+        self.assertTrue(self.worker.ensure_fresh(0))
+        self.assertEqual(self.target.calls, 2)
+
+    def test_running_worker_syncs_on_notify_and_serves_freshness(self) -> None:
+        self.worker.start()
+        self.assertTrue(self.target.synced.wait(5))
+        self.assertEqual(self.target.background, [True])
+
+        self.target.synced.clear()
+        self.worker.notify()
+        self.assertTrue(self.target.synced.wait(5))
+        self.assertTrue(self.worker.ensure_fresh(0, timeout_seconds=5))
+        self.assertGreaterEqual(self.target.calls, 3)
+
+        self.worker.stop()
+        self.assertEqual(self.target.background, [True, False])
+
+    def test_state_from_another_process_counts_for_shared_data(self) -> None:
+        LedgerSyncWorker(_Target(), state_path=self.state_path).sync_now()
+        self.target.shared = True
+
+        self.assertTrue(self.worker.ensure_fresh(60))
+        self.assertTrue(self.worker.ensure_fresh(60))
+        self.assertEqual((self.target.calls, self.target.invalidations), (0, 1))
+
+    def test_state_from_another_process_is_ignored_for_process_local_data(self) -> None:
+        LedgerSyncWorker(_Target(), state_path=self.state_path).sync_now()
+
+        self.assertTrue(self.worker.ensure_fresh(60))
+        self.assertEqual((self.target.calls, self.target.invalidations), (1, 0))
+
+    def test_failed_sync_keeps_previous_version(self) -> None:
+        self.worker.sync_now()
+        self.target.sync = lambda: (_ for _ in ()).throw(RuntimeError("offline"))
+
+        state = self.worker.sync_now()
+
+        self.assertEqual((state.data_version, state.last_error), ("actual=v1", "offline"))
+
+
+class ProviderSyncTests(unittest.TestCase):
+    def test_cached_provider_drops_ranges_when_version_changes(self) -> None:
+        inner = _VersionedProvider()
+        cache = CachedProvider(inner, ttl_seconds=3600)
+        query = TransactionQuery.model_validate({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+
+        cache.sync()
+        cache.fetch_transactions(query)
+        cache.sync()
+        cache.fetch_transactions(query)
+        inner.version = "v2"
+        cache.sync()
+        cache.fetch_transactions(query)
+
+        self.assertEqual(inner.fetches, 2)
+
+    def test_only_on_disk_actual_modes_read_shared_data(self) -> None:
+        shared = {
+            mode: CachedProvider(ActualLedgerProvider(use_session_pool=False, mode=mode)).reads_shared_data()
+            for mode in ("live", "bridge", "mirror", "sqlite")
+        }
+
+        self.assertEqual(shared, {"live": False, "bridge": False, "mirror": True, "sqlite": True})
+
+    def test_actual_provider_sync_opens_then_syncs_pool_without_inline_sync(self) -> None:
+        clients: list[SimpleNamespace] = []
+
+        @contextmanager
+        def opener():
+            client = SimpleNamespace(syncs=0)
+            client.sync = lambda: setattr(client, "syncs", client.syncs + 1)
+            clients.append(client)
+            yield client
+
+        pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=0, opener=opener)
+        provider = ActualLedgerProvider(session_pool=pool, resolve_names=False)
+        provider.set_background_sync(True)
+
+        first = provider.sync()
+        with pool.session():
+            pass
+        self.assertEqual(clients[0].syncs, 0)
+        provider.sync()
+
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(clients[0].syncs, 1)
+        self.assertIsNotNone(pool.last_synced_at)
+        self.assertTrue(first)
+
+
+if __name__ == "__main__":
+    unittest.main()
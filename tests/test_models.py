@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from domain.models import Money, Transaction
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider
+
+
+class MoneyTests(unittest.TestCase):
+    def test_amount_constructor_stores_minor_units(self) -> None:
+        money = Money(amount=Decimal("12.50"))
+        self.assertEqual(money.minor_units, 1250)
+        self.assertEqual(money.amount, Decimal("12.50"))
+        self.assertEqual(str(money.amount), "12.50")
+        self.assertEqual(money.currency, "USD")
+        self.assertEqual(Money(amount=0.1).minor_units, 10)
+        self.assertEqual(Money(amount="19.99", currency="EUR"), Money.from_minor(1999, "EUR"))
+        self.assertFalse(hasattr(money, "__dict__"))
+
+
+class TransactionTests(unittest.TestCase):
+    def test_metadata_callable_is_decoded_once_on_access(self) -> None:
+        calls: list[int] = []
+
+        def load() -> dict:
+            calls.append(1)
+            return {"notes": "hi"}
+
+        txn = Transaction("t1", date(2026, 1, 1), "Store", "Groceries", Money(amount=Decimal("1.00")), metadata=load)
+
+        self.assertFalse(txn.metadata_loaded)
+        self.assertEqual(txn.metadata, {"notes": "hi"})
+        self.assertEqual(txn.metadata["notes"], "hi")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(Transaction("t2", date(2026, 1, 1), "Store", "Groceries", Money()).metadata, {})
+
+    def test_actual_rows_defer_metadata_and_raw_synced_decoding(self) -> None:
+        provider = ActualLedgerProvider(use_session_pool=False)
+        raw_synced = json.dumps({"transactionAmount": {"amount": "-12.34", "currency": "EUR"}})
+        txn = provider._normalize_transaction_row(
+            {
+                "id": "t1",
+                "date": 20260110,
+                "amount": -1234,
+                "account": "acc-1",
+                "category": "cat-1",
+                "payee": "payee-1",
+                "imported_payee": "Cafe",
+                "raw_synced_data": raw_synced,
+            }
+        )
+
+        self.assertEqual(txn.value, Money.from_minor(1234, "EUR"))
+        self.assertEqual(txn.posted_on, date(2026, 1, 10))
+        self.assertFalse(txn.metadata_loaded)
+        self.assertEqual(txn.metadata["actual_payee_id"], "payee-1")
+        self.assertEqual(txn.metadata["raw_synced_data"]["transactionAmount"]["currency"], "EUR")
+        self.assertEqual(txn.metadata["subtransactions"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from infrastructure.persistence.ledger_rollup import LedgerRollup
+from tools.ledger.month_summary import MonthSummaryTool
+
+
+def _rows() -> list[dict]:
+    rows = []
+    day = date(2024, 12, 1)
+    while day <= date(2026, 2, 28):
+        offset = day.toordinal()
+        rows.append(
+            {
+                "id": f"t{offset}",
+                "posted_on": day.isoformat(),
+                "description": "Store",
+                "category": ("Food", "Fun", "Rent")[offset % 3],
+                "amount": 10.0 + day.month + 7 * (offset % 3),
+                "txn_type": "credit" if offset % 4 == 0 else "debit",
+            }
+        )
+        day += timedelta(days=2)
+    return rows
+
+
+class MonthSummaryBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tool = MonthSummaryTool(LedgerRollup(Path(self._tmp.name) / "rollup.sqlite"))
+        self.rows = _rows()
+        self.fetched_ranges: list[tuple[str, str]] = []
+
+        def iter_transactions(filters, include_metadata=True):
+            start, end = filters["date_range"]["start"], filters["date_range"]["end"]
+            self.fetched_ranges.append((start, end))
+            return iter([row for row in self.rows if start <= row["posted_on"] <= end])
+
+        patcher = patch("tools._transactions_support.get_transactions.iter_transactions", side_effect=iter_transactions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, args: dict):
+        request = SimpleNamespace(
+            request_id="req",
+            tool="ledgers.month_summary",
+            args=args,
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+        return self.tool.run(request)
+
+    def test_month_list_is_one_fetch_matching_single_month_calls(self) -> None:
+        batch = self._run({"months": [1, "2025-11", "2025-12"], "year": 2026}).result
+
+        self.assertEqual(self.fetched_ranges, [("2025-11-01", "2026-01-31")])
+        self.assertEqual([(m["year"], m["month_number"]) for m in batch["months"]], [(2025, 11), (2025, 12), (2026, 1)])
+        for record in batch["months"]:
+            single = self._run({"month_number": record["month_number"], "year": record["year"]}).result
+            single.pop("filters_used")
+            self.assertEqual(record, single)
+
+        first, second = batch["deltas"]
+        self.assertEqual((first["from"], first["to"]), ("2025-11", "2025-12"))
+        november, december = batch["months"][:2]
+        self.assertEqual(first["debit_change"], round(december["debit_total"] - november["debit_total"], 2))
+        self.assertEqual(batch["transaction_count"], sum(m["transaction_count"] for m in batch["months"]))
+
+    def test_year_range_covers_every_month(self) -> None:
+        result = self._run({"year_range": {"start": 2025, "end": 2025}}).result
+
+        self.assertEqual(result["month_count"], 12)
+        self.assertEqual(self.fetched_ranges, [("2025-01-01", "2025-12-31")])
+        self.assertEqual(len(result["deltas"]), 11)
+
+    def test_rollup_batch_matches_raw_batch(self) -> None:
+        args = {"year_range": 2025}
+        raw = self._run(args).result
+        rolled = self._run({**args, "incremental": True}).result
+
+        self.assertTrue(rolled["rollup"])
+        for raw_month, rolled_month in zip(raw["months"], rolled["months"]):
+            self.assertEqual(raw_month, rolled_month)
+        self.assertEqual(raw["deltas"], rolled["deltas"])
+
+    def test_invalid_months_are_rejected(self) -> None:
+        response = self._run({"months": [1, 13]})
+
+        self.assertFalse(response.ok)
+        self.assertIn("months", response.errors[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date, timedelta
+from decimal import Decimal
+
+from domain.actual_schemas import ActualBudgetMonth
+from domain.models import Money, Transaction
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.provider import Provider
+from infrastructure.ledger_providers.range_cache import CachedProvider
+
+
+class _DailyProvider(Provider):
+    """One transaction per day; records every requested interval."""
+
+    name = "daily"
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[date, date]] = []
+
+    def fetch_budget_month(self, month: str) -> ActualBudgetMonth:
+        raise NotImplementedError
+
+    def fetch_transactions(self, _filter):
+        start, end = _filter.date_range.start, _filter.date_range.end
+        self.calls.append((start, end))
+        days = (end - start).days + 1
+        return [
+            Transaction(
+                id=f"t{(start + timedelta(days=i)).isoformat()}",
+                posted_on=start + timedelta(days=i),
+                description="Coffee",
+                category="Dining",
+                value=Money(amount=Decimal("4.50")),
+            )
+            for i in range(days)
+        ]
+
+
+def _query(start: str, end: str) -> TransactionQuery:
+    return TransactionQuery.model_validate({"date_range": {"start": start, "end": end}})
+
+
+class CachedProviderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+        self.inner = _DailyProvider()
+        self.cache = CachedProvider(
+            self.inner,
+            ttl_seconds=300,
+            volatile_days=2,
+            volatile_ttl_seconds=60,
+            clock=lambda: self.now,
+            today=lambda: date(2026, 3, 31),
+        )
+
+    def test_sub_range_is_served_from_cache(self) -> None:
+        self.cache.fetch_transactions(_query("2026-01-01", "2026-03-01"))
+
+        rows = self.cache.fetch_transactions(_query("2026-02-01", "2026-02-10"))
+
+        self.assertEqual(len(self.inner.calls), 1)
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[0].posted_on, date(2026, 2, 1))
+
+    def test_only_missing_gaps_are_fetched_and_ranges_merge(self) -> None:
+        self.cache.fetch_transactions(_query("2026-01-10", "2026-01-20"))
+        self.cache.fetch_transactions(_query("2026-01-25", "2026-01-31"))
+
+        rows = self.cache.fetch_transactions(_query("2026-01-01", "2026-02-05"))
+
+        self.assertEqual(
+            self.inner.calls[2:],
+            [
+                (date(2026, 1, 1), date(2026, 1, 9)),
+                (date(2026, 1, 21), date(2026, 1, 24)),
+                (date(2026, 2, 1), date(2026, 2, 5)),
+            ],
+        )
+        self.assertEqual(self.cache.covered_ranges(), [(date(2026, 1, 1), date(2026, 2, 5))])
+        self.assertEqual(len(rows), 36)
+        self.assertEqual([r.posted_on for r in rows], sorted(r.posted_on for r in rows))
+
+    def test_ttl_expiry_refetches(self) -> None:
+        self.cache.fetch_transactions(_query("2026-01-01", "2026-01-31"))
+        self.now += 301
+
+        self.cache.fetch_transactions(_query("2026-01-01", "2026-01-31"))
+
+        self.assertEqual(len(self.inner.calls), 2)
+
+    def test_volatile_days_refresh_sooner_than_closed_days(self) -> None:
+        self.cache.fetch_transactions(_query("2026-03-01", "2026-03-31"))
+        self.now += 61
+
+        self.cache.fetch_transactions(_query("2026-03-01", "2026-03-31"))
+
+        self.assertEqual(self.inner.calls[1], (date(2026, 3, 30), date(2026, 3, 31)))
+
+    def test_explicit_invalidation_splits_coverage(self) -> None:
+        self.cache.fetch_transactions(_query("2026-01-01", "2026-01-31"))
+
+        self.cache.invalidate(date(2026, 1, 10), date(2026, 1, 12))
+        rows = self.cache.fetch_transactions(_query("2026-01-01", "2026-01-31"))
+
+        self.assertEqual(self.inner.calls[1], (date(2026, 1, 10), date(2026, 1, 12)))
+        self.assertEqual(len(rows), 31)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date, timedelta
+
+from domain.transaction_frame import TransactionFrame
+from tools.detect.recurring_charges import detect_recurring, normalize_merchant
+
+
+def _rows(description: str, first: date, step_days: int, count: int, amount: float, prefix: str) -> list[dict]:
+    return [
+        {
+            "id": f"{prefix}{i}",
+            "posted_on": (first + timedelta(days=step_days * i)).isoformat(),
+            "description": f"{description} #{1000 + i}",
+            "amount": amount,
+            "txn_type": "debit",
+        }
+        for i in range(count)
+    ]
+
+
+class RecurringDetectionTests(unittest.TestCase):
+    def test_detects_each_cadence_in_one_pass(self) -> None:
+        start = date(2023, 1, 2)
+        rows = (
+            _rows("Gym Weekly", start, 7, 20, 12.0, "w")
+            + _rows("Payroll Fee", start, 14, 10, 4.0, "b")
+            + _rows("Spotify", start, 30, 12, 9.99, "m")
+            + _rows("Water Utility", start, 91, 6, 80.0, "q")
+            + _rows("Domain Renewal", start, 365, 3, 20.0, "a")
+            + _rows("Coffee Shop", start, 3, 40, 5.0, "c")
+        )
+        rows.append({"id": "credit", "posted_on": "2023-02-01", "description": "Spotify", "amount": 9.99, "txn_type": "credit"})
+
+        detected = {item["merchant"]: item for item in detect_recurring(TransactionFrame.from_rows(rows))}
+
+        self.assertEqual(
+            {name: item["cadence"] for name, item in detected.items()},
+            {
+                "gym weekly": "weekly",
+                "payroll fee": "biweekly",
+                "spotify": "monthly",
+                "water utility": "quarterly",
+                "domain renewal": "annual",
+            },
+        )
+        annual = detected["domain renewal"]
+        self.assertEqual((annual["count"], annual["last_seen"], annual["next_expected_on"]), (3, "2025-01-01", "2026-01-01"))
+        self.assertEqual(detected["spotify"]["examples"], ["Spotify #1010", "Spotify #1011"])
+
+    def test_unstable_amounts_are_not_recurring(self) -> None:
+        rows = _rows("Electric", date(2025, 1, 5), 30, 6, 50.0, "e")
+        rows[2]["amount"] = 140.0
+
+        self.assertEqual(detect_recurring(TransactionFrame.from_rows(rows)), [])
+
+    def test_normalizer_is_memoized(self) -> None:
+        normalize_merchant.cache_clear()
+        self.assertEqual(normalize_merchant("NETFLIX.COM 1234"), "netflix com")
+        normalize_merchant("NETFLIX.COM 1234")
+
+        self.assertEqual(normalize_merchant.cache_info().hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
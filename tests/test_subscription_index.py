@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from domain.subscriptions import SubscriptionEntry
+from infrastructure.ledger_sync import SyncState
+from infrastructure.persistence.subscription_index import SubscriptionIndex
+from tools.detect.recurring_charges import RecurringChargesTool
+
+
+def _row(txn_id: str, posted_on: date, description: str, amount: float) -> dict:
+    return {
+        "id": txn_id,
+        "posted_on": posted_on.isoformat(),
+        "description": description,
+        "amount": amount,
+        "txn_type": "debit",
+    }
+
+
+class SubscriptionEntryTests(unittest.TestCase):
+    def test_round_trip_and_alerts(self) -> None:
+        first = date(2025, 1, 10).toordinal()
+        entry = SubscriptionEntry(merchant="streamco")
+        entry.add_charges([first + 30 * i for i in range(4)], [1599] * 4, ["StreamCo #1"] * 4)
+        entry.add_charges([first + 120], [1899], ["StreamCo #2"])
+        restored = SubscriptionEntry.from_dict(entry.to_dict())
+
+        summary = restored.summary(date.fromordinal(first + 160))
+        self.assertEqual((summary["cadence"], summary["count"], summary["next_expected_on"]), ("monthly", 5, "2025-06-09"))
+        self.assertEqual(summary["amount_band"], {"min": 15.99, "max": 18.99})
+        self.assertEqual(
+            summary["alerts"],
+            [
+                {"type": "missed", "days_overdue": 10},
+                {"type": "amount_changed", "previous_amount": 15.99, "latest_amount": 18.99},
+            ],
+        )
+
+
+class IncrementalSubscriptionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tool = RecurringChargesTool(SubscriptionIndex(Path(self._tmp.name) / "subscriptions.sqlite"))
+        self.today = date.today()
+        self.rows = [_row(f"s{i}", self.today - timedelta(days=90 - 30 * i), f"StreamCo {100 + i}", 15.99) for i in range(3)]
+        self.rows.append(_row("one-off", self.today - timedelta(days=10), "Hardware Store", 80.0))
+        self.fetched_ranges: list[tuple[str, str]] = []
+        self.fetch_delay = 0.0
+
+        def iter_transactions(filters, include_metadata=True):
+            start, end = filters["date_range"]["start"], filters["date_range"]["end"]
+            self.fetched_ranges.append((start, end))
+            time.sleep(self.fetch_delay)
+            return iter([row for row in self.rows if start <= row["posted_on"] <= end])
+
+        patcher = patch("tools._transactions_support.get_transactions.iter_transactions", side_effect=iter_transactions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        version = patch("tools._incremental_support.read_sync_state", side_effect=lambda: self.sync_state)
+        version.start()
+        self.addCleanup(version.stop)
+        self.sync_state = SyncState(data_version="actual=v1")
+
+    def _run(self, **args) -> dict:
+        request = SimpleNamespace(
+            request_id="req",
+            tool="detect.recurring_charges",
+            args={"incremental": True, **args},
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+        response = self.tool.run(request)
+        self.assertTrue(response.ok)
+        return response.result
+
+    def test_index_is_built_once_then_updated_from_new_rows(self) -> None:
+        first = self._run()
+        self.assertEqual([item["merchant"] for item in first["detected"]], ["streamco"])
+        self.assertEqual(first["index"]["merchants"], 2)
+
+        self._run()
+        self.assertEqual(len(self.fetched_ranges), 1)
+
+        self.rows.append(_row("s3", self.today, "StreamCo 103", 17.99))
+        self.sync_state = SyncState(data_version="actual=v2")
+        second = self._run(flag_changes=True)
+
+        self.assertEqual(self.fetched_ranges[-1], (self.today.isoformat(), self.today.isoformat()))
+        self.assertEqual((second["transaction_count"], second["new_debits"]), (1, 1))
+        streamco = second["detected"][0]
+        self.assertEqual((streamco["count"], streamco["last_seen"]), (4, self.today.isoformat()))
+        self.assertEqual([alert["type"] for alert in streamco["alerts"]], ["amount_changed"])
+
+        # A refetch of the watermark day does not double count.
+        self.sync_state = SyncState(data_version="actual=v3")
+        self.assertEqual(self._run()["detected"][0]["count"], 4)
+
+    def test_concurrent_runs_fold_charges_once(self) -> None:
+        self.fetch_delay = 0.05
+        alias = RecurringChargesTool(SubscriptionIndex(Path(self._tmp.name) / "subscriptions.sqlite"))
+        results: list[dict] = []
+
+        def run(tool: RecurringChargesTool) -> None:
+            request = SimpleNamespace(
+                request_id="req",
+                tool=tool.name,
+                args={"incremental": True},
+                filters=None,
+                context=ToolContext(user_id="u", ledger_id="ldg_main"),
+            )
+            results.append(tool.run(request).result)
+
+        threads = [threading.Thread(target=run, args=(tool,)) for tool in (self.tool, alias)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(self.fetched_ranges), 1)
+        self.assertEqual([r["detected"][0]["count"] for r in results], [3, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+import tools  # noqa: F401
+from application.tool_executor import ToolExecutor
+from domain.actual_schemas import ActualBudgetMonth
+from domain.models import Money, Transaction, TransactionType
+from domain.schemas import LedgerMindPlan, PlanCall, PlanOutputTarget, UserRequest
+from infrastructure.get_transactions import GetTransactions
+from infrastructure.ledger_providers.provider import Provider
+from tools.registry import registry
+
+
+class _CountingProvider(Provider):
+    name = "counting"
+
+    def __init__(self, transactions: list[Transaction]) -> None:
+        self._transactions = transactions
+        self.calls: list[tuple[date, date]] = []
+        self.queries: list = []
+
+    def fetch_budget_month(self, month: str) -> ActualBudgetMonth:
+        raise NotImplementedError
+
+    def fetch_transactions(self, _filter):
+        self.calls.append((_filter.date_range.start, _filter.date_range.end))
+        self.queries.append(_filter)
+        return [
+            txn
+            for txn in self._transactions
+            if _filter.date_range.start <= txn.posted_on <= _filter.date_range.end
+            and (not _filter.accounts or txn.account_id in _filter.accounts)
+        ]
+
+
+class _AccountPushdownProvider(_CountingProvider):
+    supported_filters = frozenset({"date_range", "accounts"})
+
+
+def _txn(txn_id: str, posted_on: date, amount: str, category: str = "Groceries", credit: bool = False) -> Transaction:
+    return Transaction(
+        id=txn_id,
+        posted_on=posted_on,
+        description=f"Store {txn_id}",
+        category=category,
+        value=Money(amount=Decimal(amount)),
+        txn_type=TransactionType.CREDIT if credit else TransactionType.DEBIT,
+        account_id="checking",
+    )
+
+
+def _plan(*calls: tuple[str, dict]) -> LedgerMindPlan:
+    return LedgerMindPlan(
+        objective="test",
+        calls=[PlanCall(id=f"s{i}", tool=tool, args=args, purpose="test") for i, (tool, args) in enumerate(calls, 1)],
+        output=PlanOutputTarget(response_schema="ledgermind.answer.v1"),
+    )
+
+
+class ToolExecutorPrefetchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = _CountingProvider(
+            [
+                _txn("t1", date(2026, 1, 5), "40.00"),
+                _txn("t2", date(2026, 2, 5), "45.00"),
+                _txn("t3", date(2026, 3, 5), "42.00"),
+                _txn("t4", date(2026, 3, 20), "250.00"),
+                _txn("t5", date(2026, 3, 28), "2500.00", category="Income", credit=True),
+            ]
+        )
+        self.executor = ToolExecutor(registry, transactions=GetTransactions(providers=[self.provider]))
+        self.user_request = UserRequest(request_id="req_exec", user_id="u_test", message="How am I doing?")
+
+    def test_multi_tool_plan_fetches_provider_once(self) -> None:
+        plan = _plan(
+            ("ledgers.category_summary", {"date_range": {"start": "2026-03-01", "end": "2026-03-31"}}),
+            ("detect.anomalies", {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}}),
+            ("forecast.cashflow_30d", {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}}),
+            ("ledgers.month_summary", {"month_number": 2, "year": 2026}),
+        )
+
+        responses = self.executor.run_calls(plan, self.user_request)
+
+        self.assertTrue(all(r.ok for r in responses))
+        self.assertEqual(self.provider.calls, [(date(2026, 1, 1), date(2026, 3, 31))])
+        self.assertEqual(responses[0].result["transaction_count"], 3)
+        self.assertEqual(responses[3].result["transaction_count"], 1)
+        self.assertTrue(any(a["transaction_id"] == "t4" for a in responses[1].result["anomalies"]))
+
+    def test_disjoint_ranges_fetch_each_interval(self) -> None:
+        plan = _plan(
+            ("ledgers.month_summary", {"month_number": 1, "year": 2026}),
+            ("ledgers.month_summary", {"month_number": 3, "year": 2026}),
+        )
+
+        self.executor.run_calls(plan, self.user_request)
+
+        self.assertEqual(
+            self.provider.calls,
+            [(date(2026, 1, 1), date(2026, 1, 31)), (date(2026, 3, 1), date(2026, 3, 31))],
+        )
+
+    def test_non_transaction_calls_do_not_widen_prefetch(self) -> None:
+        plan = _plan(
+            ("ledgers.category_summary", {"date_range": {"start": "2026-03-01", "end": "2026-03-31"}}),
+            ("policy.check_recommendation", {"recommendation": "Keep an emergency fund."}),
+        )
+
+        responses = self.executor.run_calls(plan, self.user_request)
+
+        self.assertTrue(all(r.ok for r in responses))
+        self.assertEqual(self.provider.calls, [(date(2026, 3, 1), date(2026, 3, 31))])
+
+    def test_compare_periods_never_fetches_the_gap_between_periods(self) -> None:
+        plan = _plan(
+            (
+                "ledgers.compare_periods",
+                {
+                    "previous": {"start": "2026-01-01", "end": "2026-01-31"},
+                    "current": {"start": "2026-03-01", "end": "2026-03-31"},
+                },
+            ),
+            ("ledgers.month_summary", {"month_number": 3, "year": 2026}),
+        )
+
+        responses = self.executor.run_calls(plan, self.user_request)
+
+        self.assertTrue(all(r.ok for r in responses))
+        self.assertEqual(responses[0].result["periods"]["previous"]["transaction_count"], 1)
+        self.assertEqual(responses[0].result["periods"]["current"]["transaction_count"], 3)
+        self.assertTrue(self.provider.calls)
+        for start, end in self.provider.calls:
+            self.assertFalse(start <= date(2026, 2, 5) <= end)
+
+
+class ToolExecutorPushdownTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = _AccountPushdownProvider(
+            [
+                _txn("t1", date(2026, 3, 5), "42.00"),
+                _txn("t2", date(2026, 3, 20), "250.00"),
+            ]
+        )
+        self.executor = ToolExecutor(registry, transactions=GetTransactions(providers=[self.provider]))
+        self.user_request = UserRequest(request_id="req_exec", user_id="u_test", message="How am I doing?")
+
+    def test_single_call_plan_reaches_provider_with_pushed_down_filters(self) -> None:
+        plan = _plan(
+            (
+                "ledgers.category_summary",
+                {"date_range": {"start": "2026-03-01", "end": "2026-03-31"}, "accounts": ["checking"]},
+            ),
+        )
+
+        responses = self.executor.run_calls(plan, self.user_request)
+
+        self.assertTrue(responses[0].ok)
+        self.assertEqual(responses[0].result["transaction_count"], 2)
+        self.assertEqual(len(self.provider.queries), 1)
+        self.assertEqual(self.provider.queries[0].accounts, ["checking"])
+
+    def test_overlapping_call_with_pushdown_filters_is_not_prefetched(self) -> None:
+        plan = _plan(
+            ("ledgers.category_summary", {"date_range": {"start": "2026-03-01", "end": "2026-03-31"}}),
+            (
+                "ledgers.category_summary",
+                {"date_range": {"start": "2026-03-01", "end": "2026-03-31"}, "accounts": ["savings"]},
+            ),
+        )
+
+        responses = self.executor.run_calls(plan, self.user_request)
+
+        self.assertEqual([r.result["transaction_count"] for r in responses], [2, 0])
+        self.assertEqual([query.accounts for query in self.provider.queries], [[], ["savings"]])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
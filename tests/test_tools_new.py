@@ -162,9 +162,9 @@ class TransactionBackedToolsTests(unittest.TestCase):
             },
         ]
 
-    @patch("tools._transactions_support.get_transactions.get_transactions")
-    def test_ledgers_category_summary(self, mock_get_transactions) -> None:
-        mock_get_transactions.return_value = self.rows
+    @patch("tools._transactions_support.get_transactions.iter_transactions")
+    def test_ledgers_category_summary(self, mock_iter_transactions) -> None:
+        mock_iter_transactions.return_value = iter(self.rows)
         tool = registry.get_tool("ledgers.category_summary")
         req = _request(
             "ledgers.category_summary",
@@ -179,9 +179,9 @@ class TransactionBackedToolsTests(unittest.TestCase):
         self.assertIn("filters_used", res.result)
         self.assertAlmostEqual(res.result["total_credit"], 2500.00, places=2)
 
-    @patch("tools._transactions_support.get_transactions.get_transactions")
-    def test_ledgers_month_summary_uses_month_number_arg(self, mock_get_transactions) -> None:
-        mock_get_transactions.return_value = self.rows
+    @patch("tools._transactions_support.get_transactions.iter_transactions")
+    def test_ledgers_month_summary_uses_month_number_arg(self, mock_iter_transactions) -> None:
+        mock_iter_transactions.return_value = iter(self.rows)
         tool = registry.get_tool("ledgers.month_summary")
         req = _request("ledgers.month_summary", {"month_number": 3, "year": 2026, "currency": "USD"})
 
@@ -194,9 +194,9 @@ class TransactionBackedToolsTests(unittest.TestCase):
         self.assertEqual(res.result["filters_used"]["date_range"]["end"], "2026-03-31")
         self.assertIn("top_debit_categories", res.result)
 
-    @patch("tools._transactions_support.get_transactions.get_transactions")
-    def test_detect_recurring_charges_finds_netflix_pattern(self, mock_get_transactions) -> None:
-        mock_get_transactions.return_value = self.rows
+    @patch("tools._transactions_support.get_transactions.iter_transactions")
+    def test_detect_recurring_charges_finds_netflix_pattern(self, mock_iter_transactions) -> None:
+        mock_iter_transactions.return_value = iter(self.rows)
         tool = registry.get_tool("detect.recurring_charges")
         req = _request("detect.recurring_charges", {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}})
 
@@ -206,9 +206,9 @@ class TransactionBackedToolsTests(unittest.TestCase):
         detected = res.result["detected"]
         self.assertTrue(any("netflix" in item["merchant"] for item in detected))
 
-    @patch("tools._transactions_support.get_transactions.get_transactions")
-    def test_detect_anomalies_flags_large_grocery_spend(self, mock_get_transactions) -> None:
-        mock_get_transactions.return_value = self.rows
+    @patch("tools._transactions_support.get_transactions.iter_transactions")
+    def test_detect_anomalies_flags_large_grocery_spend(self, mock_iter_transactions) -> None:
+        mock_iter_transactions.return_value = iter(self.rows)
         tool = registry.get_tool("detect.anomalies")
         req = _request("detect.anomalies", {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}})
 
@@ -218,9 +218,9 @@ class TransactionBackedToolsTests(unittest.TestCase):
         anomalies = res.result["anomalies"]
         self.assertTrue(any(a["transaction_id"] == "t7" for a in anomalies))
 
-    @patch("tools._transactions_support.get_transactions.get_transactions")
-    def test_forecast_cashflow_30d_returns_projection(self, mock_get_transactions) -> None:
-        mock_get_transactions.return_value = self.rows
+    @patch("tools._transactions_support.get_transactions.iter_transactions")
+    def test_forecast_cashflow_30d_returns_projection(self, mock_iter_transactions) -> None:
+        mock_iter_transactions.return_value = iter(self.rows)
         tool = registry.get_tool("forecast.cashflow_30d")
         req = _request("forecast.cashflow_30d", {"date_range": {"start": "2026-01-01", "end": "2026-03-31"}})
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from domain.models import Money, Transaction, TransactionType
+from infrastructure.transaction_filters import compile_transaction_filters
+
+
+def _txn(id: str, posted_on: date, amount: str, category: str = "Groceries", desc: str = "Store",
+         txn_type: TransactionType = TransactionType.DEBIT, account_id: str = "checking",
+         currency: str = "USD") -> Transaction:
+    return Transaction(
+        id=id,
+        posted_on=posted_on,
+        description=desc,
+        category=category,
+        value=Money(amount=Decimal(amount), currency=currency),
+        txn_type=txn_type,
+        account_id=account_id,
+    )
+
+
+class TransactionPredicateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.txns = [
+            _txn("t1", date(2026, 1, 1), "10.00"),
+            _txn("t2", date(2026, 1, 15), "42.10", category="Dining", desc="Cafe Luna", account_id="card"),
+            _txn("t3", date(2026, 1, 31), "2500.00", category="Income", desc="Payroll", txn_type=TransactionType.CREDIT),
+            _txn("t4", date(2026, 2, 1), "5.00", currency="EUR"),
+        ]
+
+    def _ids(self, **args) -> list[str]:
+        predicate = compile_transaction_filters(args)
+        filtered = [t.id for t in predicate.filter(self.txns)]
+        self.assertEqual(filtered, [t.id for t in self.txns if predicate(t)])
+        return filtered
+
+    def test_no_active_filters_keeps_everything(self) -> None:
+        predicate = compile_transaction_filters({"accounts": None, "categories": [], "query": "  "})
+        self.assertTrue(predicate.is_trivial)
+        self.assertEqual(len(predicate.filter(self.txns)), 4)
+
+    def test_date_range_is_inclusive(self) -> None:
+        self.assertEqual(self._ids(date_range={"start": "2026-01-01", "end": "2026-01-31"}), ["t1", "t2", "t3"])
+        self.assertEqual(self._ids(date_range={"start": date(2026, 1, 31), "end": None}), ["t3", "t4"])
+
+    def test_direction_and_amount_bounds(self) -> None:
+        self.assertEqual(self._ids(positive=True), ["t1", "t2", "t4"])
+        self.assertEqual(self._ids(positive=False), ["t3"])
+        self.assertEqual(self._ids(txn_type="debit", min_amount=10, max_amount=42.1), ["t1", "t2"])
+
+    def test_sets_currency_and_text(self) -> None:
+        self.assertEqual(self._ids(accounts=["card"]), ["t2"])
+        self.assertEqual(self._ids(categories=["GROCERIES"]), ["t1", "t4"])
+        self.assertEqual(self._ids(currency="EUR"), ["t4"])
+        self.assertEqual(self._ids(query=" luna "), ["t2"])
+        self.assertEqual(self._ids(query="income"), ["t3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date
+
+import numpy as np
+
+from domain.transaction_frame import TransactionFrame, group_count, group_sum
+
+
+class TransactionFrameTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.frame = TransactionFrame.from_rows(
+            iter(
+                [
+                    {"id": "t1", "posted_on": "2026-03-01", "description": "Whole Foods", "category": "Groceries",
+                     "amount": 42.1, "currency": "USD", "txn_type": "debit", "account_id": "checking"},
+                    {"id": "t2", "posted_on": "2026-03-02", "description": "Payroll", "category": "Income",
+                     "amount": 2500.0, "currency": "USD", "txn_type": "credit", "account_id": "checking"},
+                    {"id": "t3", "posted_on": "2026-03-01", "description": "Whole Foods", "category": None,
+                     "amount": 0.29, "currency": "USD", "txn_type": "debit", "account_id": None},
+                    {"id": "t4", "posted_on": "2026-03-05", "description": "Cafe", "category": "Groceries",
+                     "amount": 10.0, "currency": "EUR", "txn_type": "debit", "account_id": "card"},
+                ]
+            )
+        )
+
+    def test_columns_are_typed_and_dictionary_encoded(self) -> None:
+        frame = self.frame
+        self.assertEqual(len(frame), 4)
+        self.assertEqual(frame.amount_cents.dtype, np.int64)
+        self.assertEqual(frame.day.dtype, np.int32)
+        self.assertEqual(frame.amount_cents.tolist(), [4210, 250000, 29, 1000])
+        self.assertEqual(frame.is_credit.tolist(), [False, True, False, False])
+        self.assertEqual(frame.category_names, ["Groceries", "Income", "uncategorized"])
+        self.assertEqual(frame.category_codes.tolist(), [0, 1, 2, 0])
+        self.assertEqual(frame.account_names, ["checking", "", "card"])
+        self.assertEqual(frame.merchant_codes.tolist(), [0, 1, 0, 2])
+        self.assertEqual(frame.currency_names, ["USD", "EUR"])
+        self.assertEqual(frame.posted_on(2), date(2026, 3, 1))
+        self.assertEqual(frame.signed_cents.tolist(), [-4210, 250000, -29, -1000])
+
+    def test_select_and_group_helpers(self) -> None:
+        debits = self.frame.select(~self.frame.is_credit)
+        size = len(debits.category_names)
+        self.assertEqual(debits.ids.tolist(), ["t1", "t3", "t4"])
+        self.assertEqual(group_count(debits.category_codes, size).tolist(), [2, 0, 1])
+        self.assertEqual(group_sum(debits.category_codes, debits.amount_cents, size).tolist(), [5210, 0, 29])
+
+    def test_empty_frame(self) -> None:
+        frame = TransactionFrame.from_rows([])
+        self.assertEqual(len(frame), 0)
+        self.assertEqual(group_sum(frame.category_codes, frame.amount_cents, 0).tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
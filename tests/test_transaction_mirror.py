@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts.actual._session_pool import ActualSessionPool
+from domain.schemas import TransactionQuery
+from infrastructure.ledger_providers.actual_provider import ActualLedgerProvider, _ActualRowMetadata
+from infrastructure.persistence.transaction_mirror import TransactionMirror
+
+
+def _row(txn_id: str, day: str, amount: int, **extra) -> dict:
+    row = {"id": txn_id, "date": day, "amount": amount, "imported_payee": f"Payee {txn_id}", "category": "cat-1"}
+    row.update(extra)
+    return row
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.pending: list[str] = []
+
+    def sync(self):
+        changes = [SimpleNamespace(table=SimpleNamespace(__tablename__="transactions"), id=i) for i in self.pending]
+        self.pending = []
+        return changes
+
+
+class TransactionMirrorProviderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.client = _FakeClient()
+
+        @contextmanager
+        def opener():
+            yield self.client
+
+        self.pool = ActualSessionPool(max_sessions=1, sync_interval_seconds=0, opener=opener)
+        self.mirror = TransactionMirror(
+            Path(self._tmp.name) / "mirror.sqlite", metadata_loader=_ActualRowMetadata.from_record
+        )
+        self.provider = ActualLedgerProvider(session_pool=self.pool, mode="mirror", mirror=self.mirror)
+        self.budget = {
+            "t1": _row("t1", "20260105", -1250),
+            "t2": _row("t2", "20260110", -4000),
+            "t3": _row("t3", "20260115", 250000),
+        }
+        self.full_loads = 0
+        self.id_loads: list[list[str]] = []
+
+        def fetch_all(actual=None):
+            self.full_loads += 1
+            return list(self.budget.values())
+
+        def fetch_by_ids(ids, actual=None):
+            self.id_loads.append(list(ids))
+            return [self.budget[i] for i in ids if i in self.budget]
+
+        patcher = patch.object(self.provider, "_import_mirror_bridge", return_value=(fetch_all, fetch_by_ids))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.query = TransactionQuery.model_validate({"date_range": {"start": "2026-01-01", "end": "2026-01-31"}})
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_first_read_loads_everything_then_reads_locally(self) -> None:
+        txns = self.provider.fetch_transactions(self.query)
+        again = self.provider.fetch_transactions(self.query)
+
+        self.assertEqual([t.id for t in txns], ["t1", "t2", "t3"])
+        self.assertEqual([t.id for t in again], ["t1", "t2", "t3"])
+        self.assertEqual(self.full_loads, 1)
+        self.assertEqual(self.id_loads, [])
+
+    def test_incremental_sync_pulls_only_changed_rows_and_records_tombstones(self) -> None:
+        self.provider.fetch_transactions(self.query)
+
+        self.budget["t1"] = _row("t1", "20260105", -1999)
+        self.budget["t2"] = _row("t2", "20260110", -4000, tombstone=1)
+        self.budget["t4"] = _row("t4", "20260120", -500)
+        self.client.pending = ["t1", "t2", "t4"]
+        self.provider.sync_mirror(force=True)
+        txns = {t.id: t for t in self.provider.fetch_transactions(self.query)}
+
+        self.assertEqual(self.full_loads, 1)
+        self.assertEqual(self.id_loads, [["t1", "t2", "t4"]])
+        self.assertEqual(set(txns), {"t1", "t3", "t4"})
+        self.assertEqual(str(txns["t1"].value.amount), "19.99")
+        self.assertEqual(self.mirror.count(include_deleted=True), 4)
+
+    def test_read_is_limited_to_requested_dates(self) -> None:
+        query = TransactionQuery.model_validate({"date_range": {"start": "2026-01-06", "end": "2026-01-12"}})
+
+        txns = self.provider.fetch_transactions(query)
+
+        self.assertEqual([t.id for t in txns], ["t2"])
+
+    def test_sync_stores_raw_metadata_and_decodes_it_on_first_access(self) -> None:
+        self.budget["t1"] = _row("t1", "20260105", -1250, notes="lunch", raw_synced_data='{"bookingDate": "2026-01-05"}')
+
+        with patch.object(_ActualRowMetadata, "__call__", autospec=True, side_effect=AssertionError("decoded on sync")):
+            self.provider.sync_mirror(force=True)
+        txn = next(t for t in self.provider.fetch_transactions(self.query) if t.id == "t1")
+
+        self.assertFalse(txn.metadata_loaded)
+        self.assertEqual(txn.metadata["notes"], "lunch")
+        self.assertEqual(txn.metadata["raw_synced_data"], {"bookingDate": "2026-01-05"})
+        self.assertEqual(txn.metadata["source_transaction_id"], "t1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+import tools  # noqa: F401
+from domain.schemas import ToolContext
+from tools.ledger.trend import period_codes, period_start
+from tools.registry import registry
+
+
+def _row(txn_id: str, posted_on: str, category: str, amount: float, description: str = "Store", txn_type: str = "debit") -> dict:
+    return {
+        "id": txn_id,
+        "posted_on": posted_on,
+        "description": description,
+        "category": category,
+        "amount": amount,
+        "txn_type": txn_type,
+    }
+
+
+class PeriodCodeTests(unittest.TestCase):
+    def test_codes_round_trip_to_period_starts(self) -> None:
+        days = np.array([date(2026, 3, 31).toordinal(), date(2026, 4, 1).toordinal()], dtype=np.int32)
+        for period, starts in (
+            ("week", [date(2026, 3, 30), date(2026, 3, 30)]),
+            ("month", [date(2026, 3, 1), date(2026, 4, 1)]),
+            ("quarter", [date(2026, 1, 1), date(2026, 4, 1)]),
+        ):
+            self.assertEqual([period_start(int(code), period) for code in period_codes(days, period)], starts, period)
+
+
+class TrendToolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = [
+            _row("g1", "2026-01-05", "Groceries", 100.0),
+            _row("g2", "2026-02-05", "Groceries", 150.0),
+            _row("g3", "2026-03-05", "Groceries", 200.0),
+            _row("d1", "2026-01-09", "Dining", 80.0),
+            _row("d3", "2026-03-09", "Dining", 40.0),
+            _row("p1", "2026-02-01", "Income", 3000.0, txn_type="credit"),
+            _row("old", "2025-12-31", "Groceries", 999.0),
+            _row("n1", "2026-01-10", "Shopping", 20.0, description="NETFLIX.COM 1111"),
+            _row("n2", "2026-02-10", "Shopping", 20.0, description="NETFLIX.COM 2222"),
+        ]
+        self.fetched: list[dict] = []
+
+        def iter_transactions(filters, include_metadata=True):
+            self.fetched.append(filters)
+            start, end = filters["date_range"]["start"], filters["date_range"]["end"]
+            return iter([row for row in self.rows if start <= row["posted_on"] <= end])
+
+        patcher = patch("tools._transactions_support.get_transactions.iter_transactions", side_effect=iter_transactions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, args: dict):
+        request = SimpleNamespace(
+            request_id="req",
+            tool="ledgers.trend",
+            args=args,
+            filters=None,
+            context=ToolContext(user_id="u", ledger_id="ldg_main"),
+        )
+        return registry.get_tool("ledgers.trend").run(request)
+
+    def test_monthly_category_matrix_with_slopes_and_growth(self) -> None:
+        result = self._run({"periods": 3, "end": "2026-03-15"}).result
+
+        self.assertEqual(len(self.fetched), 1)
+        self.assertEqual(self.fetched[0]["date_range"], {"start": "2026-01-01", "end": "2026-03-31"})
+        self.assertEqual([p["start"] for p in result["periods"]], ["2026-01-01", "2026-02-01", "2026-03-01"])
+        series = {item["key"]: item for item in result["series"]}
+        self.assertEqual(list(series), ["Groceries", "Dining", "Shopping"])
+        groceries = series["Groceries"]
+        self.assertEqual(groceries["values"], [100.0, 150.0, 200.0])
+        self.assertEqual((groceries["slope_per_period"], groceries["growth_pct"], groceries["last_change_pct"]), (50.0, 100.0, 33.3))
+        self.assertEqual(series["Dining"]["values"], [80.0, 0.0, 40.0])
+        self.assertEqual(result["period_totals"], [200.0, 170.0, 240.0])
+
+    def test_merchant_dimension_groups_normalized_descriptions(self) -> None:
+        result = self._run({"periods": 2, "end": "2026-02-28", "dimension": "merchant", "metric": "net"}).result
+
+        series = {item["key"]: item["values"] for item in result["series"]}
+        self.assertEqual(series["netflix com"], [-20.0, -20.0])
+        self.assertEqual(series["store"], [-180.0, 2850.0])
+
+    def test_invalid_arguments_are_reported_together(self) -> None:
+        response = self._run({"period": "day", "dimension": "payee", "periods": 0})
+
+        self.assertFalse(response.ok)
+        self.assertEqual(len(response.errors), 3)
+        self.assertEqual(self.fetched, [])
+
+
+if __name__ == "__main__":
+    unittest.main()